@@ -1,27 +1,93 @@
+import time
+_STARTUP_STARTED = time.perf_counter()
 import re
 import sys
 import os
+import importlib
 import configparser
 import subprocess
 import datetime
-import zipfile
-import tarfile
 import zlib
 import shutil
 import tempfile
-from threading import Thread
+import json
+import mmap
+import struct
+import signal
+import select
+import base64
+import bisect
+import hashlib
+from collections import OrderedDict, deque
+from threading import Thread, Lock, local, Event, Timer
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QToolBar, QToolButton,
     QLineEdit, QVBoxLayout, QHBoxLayout, QWidget,
     QLabel, QSizePolicy, QMenu, QMessageBox,
-    QTableWidget, QTableWidgetItem, QHeaderView,
+    QTableView, QAbstractItemView, QHeaderView,
     QDialog, QPushButton, QTabWidget,
     QGroupBox, QFormLayout, QComboBox, QCheckBox, QSpinBox,
-    QFileDialog, QAction, QProgressDialog, QInputDialog, QPlainTextEdit
+    QFileDialog, QAction, QInputDialog, QPlainTextEdit, QDockWidget
 )
 from PyQt5.QtGui import QIcon, QCursor, QTextCursor, QFont, QColor
-from PyQt5.QtCore import Qt, QSize, QObject, pyqtSignal, pyqtSlot, QProcess, QSettings
+from PyQt5.QtCore import (
+    Qt, QSize, QObject, pyqtSignal, pyqtSlot, QProcess, QSettings, QTimer,
+    QAbstractTableModel, QModelIndex, QThread, QThreadPool, QRunnable, QFileSystemWatcher
+)
+
+class LazyModule:
+    """İlk öznitelik erişiminde içe aktarılan modül vekili.
+
+    Arşiv modülleri açılışta değil, ilk arşiv işleminde yüklenir.
+    """
+
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = importlib.import_module(self._name)
+            self.__dict__['_module'] = module
+        return getattr(module, attr)
+
+zipfile = LazyModule('zipfile')
+tarfile = LazyModule('tarfile')
+gzip = LazyModule('gzip')
+bz2 = LazyModule('bz2')
+lzma = LazyModule('lzma')
+futures = LazyModule('concurrent.futures')
+argparse = LazyModule('argparse')
+
+class StartupProfile:
+    """--startup-profile ile açılış aşamalarının sürelerini ölçüp yazdırır"""
+
+    def __init__(self, started):
+        self.enabled = '--startup-profile' in sys.argv
+        self.started = started
+        self.last = started
+        self.phases = []
+        self.reported = False
+
+    def mark(self, phase):
+        if not self.enabled or self.reported:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def report(self):
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        for phase, seconds in self.phases:
+            print(f"[startup] {phase:<20} {seconds * 1000:8.1f} ms", file=sys.stderr)
+        print(f"[startup] {'total':<20} {(self.last - self.started) * 1000:8.1f} ms", file=sys.stderr)
+
+startup_profile = StartupProfile(_STARTUP_STARTED)
+startup_profile.mark('imports')
 
 # Resimlerin ve dil dosyasının yolları
 BASE_DIR = os.path.dirname(__file__)
@@ -43,108 +109,3761 @@ LANG_FILE = os.path.join(BASE_DIR, "language.ini")
 CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".config", "lintar", "settings.ini")
 
 # Config yönetimi
-def load_config():
+CONFIG_WRITE_DELAY = 0.5
+
+def load_config(path=CONFIG_FILE):
     config = configparser.ConfigParser()
-    if os.path.exists(CONFIG_FILE):
-        config.read(CONFIG_FILE, encoding='utf-8')
+    if os.path.exists(path):
+        config.read(path, encoding='utf-8')
     return config
 
-def save_config(config):
-    os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-    with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
+def save_config(config, path=CONFIG_FILE):
+    """Ayarları geçici dosyaya yazıp yeniden adlandırır; yarım yazılmış dosya kalmaz"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
         config.write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+class ConfigStore:
+    """settings.ini'nin süreç boyunca bellekte tutulan kopyası.
+
+    Okumalar diske gitmez. Yazmalar biriktirilir ve kısa bir gecikmeden sonra
+    arka planda tek seferde diske işlenir. Dosya dışarıdan değişirse
+    QFileSystemWatcher ile fark edilip yeniden okunur; henüz yazılmamış
+    değişiklikler bu sırada korunur.
+    """
+
+    def __init__(self, path, delay=CONFIG_WRITE_DELAY):
+        self.path = path
+        self.delay = delay
+        self.lock = Lock()
+        self.config = load_config(path)
+        self.pending = {}  # (bölüm, anahtar) -> yazılmayı bekleyen değer
+        self.timer = None
+        self.watcher = None
+        self.signature = self._file_signature()
+
+    def _file_signature(self):
+        try:
+            stat_result = os.stat(self.path)
+        except OSError:
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino
+
+    def get(self, section, key, default):
+        with self.lock:
+            return self.config.get(section, key, fallback=default)
+
+    def set(self, section, key, value):
+        value = str(value)
+        with self.lock:
+            if self.config.get(section, key, fallback=None) == value:
+                return
+            if section not in self.config:
+                self.config[section] = {}
+            self.config[section][key] = value
+            self.pending[(section, key)] = value
+            if self.timer is None:
+                self.timer = Timer(self.delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        """Bekleyen değişiklikleri hemen diske yazar"""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.pending:
+                return
+            try:
+                save_config(self.config, self.path)
+            except OSError as e:
+                print(f"Warning: settings could not be saved: {e}")
+                return
+            self.pending.clear()
+            self.signature = self._file_signature()
+
+    def reload(self):
+        """Dosya dışarıdan değiştiyse yeniden okur; değiştiyse True döndürür"""
+        with self.lock:
+            signature = self._file_signature()
+            if signature == self.signature:
+                return False
+            config = load_config(self.path)
+            for (section, key), value in self.pending.items():
+                if section not in config:
+                    config[section] = {}
+                config[section][key] = value
+            self.config = config
+            self.signature = signature
+        return True
+
+    def reset(self):
+        """Tüm ayarları siler"""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            self.pending.clear()
+            self.config = configparser.ConfigParser()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self.signature = None
+
+    def watch(self):
+        """Dış değişiklikleri izlemeye başlar; QApplication kurulduktan sonra çağrılır"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.watcher = QFileSystemWatcher([os.path.dirname(self.path)])
+        self.watcher.fileChanged.connect(self._on_file_event)
+        self.watcher.directoryChanged.connect(self._on_file_event)
+        self._watch_file()
+
+    def _watch_file(self):
+        # Yeniden adlandırılarak değiştirilen dosya izleyiciden düşer; tekrar eklenir
+        if os.path.exists(self.path) and self.path not in self.watcher.files():
+            self.watcher.addPath(self.path)
+
+    def _on_file_event(self, path):
+        self.reload()
+        self._watch_file()
+
+config_store = ConfigStore(CONFIG_FILE)
 
 def get_config_value(section, key, default):
-    config = load_config()
-    return config.get(section, key, fallback=default)
+    return config_store.get(section, key, default)
 
 def set_config_value(section, key, value):
-    config = load_config()
-    if section not in config:
-        config[section] = {}
-    config[section][key] = str(value)
-    save_config(config)
+    config_store.set(section, key, value)
+
+def get_cpu_cores():
+    """Ayarlardaki CPU çekirdek sayısını döndürür"""
+    max_cores = os.cpu_count() or 1
+    try:
+        cores = int(get_config_value('compression', 'cpu_cores', str(max_cores // 2 if max_cores > 1 else 1)))
+    except ValueError:
+        cores = 1
+    return max(1, min(cores, max_cores))
+
+# ZIP merkezi dizin okuyucu
+ZIP_EOCD_SIGNATURE = b'PK\x05\x06'
+ZIP64_LOCATOR_SIGNATURE = b'PK\x06\x07'
+ZIP64_EOCD_SIGNATURE = b'PK\x06\x06'
+ZIP_CENTRAL_HEADER_SIGNATURE = 0x02014b50
+ZIP_CENTRAL_HEADER = struct.Struct('<IHHHHHHIIIHHHHHII')
+ZIP_EOCD = struct.Struct('<4sHHHHIIH')
+ZIP64_LOCATOR = struct.Struct('<4sIQI')
+ZIP64_EOCD = struct.Struct('<4sQHHIIQQQQ')
+ZIP_MAX_COMMENT = 0xFFFF
+
+class ZipCentralDirectory:
+    """ZIP merkezi dizinini mmap üzerinden doğrudan okur.
+
+    zipfile.ZipFile her öğe için bir ZipInfo nesnesi kurar; bu sınıf ise kayıtları
+    struct ile toplu halde çözer. ZIP64 ve başına veri eklenmiş (self-extracting)
+    arşivler desteklenir.
+    """
+
+    def __init__(self, archive_path):
+        self.archive_path = archive_path
+        self.file = open(archive_path, 'rb')
+        try:
+            self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._locate()
+        except (ValueError, OSError, struct.error) as e:
+            self.close()
+            raise zipfile.BadZipFile(f"Invalid ZIP central directory: {e}")
+        except zipfile.BadZipFile:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if getattr(self, 'mm', None) is not None:
+            self.mm.close()
+            self.mm = None
+        self.file.close()
+
+    def _locate(self):
+        mm = self.mm
+        size = len(mm)
+        eocd_pos = mm.rfind(ZIP_EOCD_SIGNATURE, max(0, size - ZIP_EOCD.size - ZIP_MAX_COMMENT))
+        if eocd_pos < 0:
+            raise zipfile.BadZipFile("End of central directory record not found")
+        (_, _, _, _, count, cd_size, cd_offset, comment_len) = ZIP_EOCD.unpack_from(mm, eocd_pos)
+        self.comment = mm[eocd_pos + ZIP_EOCD.size:eocd_pos + ZIP_EOCD.size + comment_len]
+        end_of_cd = eocd_pos
+
+        locator_pos = eocd_pos - ZIP64_LOCATOR.size
+        if locator_pos >= 0 and mm[locator_pos:locator_pos + 4] == ZIP64_LOCATOR_SIGNATURE:
+            eocd64_pos = locator_pos - ZIP64_EOCD.size
+            if eocd64_pos >= 0 and mm[eocd64_pos:eocd64_pos + 4] == ZIP64_EOCD_SIGNATURE:
+                (_, _, _, _, _, _, _, count, cd_size, cd_offset) = ZIP64_EOCD.unpack_from(mm, eocd64_pos)
+                end_of_cd = eocd64_pos
+
+        # Arşivin başına eklenmiş veri varsa ofsetler bu kadar kayar
+        self.base_offset = end_of_cd - cd_size - cd_offset
+        if self.base_offset < 0:
+            raise zipfile.BadZipFile("Central directory offset out of range")
+        self.cd_start = cd_offset + self.base_offset
+        self.cd_end = self.cd_start + cd_size
+        self.count = count
+
+    @staticmethod
+    def _zip64_values(extra, need_usize, need_csize, need_offset):
+        """ZIP64 ek alanından 0xFFFFFFFF ile işaretlenmiş değerleri okur"""
+        pos = 0
+        while pos + 4 <= len(extra):
+            header_id, data_size = struct.unpack_from('<HH', extra, pos)
+            if header_id == 0x0001:
+                values = []
+                field_pos = pos + 4
+                for needed in (need_usize, need_csize, need_offset):
+                    if needed:
+                        values.append(struct.unpack_from('<Q', extra, field_pos)[0])
+                        field_pos += 8
+                    else:
+                        values.append(None)
+                return values
+            pos += 4 + data_size
+        raise zipfile.BadZipFile("ZIP64 extra field missing")
+
+    def records(self):
+        """Her kayıt için (ad, bayraklar, yöntem, crc, sıkıştırılmış, orijinal,
+        dos_saat, dos_tarih, yerel_başlık_ofseti, kayıt_pos, kayıt_uzunluğu) döndürür"""
+        mm = self.mm
+        unpack = ZIP_CENTRAL_HEADER.unpack_from
+        header_size = ZIP_CENTRAL_HEADER.size
+        pos = self.cd_start
+        cd_end = self.cd_end
+        while pos < cd_end:
+            (signature, _, _, flags, method, dos_time, dos_date, crc, csize, usize,
+             name_len, extra_len, comment_len, _, _, _, offset) = unpack(mm, pos)
+            if signature != ZIP_CENTRAL_HEADER_SIGNATURE:
+                raise zipfile.BadZipFile("Bad central directory record signature")
+            name_start = pos + header_size
+            raw_name = mm[name_start:name_start + name_len]
+            name = raw_name.decode('utf-8' if flags & 0x800 else 'cp437', 'replace')
+            if usize == 0xFFFFFFFF or csize == 0xFFFFFFFF or offset == 0xFFFFFFFF:
+                extra = mm[name_start + name_len:name_start + name_len + extra_len]
+                big_usize, big_csize, big_offset = self._zip64_values(
+                    extra, usize == 0xFFFFFFFF, csize == 0xFFFFFFFF, offset == 0xFFFFFFFF)
+                usize = big_usize if big_usize is not None else usize
+                csize = big_csize if big_csize is not None else csize
+                offset = big_offset if big_offset is not None else offset
+            record_len = header_size + name_len + extra_len + comment_len
+            yield (name, flags, method, crc, csize, usize, dos_time, dos_date,
+                   offset + self.base_offset, pos, record_len)
+            pos += record_len
+
+    def total_uncompressed(self):
+        """Klasörler hariç toplam orijinal boyut; adlar çözülmeden hesaplanır"""
+        mm = self.mm
+        unpack = ZIP_CENTRAL_HEADER.unpack_from
+        header_size = ZIP_CENTRAL_HEADER.size
+        slash = ord('/')
+        total = 0
+        pos = self.cd_start
+        cd_end = self.cd_end
+        while pos < cd_end:
+            fields = unpack(mm, pos)
+            if fields[0] != ZIP_CENTRAL_HEADER_SIGNATURE:
+                raise zipfile.BadZipFile("Bad central directory record signature")
+            name_len = fields[10]
+            extra_len = fields[11]
+            name_end = pos + header_size + name_len
+            usize = fields[9]
+            if usize == 0xFFFFFFFF:
+                usize = self._zip64_values(mm[name_end:name_end + extra_len], True, False, False)[0]
+            if name_len and mm[name_end - 1] != slash:
+                total += usize
+            pos = name_end + extra_len + fields[12]
+        return total
+
+    def listing_rows(self):
+        rows = []
+        for name, _, _, _, csize, usize, dos_time, dos_date, _, _, _ in self.records():
+            is_dir = name.endswith('/')
+            name = name.rstrip('/')
+            if name:
+                date = '%04d-%02d-%02d %02d:%02d:%02d' % (
+                    (dos_date >> 9) + 1980, (dos_date >> 5) & 0xF, dos_date & 0x1F,
+                    dos_time >> 11, (dos_time >> 5) & 0x3F, (dos_time & 0x1F) * 2)
+                rows.append(ListingRow(name, is_dir, usize, csize, date))
+        return rows
+
+# Paralel ZIP yazıcı
+ZIP_LOCAL_HEADER_SIGNATURE = 0x04034b50
+ZIP_LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+PARALLEL_ZIP_CHUNK_SIZE = 1024 * 1024
+PARALLEL_ZIP_WINDOW = 32768
+
+_crc32_zero_operators = []
+
+def _gf2_matrix_times(matrix, vector):
+    total = 0
+    i = 0
+    while vector:
+        if vector & 1:
+            total ^= matrix[i]
+        vector >>= 1
+        i += 1
+    return total
+
+def _gf2_matrix_square(matrix):
+    return [_gf2_matrix_times(matrix, row) for row in matrix]
+
+def crc32_combine(crc1, crc2, length2):
+    """crc32(A) ve crc32(B) değerlerinden crc32(A + B) hesaplar (zlib'in crc32_combine'ı)"""
+    if not _crc32_zero_operators:
+        # Tek sıfır bitinin operatöründen tek sıfır baytının operatörüne
+        operator = [0xEDB88320] + [1 << n for n in range(31)]
+        for _ in range(3):
+            operator = _gf2_matrix_square(operator)
+        _crc32_zero_operators.append(operator)
+    power = 0
+    while length2:
+        while len(_crc32_zero_operators) <= power:
+            _crc32_zero_operators.append(_gf2_matrix_square(_crc32_zero_operators[-1]))
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(_crc32_zero_operators[power], crc1)
+        length2 >>= 1
+        power += 1
+    return crc1 ^ crc2
+
+def zip_dos_datetime(mtime):
+    """Değişiklik zamanını ZIP'in (saat, tarih) DOS alanlarına çevirir"""
+    date_time = time.localtime(mtime)
+    if date_time.tm_year < 1980:
+        return 0, (1 << 5) | 1
+    dos_time = (date_time.tm_hour << 11) | (date_time.tm_min << 5) | (date_time.tm_sec // 2)
+    dos_date = ((date_time.tm_year - 1980) << 9) | (date_time.tm_mon << 5) | date_time.tm_mday
+    return dos_time, dos_date
+
+def _compress_zip_chunk(file_path, offset, length, level, is_last):
+    """Dosyanın bir parçasını ham DEFLATE ile sıkıştırır.
+
+    Önceki 32 KB ön sözlük olarak verilir ve ara parçalar Z_SYNC_FLUSH ile
+    bayt sınırında bitirilir; böylece parçalar art arda eklendiğinde tek bir
+    geçerli DEFLATE akışı oluşur.
+    """
+    with open(file_path, 'rb') as f:
+        dictionary = b''
+        if offset:
+            window_start = max(0, offset - PARALLEL_ZIP_WINDOW)
+            f.seek(window_start)
+            dictionary = f.read(offset - window_start)
+        data = f.read(length)
+    if dictionary:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=dictionary)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    output = compressor.compress(data) + compressor.flush(zlib.Z_FINISH if is_last else zlib.Z_SYNC_FLUSH)
+    return len(data), zlib.crc32(data), output
 
-class ExtractWorker(QObject):
-    finished = pyqtSignal(bool, str)
-    progress = pyqtSignal(int)
+class ParallelZipWriter:
+    """DEFLATE ZIP arşivini iş parçacığı havuzuyla oluşturur.
 
-    def __init__(self, archive_path, extract_to):
-        super().__init__()
+    Dosyalar 1 MB'lık parçalara bölünüp havuzda sıkıştırılır; tek yazıcı
+    sıkıştırılmış parçaları sırayla dosyaya ekler, yerel başlıkları sonradan
+    düzeltir ve merkezi dizini yazar. Çok büyük dosya ve öğe sayıları için
+    ZIP64 kayıtları kullanılır.
+    """
+
+    def __init__(self, archive_path, level=zlib.Z_DEFAULT_COMPRESSION, workers=None):
+        self.archive_path = archive_path
+        self.level = level
+        self.workers = workers or get_cpu_cores()
+        self.entries = []
+
+    def _tasks(self, files):
+        for index, (file_path, stat_result) in enumerate(files):
+            size = stat_result.st_size
+            offset = 0
+            while True:
+                length = min(PARALLEL_ZIP_CHUNK_SIZE, size - offset)
+                is_last = offset + length >= size
+                yield index, (file_path, offset, length, self.level, is_last)
+                if is_last:
+                    break
+                offset += length
+
+    def write(self, files):
+        """files: (dosya_yolu, arşivdeki_ad) çiftleri"""
+        prepared = []
+        for file_path, arcname in files:
+            arcname = os.path.normpath(os.path.splitdrive(arcname)[1]).lstrip(os.sep + (os.altsep or ''))
+            if os.sep != '/':
+                arcname = arcname.replace(os.sep, '/')
+            prepared.append((file_path, os.stat(file_path), arcname))
+
+        with open(self.archive_path, 'wb') as out, \
+                futures.ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            tasks = self._tasks([(file_path, stat_result) for file_path, stat_result, _ in prepared])
+            in_flight = self.workers * 4
+            current = None
+            for index, args in tasks:
+                pending.append((index, executor.submit(_compress_zip_chunk, *args)))
+                if len(pending) >= in_flight:
+                    current = self._consume(out, prepared, current, *pending.popleft())
+            while pending:
+                current = self._consume(out, prepared, current, *pending.popleft())
+            if current is not None:
+                self._finish_entry(out, current)
+            self._write_central_directory(out)
+
+    def _consume(self, out, prepared, current, index, future):
+        usize, crc, data = future.result()
+        if current is None or current['index'] != index:
+            if current is not None:
+                self._finish_entry(out, current)
+            file_path, stat_result, arcname = prepared[index]
+            current = self._start_entry(out, index, stat_result, arcname)
+        job_checkpoint(usize)
+        current['crc'] = crc32_combine(current['crc'], crc, usize) if current['usize'] else crc
+        current['usize'] += usize
+        current['csize'] += len(data)
+        out.write(data)
+        return current
+
+    def _start_entry(self, out, index, stat_result, arcname):
+        name = arcname.encode('utf-8')
+        flags = 0 if arcname.isascii() else 0x800
+        # zipfile ile aynı kural: sıkıştırma büyütebileceği için %5 pay bırakılır
+        zip64 = stat_result.st_size * 1.05 > zipfile.ZIP64_LIMIT
+        extra = struct.pack('<HHQQ', 0x0001, 16, 0, 0) if zip64 else b''
+        dos_time, dos_date = zip_dos_datetime(stat_result.st_mtime)
+        entry = {
+            'index': index, 'name': name, 'flags': flags, 'zip64': zip64,
+            'dos_time': dos_time, 'dos_date': dos_date,
+            'external_attr': (stat_result.st_mode & 0xFFFF) << 16,
+            'offset': out.tell(), 'crc': 0, 'csize': 0, 'usize': 0,
+        }
+        out.write(ZIP_LOCAL_HEADER.pack(
+            ZIP_LOCAL_HEADER_SIGNATURE, 45 if zip64 else 20, flags, zipfile.ZIP_DEFLATED,
+            dos_time, dos_date, 0, 0, 0, len(name), len(extra)))
+        out.write(name)
+        out.write(extra)
+        return entry
+
+    def _finish_entry(self, out, entry):
+        """Yerel başlığa CRC ve boyutları geri yazar"""
+        if not entry['zip64'] and max(entry['csize'], entry['usize']) > zipfile.ZIP64_LIMIT:
+            raise zipfile.LargeZipFile("File size changed while compressing and needs ZIP64")
+        end = out.tell()
+        out.seek(entry['offset'] + 14)
+        if entry['zip64']:
+            out.write(struct.pack('<III', entry['crc'], 0xFFFFFFFF, 0xFFFFFFFF))
+            out.seek(entry['offset'] + ZIP_LOCAL_HEADER.size + len(entry['name']) + 4)
+            out.write(struct.pack('<QQ', entry['usize'], entry['csize']))
+        else:
+            out.write(struct.pack('<III', entry['crc'], entry['csize'], entry['usize']))
+        out.seek(end)
+        self.entries.append(entry)
+        job_checkpoint(0, 1)
+
+    def _write_central_directory(self, out):
+        cd_offset = out.tell()
+        for entry in self.entries:
+            big_values = [value for value in (entry['usize'], entry['csize'], entry['offset'])
+                          if value > zipfile.ZIP64_LIMIT]
+            extra = b''
+            if big_values:
+                extra = struct.pack('<HH', 0x0001, 8 * len(big_values)) + struct.pack(f'<{len(big_values)}Q', *big_values)
+            version = 45 if big_values or entry['zip64'] else 20
+            out.write(ZIP_CENTRAL_HEADER.pack(
+                ZIP_CENTRAL_HEADER_SIGNATURE, (3 << 8) | version, version, entry['flags'],
+                zipfile.ZIP_DEFLATED, entry['dos_time'], entry['dos_date'], entry['crc'],
+                entry['csize'] if entry['csize'] <= zipfile.ZIP64_LIMIT else 0xFFFFFFFF,
+                entry['usize'] if entry['usize'] <= zipfile.ZIP64_LIMIT else 0xFFFFFFFF,
+                len(entry['name']), len(extra), 0, 0, 0, entry['external_attr'],
+                entry['offset'] if entry['offset'] <= zipfile.ZIP64_LIMIT else 0xFFFFFFFF))
+            out.write(entry['name'])
+            out.write(extra)
+        out.write(zip_end_records(len(self.entries), cd_offset, out.tell() - cd_offset))
+
+def zip_end_records(count, cd_offset, cd_size, comment=b''):
+    """Merkezi dizin sonu kayıtlarını, gerekirse ZIP64 kayıtlarıyla birlikte üretir"""
+    records = b''
+    if count > 0xFFFF or cd_size > zipfile.ZIP64_LIMIT or cd_offset > zipfile.ZIP64_LIMIT:
+        records += ZIP64_EOCD.pack(ZIP64_EOCD_SIGNATURE, 44, 45, 45, 0, 0, count, count, cd_size, cd_offset)
+        records += ZIP64_LOCATOR.pack(ZIP64_LOCATOR_SIGNATURE, 0, cd_offset + cd_size, 1)
+    records += ZIP_EOCD.pack(ZIP_EOCD_SIGNATURE, 0, 0, min(count, 0xFFFF), min(count, 0xFFFF),
+                             min(cd_size, 0xFFFFFFFF), min(cd_offset, 0xFFFFFFFF), len(comment))
+    return records + comment
+
+# Yeniden sıkıştırmadan ZIP düzenleme
+RAW_COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
+def copy_file_bytes(src_fd, dst_fd, offset, length):
+    """src_fd'nin offset konumundan length baytı dst_fd'nin geçerli konumuna kopyalar.
+
+    Önce copy_file_range, olmazsa sendfile denenir; ikisi de veriyi kullanıcı
+    alanına taşımadan çekirdek içinde kopyalar. Desteklenmeyen dosya
+    sistemlerinde pread/write ile devam edilir.
+    """
+    use_copy_range = hasattr(os, 'copy_file_range')
+    use_sendfile = hasattr(os, 'sendfile')
+    while length > 0:
+        count = min(length, RAW_COPY_CHUNK_SIZE)
+        copied = None
+        if use_copy_range:
+            try:
+                copied = os.copy_file_range(src_fd, dst_fd, count, offset)
+            except OSError:
+                use_copy_range = False
+        if copied is None and use_sendfile:
+            try:
+                copied = os.sendfile(dst_fd, src_fd, offset, count)
+            except OSError:
+                use_sendfile = False
+        if copied is None:
+            data = os.pread(src_fd, count, offset)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(dst_fd, view):]
+            copied = len(data)
+        if copied == 0:
+            raise zipfile.BadZipFile("Unexpected end of archive data")
+        offset += copied
+        length -= copied
+        job_checkpoint(copied)
+
+def _patch_central_offset(record, new_offset):
+    """Ham merkezi dizin kaydındaki yerel başlık ofsetini (gerekirse ZIP64 alanında) değiştirir"""
+    fields = ZIP_CENTRAL_HEADER.unpack_from(record)
+    if fields[16] != 0xFFFFFFFF:
+        struct.pack_into('<I', record, 42, new_offset)
+        return
+    name_len, extra_len = fields[10], fields[11]
+    pos = ZIP_CENTRAL_HEADER.size + name_len
+    extra_end = pos + extra_len
+    while pos + 4 <= extra_end:
+        header_id, data_size = struct.unpack_from('<HH', record, pos)
+        if header_id == 0x0001:
+            # Alan sırası: orijinal boyut, sıkıştırılmış boyut, ofset
+            field_pos = pos + 4
+            field_pos += 8 * ((fields[9] == 0xFFFFFFFF) + (fields[8] == 0xFFFFFFFF))
+            struct.pack_into('<Q', record, field_pos, new_offset)
+            return
+        pos += 4 + data_size
+    raise zipfile.BadZipFile("ZIP64 extra field missing")
+
+def _zip_name_set(names):
+    """Klasör adları hem '/' ile hem '/' olmadan eşleşsin diye iki yazımı da içerir"""
+    return {variant for name in names for variant in (name, name.rstrip('/') + '/')}
+
+def _zip_entry_spans(records, cd_start):
+    """Bir öğenin bayt aralığı, kendi yerel başlığından sonraki öğenin başına kadardır"""
+    starts = sorted(record[8] for record in records)
+    span_ends = {}
+    for index, start in enumerate(starts):
+        span_ends[start] = starts[index + 1] if index + 1 < len(starts) else cd_start
+    return starts, span_ends
+
+def zip_delete_raw(archive_path, output_path, names):
+    """names içindeki öğeler olmadan arşivi output_path'e yazar; kalan öğeler açılmaz.
+
+    Her kalan öğenin yerel başlığı, sıkıştırılmış verisi ve veri tanımlayıcısı
+    olduğu gibi kopyalanır, merkezi dizin kayıtları yalnızca ofsetleri
+    düzeltilerek yeniden yazılır. Silinen öğe sayısını döndürür.
+    """
+    names = _zip_name_set(names)
+    with ZipCentralDirectory(archive_path) as central_directory:
+        records = list(central_directory.records())
+        base_offset = central_directory.base_offset
+        starts, span_ends = _zip_entry_spans(records, central_directory.cd_start)
+        kept = [record for record in records if record[0] not in names]
+        job_set_total(sum(span_ends[record[8]] - record[8] for record in kept))
+
+        src_fd = central_directory.file.fileno()
+        with open(output_path, 'wb', buffering=0) as out:
+            dst_fd = out.fileno()
+            # Kendiliğinden açılan arşivlerin başındaki veri korunur
+            copy_file_bytes(src_fd, dst_fd, 0, starts[0] if starts else central_directory.cd_start)
+            central = bytearray()
+            for record in kept:
+                local_offset, record_pos, record_len = record[8], record[9], record[10]
+                new_offset = os.lseek(dst_fd, 0, os.SEEK_CUR)
+                copy_file_bytes(src_fd, dst_fd, local_offset, span_ends[local_offset] - local_offset)
+                raw_record = bytearray(central_directory.mm[record_pos:record_pos + record_len])
+                _patch_central_offset(raw_record, new_offset - base_offset)
+                central += raw_record
+            cd_offset = os.lseek(dst_fd, 0, os.SEEK_CUR) - base_offset
+            out.write(bytes(central) + zip_end_records(len(kept), cd_offset, len(central),
+                                                       central_directory.comment))
+    return len(records) - len(kept)
+
+ZIP_IN_PLACE_MAX_TAIL_RATIO = 0.5
+
+def zip_delete_in_place(archive_path, names):
+    """names içindeki öğeleri arşiv dosyasının kendisinde siler.
+
+    İlk silinen öğeden önceki baytlara dokunulmaz; sonrasındaki kalan öğeler
+    geriye kaydırılır, merkezi dizin yeniden yazılır ve dosya kısaltılır.
+    Silinen öğe sayısını döndürür.
+    """
+    names = _zip_name_set(names)
+    with InPlaceEdit(archive_path) as edit:
+        with ZipCentralDirectory(archive_path) as central_directory:
+            records = list(central_directory.records())
+            raw_records = [bytearray(central_directory.mm[record[9]:record[9] + record[10]])
+                           for record in records]
+            base_offset = central_directory.base_offset
+            comment = bytes(central_directory.comment)
+            original_size = len(central_directory.mm)
+            starts, span_ends = _zip_entry_spans(records, central_directory.cd_start)
+
+        deleted_offsets = {record[8] for record in records if record[0] in names}
+        if not deleted_offsets:
+            return 0
+        first_deleted = min(deleted_offsets)
+        moved = [offset for offset in starts if offset > first_deleted and offset not in deleted_offsets]
+        job_set_total((original_size - first_deleted) + sum(span_ends[offset] - offset for offset in moved))
+
+        fd = edit.begin(first_deleted, original_size)
+        new_offsets = {}
+        position = first_deleted
+        for offset in moved:
+            length = span_ends[offset] - offset
+            _move_file_bytes(fd, offset, position, length)
+            new_offsets[offset] = position
+            position += length
+        central = bytearray()
+        kept = 0
+        for record, raw_record in zip(records, raw_records):
+            if record[0] in names:
+                continue
+            if record[8] in new_offsets:
+                _patch_central_offset(raw_record, new_offsets[record[8]] - base_offset)
+            central += raw_record
+            kept += 1
+        end_records = zip_end_records(kept, position - base_offset, len(central), comment)
+        os.pwrite(fd, bytes(central) + end_records, position)
+        os.ftruncate(fd, position + len(central) + len(end_records))
+    return len(records) - kept
+
+def zip_delete_members(archive_path, names):
+    """ZIP öğelerini siler; silinecekler arşivin sonlarına yakınsa dosya yerinde
+    düzenlenir, değilse kalan öğeler ham kopyayla yeni bir dosyaya yazılır"""
+    names = _zip_name_set(names)
+    rollback_edit_journal(archive_path)
+    with ZipCentralDirectory(archive_path) as central_directory:
+        offsets = [record[8] for record in central_directory.records() if record[0] in names]
+        size = len(central_directory.mm)
+    if not offsets:
+        return 0
+    tail = size - min(offsets)
+    if tail <= size * ZIP_IN_PLACE_MAX_TAIL_RATIO and os.access(archive_path, os.W_OK):
+        return zip_delete_in_place(archive_path, names)
+
+    temp_archive = archive_path + '.tmp'
+    try:
+        deleted = zip_delete_raw(archive_path, temp_archive, names)
+        shutil.copymode(archive_path, temp_archive)
+    except BaseException:
+        if os.path.exists(temp_archive):
+            os.remove(temp_archive)
+        raise
+    os.replace(temp_archive, archive_path)
+    return deleted
+
+# Yerinde düzenleme günlüğü
+EDIT_JOURNAL_SUFFIX = '.lintar-journal'
+EDIT_JOURNAL_MAGIC = b'LTZJRNL1'
+EDIT_JOURNAL_HEADER = struct.Struct('<8sQQ')  # imza, orijinal boyut, kaydedilen bölgenin başı
+
+# Yerinde düzenlenen arşivler; bunların günlükleri başka yerden geri alınmaz
+_active_edit_journals = set()
+_active_edit_journals_lock = Lock()
+
+def _move_file_bytes(fd, src, dst, length):
+    """Aynı dosya içinde baytları geriye (dst <= src) kaydırır"""
+    while length > 0:
+        data = os.pread(fd, min(length, RAW_COPY_CHUNK_SIZE), src)
+        if not data:
+            raise EOFError("Unexpected end of archive data")
+        view = memoryview(data)
+        target = dst
+        while view:
+            written = os.pwrite(fd, view, target)
+            view = view[written:]
+            target += written
+        src += len(data)
+        dst += len(data)
+        length -= len(data)
+        job_checkpoint(len(data))
+
+def _fsync_directory(path):
+    try:
+        dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+def _restore_edit_journal(archive_path):
+    journal_path = archive_path + EDIT_JOURNAL_SUFFIX
+    if os.path.exists(journal_path + '.tmp'):
+        # Günlük tamamlanmadan kesilmiş; arşive henüz dokunulmamıştı
+        os.remove(journal_path + '.tmp')
+    if not os.path.exists(journal_path):
+        return False
+    with open(journal_path, 'rb') as journal, open(archive_path, 'r+b') as archive:
+        magic, original_size, start = EDIT_JOURNAL_HEADER.unpack(journal.read(EDIT_JOURNAL_HEADER.size))
+        if magic != EDIT_JOURNAL_MAGIC:
+            raise OSError(f"Invalid edit journal: {journal_path}")
+        archive.seek(start)
+        shutil.copyfileobj(journal, archive, RAW_COPY_CHUNK_SIZE)
+        archive.truncate(original_size)
+        archive.flush()
+        os.fsync(archive.fileno())
+    os.remove(journal_path)
+    _fsync_directory(archive_path)
+    return True
+
+def rollback_edit_journal(archive_path):
+    """Yarım kalmış yerinde düzenlemeyi günlükten geri alır; geri alındıysa True döndürür"""
+    with _active_edit_journals_lock:
+        if os.path.abspath(archive_path) in _active_edit_journals:
+            return False
+    return _restore_edit_journal(archive_path)
+
+class InPlaceEdit:
+    """Arşiv dosyasını yerinde değiştirmek için bağlam yöneticisi.
+
+    begin() değişecek bölgenin ([start, son)) orijinalini günlüğe yazıp diske
+    işler ve düzenlenecek dosyanın tanıtıcısını döndürür. Blok hatayla, iptalle
+    ya da çökmeyle yarıda kalırsa dosya günlükten eski haline döndürülür.
+    """
+
+    def __init__(self, archive_path):
+        self.archive_path = archive_path
+        self.key = os.path.abspath(archive_path)
+        self.file = None
+
+    def __enter__(self):
+        with _active_edit_journals_lock:
+            if self.key in _active_edit_journals:
+                raise OSError(f"Archive is already being modified: {self.archive_path}")
+            _active_edit_journals.add(self.key)
+        try:
+            _restore_edit_journal(self.archive_path)
+        except BaseException:
+            self._release()
+            raise
+        return self
+
+    def begin(self, start, original_size):
+        journal_path = self.archive_path + EDIT_JOURNAL_SUFFIX
+        temp_path = journal_path + '.tmp'
+        try:
+            with open(self.archive_path, 'rb') as archive, open(temp_path, 'wb', buffering=0) as journal:
+                journal.write(EDIT_JOURNAL_HEADER.pack(EDIT_JOURNAL_MAGIC, original_size, start))
+                copy_file_bytes(archive.fileno(), journal.fileno(), start, original_size - start)
+                os.fsync(journal.fileno())
+            os.replace(temp_path, journal_path)
+            _fsync_directory(journal_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self.file = open(self.archive_path, 'r+b', buffering=0)
+        return self.file.fileno()
+
+    def __exit__(self, exc_type, exc, traceback):
+        try:
+            if self.file is not None:
+                try:
+                    if exc_type is None:
+                        os.fsync(self.file.fileno())
+                finally:
+                    self.file.close()
+                if exc_type is None:
+                    os.remove(self.archive_path + EDIT_JOURNAL_SUFFIX)
+                    _fsync_directory(self.archive_path)
+                else:
+                    _restore_edit_journal(self.archive_path)
+        finally:
+            self._release()
+        return False
+
+    def _release(self):
+        with _active_edit_journals_lock:
+            _active_edit_journals.discard(self.key)
+
+# Sıkıştırılmış tar dizini
+TAR_INDEX_DIR = os.path.join(os.path.dirname(CONFIG_FILE), "tar_index")
+TAR_INDEX_VERSION = 1
+TAR_INDEX_MAX_FILES = 200
+TAR_INDEX_CHECKPOINT_SPAN = 32 * 1024 * 1024
+TAR_INDEX_READ_SIZE = 64 * 1024
+TAR_INDEX_MAX_SEEKS = 16
+GZIP_WINDOW_SIZE = 32768
+GZIP_SYNC_MARKER = b'\x00\x00\xff\xff'
+GZIP_SYNC_VALIDATE_SIZE = 64 * 1024
+XZ_HEADER_MAGIC = b'\xfd7zXZ\x00'
+BZ2_BLOCK_MAGIC = 0x314159265359
+BZ2_EOS_MAGIC = 0x177245385090
+
+def _read_varint(data, pos):
+    """xz çok baytlı tamsayısını okur"""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+        if shift > 63:
+            raise ValueError("Invalid xz integer")
+
+def _gzip_header_length(buf):
+    """Tamamlanmış gzip üye başlığının uzunluğu; veri yetersizse None"""
+    if len(buf) < 10:
+        return None
+    if buf[:3] != b'\x1f\x8b\x08':
+        raise OSError("Not a gzipped file")
+    flags = buf[3]
+    pos = 10
+    if flags & 0x04:
+        if len(buf) < pos + 2:
+            return None
+        pos += 2 + int.from_bytes(buf[pos:pos + 2], 'little')
+    for flag in (0x08, 0x10):
+        if flags & flag:
+            end = buf.find(b'\x00', pos)
+            if end < 0:
+                return None
+            pos = end + 1
+    if flags & 0x02:
+        pos += 2
+    return pos if len(buf) >= pos else None
+
+class _GzipCheckpointRecorder:
+    """gzip açılırken üye başlarını ve doğrulanmış senkron noktalarını kaydeder.
+
+    Python'un zlib modülü bit hizalı blok sınırlarına erişim vermediği için
+    yalnızca bayt hizalı noktalar kullanılır: gzip üye başları ve Z_SYNC_FLUSH
+    ile bırakılan boş stored bloklar (00 00 ff ff). Aday bir senkron noktası,
+    son 32 KB pencere ile açılan ikinci bir çözücünün çıktısı ana akışla
+    eşleşene kadar kabul edilmez.
+    """
+
+    def __init__(self, span=TAR_INDEX_CHECKPOINT_SPAN):
+        self.span = span
+        self.checkpoints = []
+        self.window = b''
+        self.last_offset = None
+        self.candidate = None
+
+    def _due(self, uoffset):
+        return self.last_offset is None or uoffset - self.last_offset >= self.span
+
+    def member_start(self, coffset, uoffset):
+        self.candidate = None
+        if self._due(uoffset):
+            self.checkpoints.append([uoffset, coffset, 'member'])
+            self.last_offset = uoffset
+
+    def wants_sync(self, uoffset):
+        return self.candidate is None and self._due(uoffset)
+
+    def sync_point(self, coffset, uoffset):
+        self.candidate = [uoffset, coffset, self.window, zlib.decompressobj(-15, zdict=self.window), 0]
+
+    def feed(self, compressed, output):
+        candidate = self.candidate
+        if candidate is not None:
+            try:
+                test_output = candidate[3].decompress(compressed)
+            except zlib.error:
+                test_output = None
+            if test_output != output:
+                self.candidate = None
+            else:
+                candidate[4] += len(output)
+                if candidate[4] >= GZIP_SYNC_VALIDATE_SIZE or candidate[3].eof:
+                    window = base64.b64encode(zlib.compress(candidate[2])).decode('ascii')
+                    self.checkpoints.append([candidate[0], candidate[1], 'sync', window])
+                    self.last_offset = candidate[0]
+                    self.candidate = None
+        if len(output) >= GZIP_WINDOW_SIZE:
+            self.window = output[-GZIP_WINDOW_SIZE:]
+        elif output:
+            self.window = (self.window + output)[-GZIP_WINDOW_SIZE:]
+
+def _iter_gzip(fileobj, coffset, uoffset, window=None, recorder=None):
+    """gzip akışını verilen noktadan açarak çıktı parçaları üretir"""
+    fileobj.seek(coffset)
+    buf = b''
+    pos = coffset  # buf'un dosyadaki başlangıcı
+    decompressor = zlib.decompressobj(-15, zdict=window) if window is not None else None
+    while True:
+        if decompressor is None:
+            # Yeni gzip üyesi: başlığı atla
+            while True:
+                stripped = buf.lstrip(b'\x00')
+                pos += len(buf) - len(stripped)
+                buf = stripped
+                header_length = _gzip_header_length(buf)
+                if header_length is not None:
+                    break
+                more = fileobj.read(TAR_INDEX_READ_SIZE)
+                if not more:
+                    if buf:
+                        raise EOFError("Truncated gzip header")
+                    return
+                buf += more
+            if recorder is not None:
+                recorder.member_start(pos, uoffset)
+            buf = buf[header_length:]
+            pos += header_length
+            decompressor = zlib.decompressobj(-15)
+
+        if not buf:
+            buf = fileobj.read(TAR_INDEX_READ_SIZE)
+            if not buf:
+                raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+
+        feed = buf
+        split_at_sync = False
+        if recorder is not None and recorder.wants_sync(uoffset):
+            marker = buf.find(GZIP_SYNC_MARKER)
+            if marker >= 0:
+                feed = buf[:marker + len(GZIP_SYNC_MARKER)]
+                split_at_sync = True
+
+        output = decompressor.decompress(feed)
+        if recorder is not None:
+            recorder.feed(feed, output)
+        uoffset += len(output)
+
+        if decompressor.eof:
+            rest = decompressor.unused_data
+            pos += len(feed) - len(rest)
+            buf = rest + buf[len(feed):]
+            # CRC32 ve ISIZE alanlarını atla
+            while len(buf) < 8:
+                more = fileobj.read(TAR_INDEX_READ_SIZE)
+                if not more:
+                    raise EOFError("Truncated gzip trailer")
+                buf += more
+            buf = buf[8:]
+            pos += 8
+            decompressor = None
+        else:
+            buf = buf[len(feed):]
+            pos += len(feed)
+            if split_at_sync:
+                recorder.sync_point(pos, uoffset)
+
+        if output:
+            yield output
+
+def _xz_blocks(fileobj):
+    """.xz dosyasının bloklarını [orijinal_ofset, sıkıştırılmış_ofset] olarak döndürür.
+
+    Art arda eklenmiş akışlar (paralel sıkıştırıcıların çıktısı) sondan başa
+    doğru her akışın dizini okunarak çözülür.
+    """
+    fileobj.seek(0)
+    if fileobj.read(12)[:6] != XZ_HEADER_MAGIC:
+        return None
+    end = fileobj.seek(0, os.SEEK_END)
+    streams = []
+    while end > 0:
+        # Akış dolgusu (4 baytlık sıfırlar)
+        while end >= 24:
+            fileobj.seek(end - 4)
+            if fileobj.read(4) != b'\x00\x00\x00\x00':
+                break
+            end -= 4
+        if end < 24:
+            return None
+        fileobj.seek(end - 12)
+        footer = fileobj.read(12)
+        if footer[10:12] != b'YZ':
+            return None
+        index_size = (int.from_bytes(footer[4:8], 'little') + 1) * 4
+        index_start = end - 12 - index_size
+        if index_start < 12:
+            return None
+        fileobj.seek(index_start)
+        index = fileobj.read(index_size)
+        if index[0] != 0:
+            return None
+        count, pos = _read_varint(index, 1)
+        sizes = []
+        blocks_size = 0
+        for _ in range(count):
+            unpadded_size, pos = _read_varint(index, pos)
+            uncompressed_size, pos = _read_varint(index, pos)
+            sizes.append((unpadded_size, uncompressed_size))
+            blocks_size += (unpadded_size + 3) & ~3
+        stream_start = index_start - blocks_size - 12
+        if stream_start < 0:
+            return None
+        fileobj.seek(stream_start)
+        if fileobj.read(6) != XZ_HEADER_MAGIC:
+            return None
+        streams.append((stream_start, sizes))
+        end = stream_start
+
+    blocks = []
+    uoffset = 0
+    for stream_start, sizes in reversed(streams):
+        coffset = stream_start + 12
+        for unpadded_size, uncompressed_size in sizes:
+            blocks.append([uoffset, coffset])
+            coffset += (unpadded_size + 3) & ~3
+            uoffset += uncompressed_size
+    return blocks
+
+def _xz_block_filters(header):
+    flags = header[1]
+    pos = 2
+    if flags & 0x40:
+        _, pos = _read_varint(header, pos)
+    if flags & 0x80:
+        _, pos = _read_varint(header, pos)
+    filters = []
+    for _ in range((flags & 0x03) + 1):
+        filter_id, pos = _read_varint(header, pos)
+        props_size, pos = _read_varint(header, pos)
+        props = header[pos:pos + props_size]
+        pos += props_size
+        if filter_id == lzma.FILTER_LZMA2:
+            bits = props[0] & 0x3F
+            dict_size = 0xFFFFFFFF if bits == 40 else (2 | (bits & 1)) << (bits // 2 + 11)
+            filters.append({'id': filter_id, 'dict_size': dict_size})
+        elif filter_id == lzma.FILTER_DELTA:
+            filters.append({'id': filter_id, 'dist': props[0] + 1})
+        elif filter_id in (lzma.FILTER_X86, lzma.FILTER_POWERPC, lzma.FILTER_IA64,
+                           lzma.FILTER_ARM, lzma.FILTER_ARMTHUMB, lzma.FILTER_SPARC) and props_size == 0:
+            filters.append({'id': filter_id})
+        else:
+            raise ValueError(f"Unsupported xz filter: {filter_id:#x}")
+    return filters
+
+def _iter_decompressor(fileobj, decompressor):
+    """LZMA/BZ2 çözücüsünü çıktı boyutunu sınırlayarak besler"""
+    while not decompressor.eof:
+        if decompressor.needs_input:
+            chunk = fileobj.read(TAR_INDEX_READ_SIZE)
+            if not chunk:
+                raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+        else:
+            chunk = b''
+        output = decompressor.decompress(chunk, max_length=TAR_INDEX_READ_SIZE * 16)
+        if output:
+            yield output
+
+def _iter_xz(fileobj, blocks, start):
+    for _, coffset in blocks[start:]:
+        fileobj.seek(coffset)
+        size_byte = fileobj.read(1)
+        header = size_byte + fileobj.read((size_byte[0] + 1) * 4 - 1)
+        decompressor = lzma.LZMADecompressor(lzma.FORMAT_RAW, filters=_xz_block_filters(header))
+        yield from _iter_decompressor(fileobj, decompressor)
+
+def _find_bit_pattern(mm, pattern):
+    """48 bitlik bir deseni her bit hizasında arar, bit konumlarını döndürür"""
+    positions = []
+    mask = (1 << 48) - 1
+    size = len(mm)
+    for shift in range(8):
+        window = (pattern << (8 - shift)).to_bytes(7, 'big')
+        needle = window[1:6]
+        index = mm.find(needle, 1)
+        while index >= 0:
+            start = index - 1
+            candidate = int.from_bytes(mm[start:start + 7].ljust(7, b'\x00'), 'big')
+            if (candidate >> (8 - shift)) & mask == pattern:
+                positions.append(start * 8 + shift)
+            index = mm.find(needle, index + 1) if index + 1 < size else -1
+    return positions
+
+def _bz2_blocks(mm):
+    """bzip2 bloklarını [orijinal_ofset, başlangıç_biti, bitiş_biti] olarak döndürür"""
+    starts = set(_find_bit_pattern(mm, BZ2_BLOCK_MAGIC))
+    boundaries = sorted(starts.union(_find_bit_pattern(mm, BZ2_EOS_MAGIC)))
+    blocks = []
+    for position, next_position in zip(boundaries, boundaries[1:]):
+        if position in starts:
+            blocks.append([None, position, next_position])
+    return blocks or None
+
+def _bz2_block_stream(mm, start_bit, end_bit):
+    """Tek bir bloğu kendi başına çözülebilen geçerli bir bzip2 akışına çevirir"""
+    first = start_bit // 8
+    last = (end_bit + 7) // 8
+    value = int.from_bytes(mm[first:last], 'big')
+    value >>= (last - first) * 8 - (end_bit - first * 8)
+    bit_count = end_bit - start_bit
+    value &= (1 << bit_count) - 1
+    # Tek bloklu akışta birleşik CRC, bloğun kendi CRC'sidir
+    block_crc = (value >> (bit_count - 80)) & 0xFFFFFFFF
+    value = (value << 80) | (BZ2_EOS_MAGIC << 32) | block_crc
+    bit_count += 80
+    padding = -bit_count % 8
+    value <<= padding
+    bit_count += padding
+    return b'BZh9' + value.to_bytes(bit_count // 8, 'big')
+
+def _iter_bz2(mm, blocks, start):
+    uoffset = blocks[start][0] or 0
+    for block in blocks[start:]:
+        block[0] = uoffset
+        output = bz2.decompress(_bz2_block_stream(mm, block[1], block[2]))
+        uoffset += len(output)
+        yield output
+
+class _ChunkReader:
+    """Çıktı parçası üreteçlerini tarfile için salt okunur dosyaya çevirir"""
+
+    def __init__(self, chunks, on_close=None):
+        self.chunks = iter(chunks)
+        self.buffer = bytearray()
+        self.offset = 0
+        self.on_close = on_close
+
+    def read(self, size=-1):
+        while size < 0 or len(self.buffer) - self.offset < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            if self.offset:
+                del self.buffer[:self.offset]
+                self.offset = 0
+            self.buffer += chunk
+        end = len(self.buffer) if size < 0 else min(len(self.buffer), self.offset + size)
+        data = bytes(self.buffer[self.offset:end])
+        self.offset = end
+        return data
+
+    def skip(self, count):
+        while count > 0:
+            data = self.read(min(count, TAR_INDEX_READ_SIZE * 16))
+            if not data:
+                raise EOFError("Unexpected end of compressed tar stream")
+            count -= len(data)
+
+    def close(self):
+        if self.on_close is not None:
+            self.on_close()
+            self.on_close = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class TarSeekIndex:
+    """Sıkıştırılmış tar arşivleri için kalıcı rastgele erişim dizini.
+
+    İlk açılışta arşiv bir kez baştan sona açılır; her üyenin başlık ofseti ve
+    çözücünün yeniden başlatılabileceği kontrol noktaları ~/.config/lintar/tar_index
+    altına yazılır. gzip için üye başları ve 32 KB pencereli senkron noktaları,
+    xz için blok sınırları, bzip2 için blok bit konumları saklanır. Tek bir
+    üye çıkartılırken yalnızca en yakın kontrol noktasından itibaren açılır.
+    """
+
+    def __init__(self, archive_path, signature, codec, members, checkpoints):
         self.archive_path = archive_path
+        self.signature = signature
+        self.codec = codec
+        self.members = members          # [ad, başlık_ofseti, veri_ofseti, boyut, mtime, klasör_mü]
+        self.checkpoints = checkpoints  # her kayıt orijinal akıştaki ofsetle başlar
+        self.checkpoint_offsets = [checkpoint[0] for checkpoint in checkpoints]
+        self.members_by_name = None
+
+    @staticmethod
+    def index_file(archive_path):
+        key = os.path.abspath(archive_path).encode('utf-8', 'surrogateescape')
+        return os.path.join(TAR_INDEX_DIR, hashlib.sha1(key).hexdigest() + '.json')
+
+    @staticmethod
+    def _signature(archive_path):
+        stat_result = os.stat(archive_path)
+        return [stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino]
+
+    @staticmethod
+    def detect_codec(fileobj):
+        fileobj.seek(0)
+        magic = fileobj.read(6)
+        if magic[:2] == b'\x1f\x8b':
+            return 'gz'
+        if magic == XZ_HEADER_MAGIC:
+            return 'xz'
+        if magic[:3] == b'BZh':
+            return 'bz2'
+        return None
+
+    @classmethod
+    def open(cls, archive_path):
+        """Geçerli dizini yükler; yoksa arşivi tarayıp dizini kurar ve kaydeder"""
+        index = cls.load(archive_path)
+        if index is None:
+            index = cls.build(archive_path)
+            index.save()
+        return index
+
+    @classmethod
+    def load(cls, archive_path):
+        try:
+            with open(cls.index_file(archive_path), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != TAR_INDEX_VERSION or data.get('signature') != cls._signature(archive_path):
+                return None
+            return cls(archive_path, data['signature'], data['codec'], data['members'], data['checkpoints'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @classmethod
+    def build(cls, archive_path):
+        signature = cls._signature(archive_path)
+        members = []
+        with open(archive_path, 'rb') as fileobj:
+            codec = cls.detect_codec(fileobj)
+            mm = None
+            if codec == 'gz':
+                recorder = _GzipCheckpointRecorder()
+                checkpoints = recorder.checkpoints
+                chunks = _iter_gzip(fileobj, 0, 0, recorder=recorder)
+            elif codec == 'xz':
+                checkpoints = _xz_blocks(fileobj)
+                if checkpoints is None:
+                    # Dizini okunamayan dosya: yalnızca baştan açılabilir
+                    codec = 'xz-stream'
+                    checkpoints = [[0]]
+                    fileobj.seek(0)
+                    chunks = _iter_decompressor(fileobj, lzma.LZMADecompressor())
+                else:
+                    chunks = _iter_xz(fileobj, checkpoints, 0)
+            elif codec == 'bz2':
+                mm = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+                checkpoints = _bz2_blocks(mm)
+                if checkpoints is None:
+                    raise tarfile.ReadError("No bzip2 blocks found")
+                chunks = _iter_bz2(mm, checkpoints, 0)
+            else:
+                raise tarfile.ReadError("Unsupported compression for tar index")
+
+            try:
+                with tarfile.open(fileobj=_ChunkReader(chunks), mode='r|') as tf:
+                    for info in tf:
+                        members.append([info.name, info.offset, info.offset_data, info.size,
+                                        info.mtime, info.isdir()])
+            finally:
+                if mm is not None:
+                    mm.close()
+
+        # tar sonundaki dolgu bloklarına hiç ulaşılmamış olabilir
+        checkpoints = [checkpoint for checkpoint in checkpoints if checkpoint[0] is not None]
+        return cls(archive_path, signature, codec, members, checkpoints)
+
+    def save(self):
+        data = {
+            'version': TAR_INDEX_VERSION,
+            'archive': os.path.abspath(self.archive_path),
+            'signature': self.signature,
+            'codec': self.codec,
+            'members': self.members,
+            'checkpoints': self.checkpoints,
+        }
+        index_file = self.index_file(self.archive_path)
+        try:
+            os.makedirs(TAR_INDEX_DIR, exist_ok=True)
+            temp_file = f"{index_file}.{os.getpid()}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_file, index_file)
+            self._prune()
+        except OSError as e:
+            print(f"Warning: Tar index could not be saved: {e}")
+
+    @staticmethod
+    def _prune():
+        """En eski dizin dosyalarını silerek sayıyı sınırlar"""
+        with os.scandir(TAR_INDEX_DIR) as it:
+            index_files = [(entry.stat().st_mtime, entry.path) for entry in it if entry.name.endswith('.json')]
+        index_files.sort()
+        for _, path in index_files[:max(0, len(index_files) - TAR_INDEX_MAX_FILES)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def listing_rows(self):
+        return [ListingRow(name.rstrip('/'), is_dir, size, size, mtime)
+                for name, _, _, size, mtime, is_dir in self.members if name.rstrip('/')]
+
+    def total_uncompressed(self):
+        return sum(member[3] for member in self.members if not member[5])
+
+    def open_stream(self, uoffset):
+        """Orijinal akışta verilen ofsetten başlayan okuyucu döndürür"""
+        position = bisect.bisect_right(self.checkpoint_offsets, uoffset) - 1
+        fileobj = open(self.archive_path, 'rb')
+        mm = None
+        try:
+            if self.codec == 'gz':
+                checkpoint = self.checkpoints[position]
+                window = None
+                if checkpoint[2] == 'sync':
+                    window = zlib.decompress(base64.b64decode(checkpoint[3]))
+                chunks = _iter_gzip(fileobj, checkpoint[1], checkpoint[0], window)
+            elif self.codec == 'xz':
+                chunks = _iter_xz(fileobj, self.checkpoints, position)
+            elif self.codec == 'bz2':
+                mm = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+                chunks = _iter_bz2(mm, [list(block) for block in self.checkpoints], position)
+            else:
+                position = 0
+                chunks = _iter_decompressor(fileobj, lzma.LZMADecompressor())
+        except Exception:
+            fileobj.close()
+            raise
+
+        def close():
+            if mm is not None:
+                mm.close()
+            fileobj.close()
+
+        reader = _ChunkReader(chunks, close)
+        try:
+            reader.skip(uoffset - self.checkpoints[position][0])
+        except Exception:
+            reader.close()
+            raise
+        return reader
+
+    def extract_member(self, name, extract_to):
+        if self.members_by_name is None:
+            self.members_by_name = {member[0]: member for member in self.members}
+        member = self.members_by_name.get(name.rstrip('/'))
+        if member is None:
+            raise KeyError(f"'{name}' not found in archive")
+        with self.open_stream(member[1]) as reader:
+            with tarfile.open(fileobj=reader, mode='r|') as tf:
+                info = tf.next()
+                if info is None or info.name != member[0]:
+                    raise tarfile.ReadError("Tar index does not match archive")
+                tf.extract(info, extract_to)
+
+def extract_tar_members(archive_path, names, extract_to):
+    """Tar üyelerini çıkartır.
+
+    Az sayıda üye seçildiyse sıkıştırılmış arşivlerde kalıcı dizinle doğrudan
+    üyeye atlanır; aksi halde arşiv bir kez baştan sona okunur ve seçili
+    üyeler geçerken çıkartılır.
+    """
+    compressed = archive_path.lower().endswith(('.tar.gz', '.tar.bz2', '.tar.xz'))
+    if compressed and len(names) <= TAR_INDEX_MAX_SEEKS:
+        try:
+            index = TarSeekIndex.open(archive_path)
+            for name in names:
+                job_checkpoint()
+                index.extract_member(name, extract_to)
+                job_checkpoint(0, 1)
+            return
+        except (tarfile.TarError, OSError, EOFError, ValueError, KeyError, zlib.error, lzma.LZMAError):
+            # Dizin kullanılamazsa arşivi baştan okuyarak devam et
+            pass
+
+    wanted = set(names)
+    if not compressed:
+        # Sıkıştırılmamış tar'da yalnızca başlıklar okunur; ad araması sözlükten yapılır
+        with tarfile.open(archive_path, 'r:') as tf:
+            members = {member.name: member for member in tf.getmembers()}
+            selected = [members[name] for name in names]
+            job_set_total(sum(member.size for member in selected))
+            for member in selected:
+                tf.extract(member, extract_to)
+                job_checkpoint(member.size, 1)
+        return
+
+    job_set_total(os.path.getsize(archive_path))
+    with open(archive_path, 'rb') as raw:
+        codec = TarSeekIndex.detect_codec(raw)
+        raw.seek(0)
+        with open_tar_decompressor(CountingReader(raw, job_checkpoint), codec) as stream, \
+                tarfile.open(fileobj=stream, mode='r|') as tf:
+            for member in tf:
+                if member.name in wanted:
+                    tf.extract(member, extract_to)
+                    job_checkpoint(0, 1)
+                    wanted.discard(member.name)
+                    if not wanted:
+                        break
+    if wanted:
+        raise KeyError(f"filename {sorted(wanted)[0]!r} not found")
+
+def sources_total_size(sources):
+    """Sıkıştırılacak dosya ve klasörlerin toplam boyutu"""
+    total = 0
+    for source in sources:
+        if os.path.isdir(source):
+            for root, _, files in os.walk(source):
+                for file in files:
+                    try:
+                        total += os.lstat(os.path.join(root, file)).st_size
+                    except OSError:
+                        pass
+        elif os.path.isfile(source):
+            total += os.path.getsize(source)
+    return total
+
+def collect_source_files(sources):
+    """Kaynaklardaki dosyaları (dosya_yolu, arşivdeki_ad) çiftleri olarak listeler"""
+    files = []
+    for source in sources:
+        if os.path.isfile(source):
+            files.append((source, os.path.basename(source)))
+        elif os.path.isdir(source):
+            for root, _, names in os.walk(source):
+                for file in names:
+                    file_path = os.path.join(root, file)
+                    arcname = os.path.relpath(file_path, os.path.dirname(source))
+                    files.append((file_path, arcname))
+        else:
+            print(f"Warning: {source} is invalid, skipping.")
+    return files
+
+def extract_archive_members(archive_path, filenames, extract_to):
+    """Seçili arşiv üyelerini hedef klasöre çıkartır"""
+    lower_path = archive_path.lower()
+
+    if lower_path.endswith('.zip'):
+        with zipfile.ZipFile(archive_path, 'r') as zf:
+            # Klasör kayıtları sonda '/' ile saklanır; her iki yazım da aranabilir
+            members = {}
+            for info in zf.infolist():
+                members[info.filename] = info
+                members.setdefault(info.filename.rstrip('/'), info)
+            selected = [members[filename] for filename in filenames]
+            job_set_total(sum(info.file_size for info in selected))
+            for info in selected:
+                zf.extract(info, extract_to)
+                job_checkpoint(info.file_size, 1)
+
+    elif lower_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')):
+        extract_tar_members(archive_path, filenames, extract_to)
+
+    elif lower_path.endswith(('.7z', '.rar')):
+        # Üye listesi komut satırı yerine liste dosyasıyla verilir; tek geçişte çıkartılır
+        if check_command_exists('7z'):
+            build_command = lambda listfile: ['7z', 'x', archive_path, f'-o{extract_to}', '-y', '-bsp1',
+                                              '-spd', '-scsUTF-8', f'@{listfile}']
+        elif lower_path.endswith('.rar') and check_command_exists('unrar'):
+            build_command = lambda listfile: ['unrar', 'x', '-o+', '-y', '-sc8l', archive_path,
+                                              f'@{listfile}', os.path.join(extract_to, '')]
+        else:
+            raise FileNotFoundError(tr('external_tool_not_found', tool_name='7z'))
+        run_with_listfile(build_command, filenames, os.path.getsize(archive_path))
+
+def run_with_listfile(build_command, names, total_bytes=0):
+    """Üye adlarını geçici liste dosyasına yazıp harici aracı çalıştırır"""
+    handle, listfile = tempfile.mkstemp(prefix='lintar_', suffix='.lst')
+    try:
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            f.write(''.join(name + '\n' for name in names))
+        job_set_total(total_bytes)
+        returncode, output, error = ExternalToolRunner(build_command(listfile), total_bytes=total_bytes).run()
+        if returncode != 0:
+            raise OSError(error.strip() or output.strip() or f"{build_command(listfile)[0]}: {returncode}")
+    finally:
+        os.remove(listfile)
+
+def _update_zip_archive(archive_path, sources):
+    files = collect_source_files(sources)
+    with ZipCentralDirectory(archive_path) as central_directory:
+        existing = {record[0]: (record[5], record[6], record[7]) for record in central_directory.records()}
+    changed = []
+    for file_path, arcname in files:
+        arcname = arcname.replace(os.sep, '/')
+        stat_result = os.stat(file_path)
+        # DOS zamanı 2 saniye çözünürlüklüdür; boyut ve zaman aynıysa öğe güncel sayılır
+        if existing.get(arcname) == (stat_result.st_size, *zip_dos_datetime(stat_result.st_mtime)):
+            continue
+        changed.append((file_path, arcname, stat_result.st_size))
+    if not changed:
+        return 0
+    job_set_total(sum(size for _, _, size in changed))
+
+    def append_changed(path):
+        with zipfile.ZipFile(path, 'a', compression=zipfile.ZIP_DEFLATED) as zf:
+            for file_path, arcname, size in changed:
+                zf.write(file_path, arcname=arcname)
+                job_checkpoint(size, 1)
+
+    stale = [arcname for _, arcname, _ in changed if arcname in existing]
+    if not stale:
+        # Yalnızca ekleme: merkezi dizin ve sonrası günlüğe alınır, hata ya da
+        # iptalde arşiv eski haline döner
+        rollback_edit_journal(archive_path)
+        with ZipCentralDirectory(archive_path) as central_directory:
+            cd_start, size = central_directory.cd_start, len(central_directory.mm)
+        with InPlaceEdit(archive_path) as edit:
+            edit.begin(cd_start, size)
+            append_changed(archive_path)
+        return len(changed)
+
+    # Eski kopyalar dışarıda bırakılarak kalan öğeler geçici dosyaya ham kopyalanır,
+    # yeniler oraya eklenir; arşiv ancak tüm eklemeler bitince değiştirilir
+    temp_archive = archive_path + '.tmp'
+    try:
+        zip_delete_raw(archive_path, temp_archive, stale)
+        job = current_job()
+        if job is not None:
+            job.total_bytes = job.done_bytes + sum(size for _, _, size in changed)
+        append_changed(temp_archive)
+        shutil.copymode(archive_path, temp_archive)
+    except BaseException:
+        if os.path.exists(temp_archive):
+            os.remove(temp_archive)
+        raise
+    os.replace(temp_archive, archive_path)
+    return len(changed)
+
+def _update_tar_archive(archive_path, sources):
+    files = collect_source_files(sources)
+    with tarfile.open(archive_path, 'r:') as tar:
+        # Aynı ad birden fazla kez eklenmişse çıkartmada sonuncusu geçerlidir
+        existing = {member.name: (member.size, int(member.mtime)) for member in tar.getmembers()}
+    changed = []
+    for file_path, arcname in files:
+        stat_result = os.stat(file_path)
+        if existing.get(arcname) != (stat_result.st_size, int(stat_result.st_mtime)):
+            changed.append((file_path, arcname, stat_result.st_size))
+    if not changed:
+        return 0
+    job_set_total(sum(size for _, _, size in changed))
+    with tarfile.open(archive_path, 'a') as tar:
+        for file_path, arcname, size in changed:
+            tar.add(file_path, arcname=arcname, recursive=False)
+            job_checkpoint(size, 1)
+    return len(changed)
+
+def update_archive(archive_path, sources):
+    """Kaynakları açık arşive ekler; yalnızca yeni ve değişmiş dosyalar yazılır.
+
+    ZIP ve sıkıştırılmamış tar yerinde güncellenir; 7z ve rar için aracın 'u'
+    komutu kullanılır. Eklenen dosya sayısını, bilinmiyorsa None döndürür.
+    """
+    lower_path = archive_path.lower()
+    if lower_path.endswith('.zip'):
+        return _update_zip_archive(archive_path, sources)
+    if lower_path.endswith('.tar'):
+        return _update_tar_archive(archive_path, sources)
+    if lower_path.endswith(('.tar.gz', '.tar.bz2', '.tar.xz')):
+        raise ValueError(tr('update_compressed_tar'))
+
+    archive_path = os.path.abspath(archive_path)
+    total_bytes = sources_total_size(sources)
+    job_set_total(total_bytes)
+    if lower_path.endswith('.7z'):
+        if not check_command_exists('7z'):
+            raise FileNotFoundError(tr('external_tool_not_found', tool_name='7z'))
+        command = ['7z', 'u', archive_path, '-bsp1'] + list(sources)
+        cwd = os.path.dirname(archive_path)
+    elif lower_path.endswith('.rar'):
+        if not check_command_exists('rar'):
+            raise FileNotFoundError(tr('external_tool_not_found', tool_name='rar'))
+        cwd = os.path.commonpath(sources)
+        if os.path.isfile(cwd):
+            cwd = os.path.dirname(cwd)
+        command = ['rar', 'u', '-ep1', archive_path] + [os.path.relpath(source, cwd) for source in sources]
+    else:
+        raise ValueError(tr('unknown_format', format=os.path.splitext(archive_path)[1]))
+    returncode, output, error = ExternalToolRunner(command, cwd=cwd, total_bytes=total_bytes).run()
+    if returncode != 0:
+        raise OSError(f"Command error: {error or output}")
+    return None
+
+# Tar sıkıştırma arka ucu
+TAR_COMPRESSION_LEVELS = {'gz': 9, 'bz2': 9, 'xz': 6}
+TAR_PARALLEL_BLOCK_SIZES = {'gz': 4 * 1024 * 1024, 'bz2': 8 * 1024 * 1024, 'xz': 16 * 1024 * 1024}
+TAR_EXTERNAL_COMPRESSORS = {
+    'gz': [('pigz', lambda threads, level: ['pigz', '-p', str(threads), f'-{level}', '-c'])],
+    'bz2': [('pbzip2', lambda threads, level: ['pbzip2', f'-p{threads}', f'-{level}', '-c']),
+            ('lbzip2', lambda threads, level: ['lbzip2', '-n', str(threads), f'-{level}', '-c'])],
+    'xz': [('pixz', lambda threads, level: ['pixz', '-p', str(threads), f'-{level}']),
+           ('xz', lambda threads, level: ['xz', f'-T{threads}', f'-{level}', '-c'])],
+}
+
+class ExternalCompressorWriter:
+    """tar akışını harici çok çekirdekli sıkıştırıcının stdin'ine yazar"""
+
+    def __init__(self, command, archive_path):
+        self.command = command
+        self.output = open(archive_path, 'wb')
+        try:
+            self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=self.output,
+                                            stderr=subprocess.PIPE)
+        except Exception:
+            self.output.close()
+            raise
+
+    def write(self, data):
+        self.process.stdin.write(data)
+        return len(data)
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+            error_output = self.process.stderr.read()
+            if self.process.wait() != 0:
+                raise OSError(f"{self.command[0]}: {error_output.decode(errors='replace').strip()}")
+        finally:
+            self.output.close()
+
+    def abort(self):
+        self.process.kill()
+        self.process.wait()
+        self.output.close()
+
+class ParallelBlockCompressor:
+    """tar akışını bloklara bölüp iş parçacığı havuzunda sıkıştırır.
+
+    Her blok bağımsız bir gzip üyesi, bzip2 akışı veya xz akışı olarak
+    sıkıştırılır ve sırayla yazılır; art arda eklenmiş bu akışlar standart
+    araçlarla ve tarfile ile açılabilen geçerli bir dosya oluşturur.
+    """
+
+    def __init__(self, archive_path, mode, threads, level=None):
+        self.output = open(archive_path, 'wb')
+        self.block_size = TAR_PARALLEL_BLOCK_SIZES[mode]
+        level = TAR_COMPRESSION_LEVELS[mode] if level is None else level
+        if mode == 'gz':
+            self.compress = lambda data: gzip.compress(data, compresslevel=level, mtime=0)
+        elif mode == 'bz2':
+            self.compress = lambda data: bz2.compress(data, compresslevel=level)
+        else:
+            self.compress = lambda data: lzma.compress(data, preset=level)
+        self.executor = futures.ThreadPoolExecutor(max_workers=threads)
+        self.max_pending = threads * 2
+        self.pending = deque()
+        self.buffer = bytearray()
+
+    def write(self, data):
+        self.buffer += data
+        while len(self.buffer) >= self.block_size:
+            self._submit(bytes(self.buffer[:self.block_size]))
+            del self.buffer[:self.block_size]
+        return len(data)
+
+    def _submit(self, block):
+        self.pending.append(self.executor.submit(self.compress, block))
+        # Bellek kullanımını sınırlamak için en eski blok beklenir
+        while len(self.pending) > self.max_pending:
+            self.output.write(self.pending.popleft().result())
+
+    def close(self):
+        try:
+            if self.buffer:
+                self._submit(bytes(self.buffer))
+                self.buffer.clear()
+            while self.pending:
+                self.output.write(self.pending.popleft().result())
+        finally:
+            self.executor.shutdown()
+            self.output.close()
+
+    def abort(self):
+        for future in self.pending:
+            future.cancel()
+        self.executor.shutdown()
+        self.output.close()
+
+def open_tar_compressor(archive_path, mode, threads=None):
+    """Sıkıştırılmış tar akışı için yazılabilir hedef döndürür; None ise tarfile kendi sıkıştırır"""
+    threads = threads or get_cpu_cores()
+    level = TAR_COMPRESSION_LEVELS[mode]
+    for tool, build_command in TAR_EXTERNAL_COMPRESSORS[mode]:
+        if shutil.which(tool):
+            return ExternalCompressorWriter(build_command(threads, level), archive_path)
+    if threads > 1:
+        return ParallelBlockCompressor(archive_path, mode, threads, level)
+    return None
+
+def open_tar_decompressor(fileobj, codec):
+    """Sıkıştırılmış tar için okunabilir akış döndürür.
+
+    tarfile'ın akış kipi yalnızca ilk gzip üyesini / bzip2 / xz akışını açar;
+    paralel sıkıştırıcıların çok üyeli çıktısı için açıcı ayrı kurulur.
+    """
+    if codec == 'gz':
+        return gzip.GzipFile(fileobj=fileobj, mode='rb')
+    if codec == 'bz2':
+        return bz2.BZ2File(fileobj, mode='rb')
+    if codec == 'xz':
+        return lzma.LZMAFile(fileobj, mode='rb')
+    return fileobj
+
+# Arşiv oluşturma
+ARCHIVE_FORMATS = (".zip", ".tar.gz", ".tar.bz2", ".tar.xz", ".7z", ".rar")
+COMPRESSION_LEVELS = ('store', 'fast', 'normal', 'good', 'best')
+SEVEN_ZIP_LEVELS = {'store': "-mx0", 'fast': "-mx1", 'normal': "-mx5", 'good': "-mx7", 'best': "-mx9"}
+RAR_LEVELS = {'store': "-m0", 'fast': "-m1", 'normal': "-m3", 'good': "-m4", 'best': "-m5"}
+
+def archive_format(archive_path):
+    """Arşiv yolunun ARCHIVE_FORMATS içindeki uzantısını, yoksa None döndürür"""
+    lower_path = archive_path.lower()
+    for extension in ARCHIVE_FORMATS:
+        if lower_path.endswith(extension):
+            return extension
+    return None
+
+def archive_creation_tool(extension):
+    """Biçimi oluşturmak için gereken harici aracı döndürür; Python yetiyorsa None"""
+    return {".7z": "7z", ".rar": "rar"}.get(extension)
+
+def zip_compression_level(level):
+    if level == 'store':
+        return zipfile.ZIP_STORED, zlib.Z_NO_COMPRESSION
+    if level == 'fast':
+        return zipfile.ZIP_DEFLATED, zlib.Z_BEST_SPEED
+    if level == 'good':
+        return zipfile.ZIP_DEFLATED, 6
+    if level == 'best':
+        return zipfile.ZIP_DEFLATED, zlib.Z_BEST_COMPRESSION
+    return zipfile.ZIP_DEFLATED, zlib.Z_DEFAULT_COMPRESSION
+
+def create_zip_archive(archive_path, sources, password=None, level='normal'):
+    zip_compression_method, zlib_compression_level = zip_compression_level(level)
+    files = collect_source_files(sources)
+    workers = get_cpu_cores()
+    if zip_compression_method == zipfile.ZIP_DEFLATED and workers > 1:
+        ParallelZipWriter(archive_path, zlib_compression_level, workers).write(files)
+        return
+
+    with zipfile.ZipFile(archive_path, 'w',
+                         compression=zip_compression_method,
+                         compresslevel=zlib_compression_level) as zf:
+        if password:
+            zf.setpassword(password.encode('utf-8'))
+        for file_path, arcname in files:
+            zf.write(file_path, arcname=arcname)
+            job_checkpoint(os.path.getsize(file_path), 1)
+
+def create_tar_archive(archive_path, sources, compression_mode="gz"):
+    def track_member(tarinfo):
+        # Her üye yazılmadan önce iş kuyruğuna ilerleme bildirilir
+        job_checkpoint(tarinfo.size, 1 if tarinfo.isreg() else 0)
+        return tarinfo
+
+    compressor = open_tar_compressor(archive_path, compression_mode) if compression_mode else None
+    if compressor is None:
+        mode = f"w:{compression_mode}" if compression_mode else "w"
+        with tarfile.open(archive_path, mode) as tar:
+            for source in sources:
+                tar.add(source, arcname=os.path.basename(source), filter=track_member)
+        return
+
+    # tar akışı çok çekirdekli sıkıştırıcıya aktarılır
+    try:
+        with tarfile.open(fileobj=compressor, mode='w|') as tar:
+            for source in sources:
+                tar.add(source, arcname=os.path.basename(source), filter=track_member)
+    except BaseException:
+        compressor.abort()
+        raise
+    compressor.close()
+
+def archive_output_paths(archive_path):
+    """Arşivin ve bölünmüş parçalarının (.7z.001, .partN.rar) diskteki yolları"""
+    directory = os.path.dirname(archive_path) or '.'
+    name = os.path.basename(archive_path)
+    rar_stem = name[:-4] if name.lower().endswith('.rar') else None
+    paths = set()
+    try:
+        entries = os.listdir(directory)
+    except OSError:
+        return paths
+    for entry in entries:
+        if entry == name or (entry.startswith(name + '.') and entry[len(name) + 1:].isdigit()):
+            paths.add(os.path.join(directory, entry))
+        elif rar_stem is not None:
+            match = RAR_VOLUME_PATTERN.match(entry)
+            if match and match.group(1) == rar_stem:
+                paths.add(os.path.join(directory, entry))
+    return paths
+
+def run_external_command(command_parts, cwd, archive_path=None):
+    """Harici aracı iş kuyruğuna bağlı çalıştırır; başarısızlıkta OSError fırlatır.
+
+    İptalde yalnızca bu çalıştırmanın oluşturduğu arşiv ve parça dosyaları
+    silinir; 7z/rar 'a' ile eklenen mevcut arşive dokunulmaz.
+    """
+    if not check_command_exists(command_parts[0]):
+        raise FileNotFoundError(tr("external_tool_not_found", tool_name=command_parts[0]))
+    job = current_job()
+    existing = archive_output_paths(archive_path) if archive_path else set()
+    runner = ExternalToolRunner(command_parts, cwd=cwd,
+                                total_bytes=job.total_bytes if job is not None else 0)
+    try:
+        returncode, output, error = runner.run()
+    except JobCancelled:
+        if archive_path:
+            for path in archive_output_paths(archive_path) - existing:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        raise
+    if returncode != 0:
+        raise OSError(f"Command error: {error or output}")
+
+def create_7z_archive(archive_path, sources, password=None, level='normal', solid=False, split_volumes=None):
+    # -bsp1: ilerleme yüzdesi stdout'a yazılır
+    args = ["a", archive_path, "-bsp1", SEVEN_ZIP_LEVELS.get(level, "-mx5")]
+
+    if password:
+        args.append(f"-p{password}")
+        args.append("-mhe=on")
+
+    if solid:
+        args.append("-ms=on")
+
+    if split_volumes:
+        args.append(f"-v{split_volumes}")
+
+    args.extend(sources)
+
+    command_cwd = os.path.dirname(archive_path) or os.getcwd()
+    run_external_command(["7z"] + args, command_cwd, archive_path=archive_path)
+
+def create_rar_archive(archive_path, sources, password=None, level='normal', solid=False, split_volumes=None):
+    if not sources:
+        raise ValueError(tr("no_sources_selected"))
+
+    args = ["a", "-ep1", RAR_LEVELS.get(level, "-m3")]
+
+    if password:
+        args.append(f"-p{password}")
+        args.append("-hp")
+
+    if solid:
+        args.append("-s")
+
+    if split_volumes:
+        args.append(f"-v{split_volumes}")
+
+    args.append(archive_path)
+
+    common_parent_dir = os.path.commonpath(sources)
+    if os.path.isfile(common_parent_dir):
+        common_parent_dir = os.path.dirname(common_parent_dir)
+    args.extend(os.path.relpath(source, common_parent_dir) for source in sources)
+
+    run_external_command(["rar"] + args, common_parent_dir or os.getcwd(), archive_path=archive_path)
+
+def create_archive(archive_path, sources, password=None, level='normal', solid=False, split_volumes=None):
+    """Kaynaklardan uzantıya uygun arşivi oluşturur; hata durumunda istisna fırlatır.
+
+    ZIP, 7z kuruluysa onunla (şifre ve bölme için), değilse Python ile yazılır.
+    Python ile yazılan arşiv önce geçici dosyaya yazılır; iptal ya da hatada
+    mevcut arşive dokunulmaz. 7z/rar iptalde kendi oluşturduklarını siler.
+    """
+    extension = archive_format(archive_path)
+    if extension is None:
+        raise ValueError(tr('unknown_format', format=os.path.splitext(archive_path)[1]))
+    job_set_total(sources_total_size(sources))
+    if extension == ".zip" and check_command_exists("7z"):
+        create_7z_archive(archive_path, sources, password, level, solid, split_volumes)
+    elif extension in (".zip", ".tar.gz", ".tar.bz2", ".tar.xz"):
+        temp_archive = archive_path + '.tmp'
+        try:
+            if extension == ".zip":
+                create_zip_archive(temp_archive, sources, password, level)
+            else:
+                create_tar_archive(temp_archive, sources, extension.rsplit('.', 1)[1])
+        except BaseException:
+            if os.path.exists(temp_archive):
+                os.remove(temp_archive)
+            raise
+        os.replace(temp_archive, archive_path)
+    elif extension == ".7z":
+        create_7z_archive(archive_path, sources, password, level, solid, split_volumes)
+    else:
+        create_rar_archive(archive_path, sources, password, level, solid, split_volumes)
+
+# Tar öğe silme
+TAR_STREAM_CHUNK_SIZE = 1024 * 1024
+
+def _read_exact(stream, size):
+    data = stream.read(size)
+    while len(data) < size:
+        more = stream.read(size - len(data))
+        if not more:
+            break
+        data += more
+    return data
+
+def _tar_padded(size):
+    return -(-size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+
+def _pax_records(payload):
+    records = {}
+    pos = 0
+    while pos < len(payload):
+        space = payload.find(b' ', pos)
+        if space < 0:
+            break
+        length = int(payload[pos:space])
+        if length <= 0:
+            break
+        key, _, value = payload[space + 1:pos + length - 1].partition(b'=')
+        records[key.decode('utf-8', 'replace')] = value
+        pos += length
+    return records
+
+def _iter_tar_entries(stream):
+    """Tar akışındaki öğeleri (ad, ham_başlık_blokları, veri_uzunluğu) olarak verir.
+
+    Uzun ad ve pax başlıkları ait oldukları öğenin başlık bloklarına katılır;
+    pax genel başlıkları adsız (None) öğe olarak verilir. Çağıran, sonraki
+    öğeye geçmeden önce veri_uzunluğu kadar baytı akıştan tüketmelidir.
+    """
+    headers = bytearray()
+    long_name = None
+    pax = {}
+    while True:
+        block = _read_exact(stream, tarfile.BLOCKSIZE)
+        if len(block) < tarfile.BLOCKSIZE:
+            if headers or block:
+                raise tarfile.ReadError("Unexpected end of tar data")
+            return
+        if block.count(0) == tarfile.BLOCKSIZE:
+            if headers:
+                raise tarfile.ReadError("Extended header without member")
+            return
+        info = tarfile.TarInfo.frombuf(block, tarfile.ENCODING, 'surrogateescape')
+        headers += block
+        if info.type in (tarfile.GNUTYPE_LONGNAME, tarfile.GNUTYPE_LONGLINK, tarfile.XHDTYPE):
+            payload = _read_exact(stream, _tar_padded(info.size))
+            headers += payload
+            if info.type == tarfile.GNUTYPE_LONGNAME:
+                long_name = tarfile.nts(payload[:info.size], tarfile.ENCODING, 'surrogateescape')
+            elif info.type == tarfile.XHDTYPE:
+                pax.update(_pax_records(payload[:info.size]))
+            continue
+        if info.type == tarfile.XGLTYPE:
+            yield None, bytes(headers), _tar_padded(info.size)
+            headers = bytearray()
+            continue
+        if info.type == tarfile.GNUTYPE_SPARSE:
+            # Eski GNU seyrek biçimi: ek seyreklik blokları başlığın parçasıdır
+            extended = block[482]
+            while extended:
+                sparse_block = _read_exact(stream, tarfile.BLOCKSIZE)
+                headers += sparse_block
+                extended = sparse_block[504]
+        name = info.name
+        if 'path' in pax:
+            name = pax['path'].decode('utf-8', 'surrogateescape')
+        elif long_name is not None:
+            name = long_name
+        size = int(pax['size']) if 'size' in pax else info.size
+        has_data = info.type in tarfile.REGULAR_TYPES or info.type not in tarfile.SUPPORTED_TYPES
+        yield name.rstrip('/'), bytes(headers), _tar_padded(size) if has_data else 0
+        headers = bytearray()
+        long_name = None
+        pax = {}
+
+def _tar_end_blocks(archive_size):
+    """İki boş bitiş bloğu ve tarfile gibi 10 KB'lık kayıt sınırına dolgu"""
+    size = 2 * tarfile.BLOCKSIZE
+    return b'\0' * (size + (-(archive_size + size) % tarfile.RECORDSIZE))
+
+def _tar_delete_in_place(archive_path, names):
+    with InPlaceEdit(archive_path) as edit:
+        spans = []
+        with open(archive_path, 'rb') as archive:
+            for name, headers, data_length in _iter_tar_entries(archive):
+                start = archive.tell() - len(headers)
+                archive.seek(data_length, os.SEEK_CUR)
+                spans.append((name, start, archive.tell()))
+            original_size = os.fstat(archive.fileno()).st_size
+        deleted = [span for span in spans if span[0] is not None and span[0] in names]
+        if not deleted:
+            return 0
+        first_deleted = deleted[0][1]
+        moved = [span for span in spans if span[1] > first_deleted and span not in deleted]
+        job_set_total((original_size - first_deleted) + sum(end - start for _, start, end in moved))
+
+        fd = edit.begin(first_deleted, original_size)
+        position = first_deleted
+        for _, start, end in moved:
+            _move_file_bytes(fd, start, position, end - start)
+            position += end - start
+        end_blocks = _tar_end_blocks(position)
+        os.pwrite(fd, end_blocks, position)
+        os.ftruncate(fd, position + len(end_blocks))
+    return len(deleted)
+
+def _tar_delete_streaming(archive_path, codec, names):
+    temp_archive = archive_path + '.tmp'
+    job_set_total(os.path.getsize(archive_path))
+    output = open_tar_compressor(temp_archive, codec)
+    if output is None:
+        level = TAR_COMPRESSION_LEVELS[codec]
+        if codec == 'gz':
+            output = gzip.open(temp_archive, 'wb', compresslevel=level)
+        elif codec == 'bz2':
+            output = bz2.open(temp_archive, 'wb', compresslevel=level)
+        else:
+            output = lzma.open(temp_archive, 'wb', preset=level)
+
+    def discard():
+        getattr(output, 'abort', output.close)()
+        if os.path.exists(temp_archive):
+            os.remove(temp_archive)
+
+    deleted = 0
+    written = 0
+    try:
+        with open(archive_path, 'rb') as raw, \
+                open_tar_decompressor(CountingReader(raw, job_checkpoint), codec) as stream:
+            for name, headers, data_length in _iter_tar_entries(stream):
+                keep = name is None or name not in names
+                if keep:
+                    output.write(headers)
+                    written += len(headers) + data_length
+                else:
+                    deleted += 1
+                # Veri sabit boyutlu parçalarla kopyalanır ya da atlanır
+                remaining = data_length
+                while remaining:
+                    chunk = stream.read(min(remaining, TAR_STREAM_CHUNK_SIZE))
+                    if not chunk:
+                        raise tarfile.ReadError("Unexpected end of tar data")
+                    if keep:
+                        output.write(chunk)
+                    remaining -= len(chunk)
+        output.write(_tar_end_blocks(written))
+    except BaseException:
+        discard()
+        raise
+    if not deleted:
+        discard()
+        return 0
+    output.close()
+    shutil.copymode(archive_path, temp_archive)
+    os.replace(temp_archive, archive_path)
+    return deleted
+
+def tar_delete_members(archive_path, names):
+    """tar arşivinden öğe siler; bellek kullanımı öğe boyutlarından bağımsızdır.
+
+    Sıkıştırılmamış tar yerinde sıkıştırılır. Sıkıştırılmış tar akış olarak
+    açılır; kalan öğelerin başlık ve veri blokları olduğu gibi aynı biçimdeki
+    sıkıştırıcıya aktarılır. Silinen öğe sayısını döndürür.
+    """
+    names = {name.rstrip('/') for name in names}
+    rollback_edit_journal(archive_path)
+    with open(archive_path, 'rb') as raw:
+        codec = TarSeekIndex.detect_codec(raw)
+    if codec is None:
+        return _tar_delete_in_place(archive_path, names)
+    return _tar_delete_streaming(archive_path, codec, names)
+
+def delete_archive_members(archive_path, names):
+    """Arşivden öğeleri siler; biçime uygun silme yolunu seçer.
+
+    Silinen öğeler iş kuyruğuna işlenen dosya olarak bildirilir.
+    """
+    lower_path = archive_path.lower()
+
+    if lower_path.endswith('.zip'):
+        # ZIP için: öğeler açılmadan silinir (yerinde ya da ham kopyayla)
+        job_checkpoint(0, zip_delete_members(archive_path, names))
+
+    elif lower_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')):
+        job_checkpoint(0, tar_delete_members(archive_path, names))
+
+    elif lower_path.endswith('.7z'):
+        if not check_command_exists('7z'):
+            raise FileNotFoundError(tr('external_tool_not_found', tool_name='7z'))
+        run_with_listfile(lambda listfile: ['7z', 'd', archive_path, '-bsp1', '-spd',
+                                            '-scsUTF-8', f'@{listfile}'], names)
+        job_checkpoint(0, len(names))
+
+    elif lower_path.endswith('.rar'):
+        if not check_command_exists('rar'):
+            raise FileNotFoundError(tr('external_tool_not_found', tool_name='rar'))
+        run_with_listfile(lambda listfile: ['rar', 'd', '-sc8l', archive_path,
+                                            f'@{listfile}'], names)
+        job_checkpoint(0, len(names))
+
+    else:
+        raise ValueError(tr('unknown_format', format=os.path.splitext(archive_path)[1]))
+
+# Arşiv sınama
+def _drain(stream):
+    while stream.read(EXTRACT_CHUNK_SIZE):
+        pass
+
+def test_archive(archive_path):
+    """Arşivin bütünlüğünü denetler; bozuksa istisna fırlatır.
+
+    ZIP ve tar üyelerinin verisi sonuna kadar okunur, böylece CRC ve sıkıştırma
+    sağlamaları da denetlenir. 7z ve rar için aracın 't' komutu kullanılır.
+    """
+    lower_path = archive_path.lower()
+
+    if lower_path.endswith('.zip'):
+        with zipfile.ZipFile(archive_path, 'r') as zf:
+            members = zf.infolist()
+            job_set_total(sum(info.file_size for info in members))
+            for info in members:
+                # zipfile CRC'yi üye sonuna kadar okununca denetler
+                with zf.open(info) as member:
+                    while True:
+                        chunk = member.read(EXTRACT_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        job_checkpoint(len(chunk))
+                job_checkpoint(0, 1)
+
+    elif lower_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')):
+        job_set_total(os.path.getsize(archive_path))
+        with open(archive_path, 'rb') as raw:
+            codec = TarSeekIndex.detect_codec(raw)
+            raw.seek(0)
+            with open_tar_decompressor(CountingReader(raw, job_checkpoint), codec) as stream:
+                with tarfile.open(fileobj=stream, mode='r|') as tf:
+                    for member in tf:
+                        if member.isreg():
+                            _drain(tf.extractfile(member))
+                        job_checkpoint(0, 1)
+                # Sıkıştırma sağlaması akışın sonunda denetlenir
+                _drain(stream)
+
+    elif lower_path.endswith(('.7z', '.rar')):
+        if lower_path.endswith('.rar') and check_command_exists('rar'):
+            command = ['rar', 't', archive_path]
+        elif lower_path.endswith('.rar') and check_command_exists('unrar'):
+            command = ['unrar', 't', archive_path]
+        elif check_command_exists('7z'):
+            command = ['7z', 't', archive_path, '-bsp1']
+        else:
+            raise FileNotFoundError(tr('external_tool_not_found',
+                                       tool_name='rar' if lower_path.endswith('.rar') else '7z'))
+        total_bytes = os.path.getsize(archive_path)
+        job_set_total(total_bytes)
+        returncode, output, error = ExternalToolRunner(command, total_bytes=total_bytes).run()
+        if returncode != 0:
+            raise OSError(error.strip() or output.strip() or tr('error'))
+
+    else:
+        raise ValueError(tr('unknown_format', format=os.path.splitext(archive_path)[1]))
+
+# Harici araç çalıştırıcı
+EXTERNAL_PROGRESS_PATTERN = re.compile(r'(\d{1,3})%(?:\s+(\d+))?')
+EXTERNAL_OUTPUT_TAIL = 64 * 1024
+EXTERNAL_KILL_TIMEOUT = 5
+EXTERNAL_POLL_INTERVAL = 0.25
+
+class ExternalToolRunner:
+    """7z, rar ve unrar gibi araçları kendi süreç grubunda çalıştırır.
+
+    Çıktı karakter karakter okunur: 7z -bsp1 ve unrar ilerlemeyi satır sonu
+    yerine \\r ve \\b ile yazdığından her parça ayrı ayrı taranır. Yüzde, toplam
+    bayt üzerinden işe aktarılır; iş duraklatılınca grup SIGSTOP ile durdurulur.
+    İptal yalnızca sinyal gönderir; bekleme ve gerekirse SIGKILL, run() içinde
+    çalışan iş parçacığında yapılır ve yarım kalan dosya silinir.
+    """
+
+    def __init__(self, command, cwd=None, total_bytes=0, extract_to=None, cleanup_paths=(),
+                 on_progress=None):
+        self.command = command
+        self.cwd = cwd
+        self.total_bytes = total_bytes
         self.extract_to = extract_to
-        self._is_running = True
+        self.cleanup_paths = list(cleanup_paths)
+        self.process = None
+        self.percent = 0
+        self.files_done = 0
+        self.current_item = None
+        self.output_tail = ''
+        self.error_output = b''
+        self.cancelled = False
+        self.on_progress = on_progress  # (yüzde, bayt/sn, dosya/sn)
+        self.started = None
+
+    def _signal_group(self, signal_number):
+        if self.process is not None and self.process.poll() is None:
+            try:
+                os.killpg(self.process.pid, signal_number)
+            except ProcessLookupError:
+                pass
+
+    def pause(self):
+        self._signal_group(signal.SIGSTOP)
+
+    def resume(self):
+        self._signal_group(signal.SIGCONT)
+
+    def cancel(self):
+        """Süreç grubuna SIGTERM gönderir; arayüz iş parçacığından da beklemeden döner"""
+        self.cancelled = True
+        self._signal_group(signal.SIGTERM)
+        self._signal_group(signal.SIGCONT)
+
+    def _terminate(self):
+        """Süreç grubunu sonlandırır ve zombi kalmaması için bekler; gerekirse SIGKILL gönderir"""
+        self._signal_group(signal.SIGTERM)
+        self._signal_group(signal.SIGCONT)
+        try:
+            self.process.wait(timeout=EXTERNAL_KILL_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            self._signal_group(signal.SIGKILL)
+            self.process.wait()
+
+    def _cleanup(self):
+        paths = list(self.cleanup_paths)
+        if self.extract_to and self.current_item:
+            paths.append(os.path.join(self.extract_to, self.current_item))
+        for path in paths:
+            try:
+                if os.path.isfile(path) or os.path.islink(path):
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def _parse_segment(self, segment):
+        """Tek bir \\r/\\n/\\b parçasından ilerleme veya dosya adı çıkarır"""
+        segment = segment.strip()
+        if not segment:
+            return
+        match = EXTERNAL_PROGRESS_PATTERN.match(segment)
+        if match:
+            percent = min(100, int(match.group(1)))
+            files = int(match.group(2)) if match.group(2) else None
+            self._update(percent, files)
+            return
+        # 7z -bb1: "- yol", unrar: "Extracting  yol   OK"
+        if segment.startswith('- '):
+            self._item_started(segment[2:])
+        elif segment.startswith('Extracting  '):
+            name = segment[len('Extracting  '):].rstrip()
+            if name.endswith('OK'):
+                name = name[:-2].rstrip()
+            self._item_started(name)
+        else:
+            match = EXTERNAL_PROGRESS_PATTERN.search(segment)
+            if match:
+                self._update(min(100, int(match.group(1))), None)
+
+    def _item_started(self, name):
+        if name != self.current_item:
+            self.current_item = name
+            self.files_done += 1
+            job_checkpoint(0, 1)
+
+    def _update(self, percent, files):
+        if percent > self.percent:
+            delta = (percent - self.percent) * self.total_bytes // 100
+            self.percent = percent
+            job_checkpoint(delta)
+        if files is not None and files > self.files_done:
+            job_checkpoint(0, files - self.files_done)
+            self.files_done = files
+        if self.on_progress is not None:
+            elapsed = max(time.monotonic() - self.started, 1e-6)
+            self.on_progress(self.percent, self.percent * self.total_bytes / 100 / elapsed,
+                             self.files_done / elapsed)
 
     def run(self):
+        """Aracı çalıştırır; (dönüş_kodu, çıktı_sonu, hata_çıktısı) döndürür"""
+        job = current_job()
+        self.started = time.monotonic()
+        self.process = subprocess.Popen(self.command, cwd=self.cwd, stdin=subprocess.DEVNULL,
+                                        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                        start_new_session=True)
+        if job is not None:
+            job.pause_callbacks.append(self.pause)
+            job.resume_callbacks.append(self.resume)
+            job.cancel_callbacks.append(self.cancel)
+
+        def read_errors():
+            self.error_output = self.process.stderr.read()
+        error_thread = Thread(target=read_errors, daemon=True)
+        error_thread.start()
+
+        pending = ''
+        try:
+            fd = self.process.stdout.fileno()
+            while not self.cancelled:
+                # Okuma kısa aralıklarla beklenir ki iptal, çıktı gelmese de fark edilsin
+                if not select.select([fd], [], [], EXTERNAL_POLL_INTERVAL)[0]:
+                    job_checkpoint()
+                    continue
+                data = os.read(fd, 4096)
+                if not data:
+                    break
+                text = pending + data.decode('utf-8', 'replace')
+                self.output_tail = (self.output_tail + text)[-EXTERNAL_OUTPUT_TAIL:]
+                segments = re.split(r'[\r\n\b]', text)
+                pending = segments.pop()
+                for segment in segments:
+                    self._parse_segment(segment)
+                job_checkpoint()
+            if self.cancelled:
+                self._terminate()
+            else:
+                self._parse_segment(pending)
+                self.process.wait()
+            error_thread.join()
+        except BaseException:
+            self.cancelled = True
+            self._terminate()
+            self._cleanup()
+            raise
+        finally:
+            self.process.stdout.close()
+            if job is not None:
+                job.pause_callbacks.remove(self.pause)
+                job.resume_callbacks.remove(self.resume)
+                job.cancel_callbacks.remove(self.cancel)
+
+        if self.cancelled:
+            self._cleanup()
+            raise JobCancelled()
+        if self.process.returncode == 0:
+            job_checkpoint((100 - self.percent) * self.total_bytes // 100)
+        return (self.process.returncode, self.output_tail,
+                self.error_output.decode('utf-8', 'replace'))
+
+# Arşiv boyut önbelleği
+SIZE_CACHE_FILE = os.path.join(os.path.dirname(CONFIG_FILE), "size_cache.json")
+SIZE_CACHE_MAX_ENTRIES = 20000
+
+class ArchiveSizeCache:
+    """Arşivlerin orijinal boyutlarını diskte saklayan LRU önbellek.
+
+    Kayıtlar yol ile anahtarlanır; dosya boyutu, mtime ve inode değişmediği
+    sürece saklanan değer geçerli kabul edilir.
+    """
+
+    def __init__(self, cache_file=SIZE_CACHE_FILE, max_entries=SIZE_CACHE_MAX_ENTRIES):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = Lock()
+        self.dirty = False
+        self.load()
+
+    @staticmethod
+    def _signature(stat_result):
+        return [stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino]
+
+    def load(self):
         try:
-            if not self._is_running:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # Dosyada en eski kayıt başta, en yeni kayıt sonda tutulur
+            for path, record in data.get('entries', []):
+                self.entries[path] = record
+        except (OSError, ValueError, TypeError):
+            self.entries = OrderedDict()
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
                 return
-
-            if self.archive_path.endswith(".zip"):
+            data = {'version': 1, 'entries': list(self.entries.items())}
+            self.dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            temp_file = self.cache_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            print(f"Warning: Size cache could not be saved: {e}")
+
+    def get(self, path, stat_result):
+        """Geçerli bir kayıt varsa orijinal boyutu, yoksa None döndürür"""
+        with self.lock:
+            record = self.entries.get(path)
+            if record is None:
+                return None
+            if record[:3] != self._signature(stat_result):
+                del self.entries[path]
+                self.dirty = True
+                return None
+            self.entries.move_to_end(path)
+            return record[3]
+
+    def put(self, path, stat_result, original_size):
+        with self.lock:
+            self.entries[path] = self._signature(stat_result) + [original_size]
+            self.entries.move_to_end(path)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self.dirty = True
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.dirty = True
+
+def zip_member_target(filename, extract_to):
+    """zipfile'ın çıkartırken kullandığı hedef yolu hesaplar"""
+    arcname = filename.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid_path_parts = ('', os.path.curdir, os.path.pardir)
+    arcname = os.path.sep.join(part for part in arcname.split(os.path.sep) if part not in invalid_path_parts)
+    return os.path.normpath(os.path.join(extract_to, arcname))
+
+RAR_VOLUME_PATTERN = re.compile(r'^(.*)\.part(\d+)\.rar$', re.IGNORECASE)
+
+def rar_volume_set(archive_path):
+    """Çok parçalı RAR setinin ilk parçasını ve tüm parçalarını döndürür"""
+    match = RAR_VOLUME_PATTERN.match(archive_path)
+    if match:
+        prefix = re.escape(os.path.basename(match.group(1)))
+        volume_pattern = re.compile(prefix + r'\.part(\d+)\.rar$', re.IGNORECASE)
+        directory = os.path.dirname(archive_path) or '.'
+        volumes = []
+        for name in os.listdir(directory):
+            volume_match = volume_pattern.match(name)
+            if volume_match:
+                volumes.append((int(volume_match.group(1)), os.path.join(directory, name)))
+        volumes.sort()
+        if volumes:
+            return volumes[0][1], [path for number, path in volumes]
+        return archive_path, [archive_path]
+    # Eski adlandırma: arsiv.rar, arsiv.r00, arsiv.r01 ...
+    base = archive_path[:-4]
+    volumes = [archive_path]
+    number = 0
+    while os.path.exists(f"{base}.r{number:02d}"):
+        volumes.append(f"{base}.r{number:02d}")
+        number += 1
+    return archive_path, volumes
+
+EXTRACT_CHUNK_SIZE = 1024 * 1024
+THROUGHPUT_INTERVAL = 0.5
+
+class ThroughputMeter:
+    """Yazılan bayt sayısından ilerleme yüzdesini, anlık ve ortalama hızı hesaplar"""
+
+    def __init__(self, total_bytes=0, interval=THROUGHPUT_INTERVAL):
+        self.total_bytes = total_bytes
+        self.done_bytes = 0
+        self.interval = interval
+        self.started = self.last_time = time.monotonic()
+        self.last_bytes = 0
+
+    def add(self, count):
+        """Baytları ekler; rapor zamanı geldiyse (yüzde, anlık, ortalama) döndürür"""
+        self.done_bytes += count
+        now = time.monotonic()
+        finished = self.done_bytes >= self.total_bytes
+        if now - self.last_time < self.interval and not finished:
+            return None
+        elapsed = now - self.last_time
+        instant = (self.done_bytes - self.last_bytes) / elapsed if elapsed > 0 else 0.0
+        average = self.done_bytes / (now - self.started) if now > self.started else 0.0
+        self.last_time = now
+        self.last_bytes = self.done_bytes
+        percent = min(100, int(self.done_bytes * 100 / self.total_bytes)) if self.total_bytes else 100
+        return percent, instant, average
+
+class CountingReader:
+    """Okunan bayt sayısını geri çağırmayla bildiren salt okunur dosya sarmalayıcısı"""
+
+    def __init__(self, fileobj, callback):
+        self.fileobj = fileobj
+        self.callback = callback
+
+    def read(self, size=-1):
+        data = self.fileobj.read(size)
+        if data:
+            self.callback(len(data))
+        return data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class ArchiveExtractor:
+    """Arşivin tamamını hedef klasöre çıkartır; arayüzden bağımsızdır.
+
+    on_progress(yüzde, anlık bayt/sn, ortalama bayt/sn) seyreltilerek çağrılır,
+    hata durumunda istisna fırlatılır.
+    """
+
+    def __init__(self, archive_path, extract_to, on_progress=None, workers=None):
+        self.archive_path = archive_path
+        self.extract_to = extract_to
+        self.on_progress = on_progress
+        self.workers = workers  # ZIP için iş parçacığı sayısı; None ise ayardan
+        self.running = True
+        self.meter = None
+        self.runner = None
+        self.job = None
+        self.account_lock = Lock()
+
+    def _account(self, count, files=0):
+        """Yazılan bayt ve dosyaları bildirir; ilerleme bildirimlerini seyreltir"""
+        with self.account_lock:
+            if self.job is not None:
+                # Paralel iş parçacıklarından da çağrıldığı için işe doğrudan erişilir
+                self.job.checkpoint(count, files)
+            report = self.meter.add(count)
+        if report is not None and self.on_progress is not None:
+            self.on_progress(*report)
+
+    def _extract_zip_member(self, zf, member):
+        """ZIP üyesini parça parça kopyalayarak çıkartır"""
+        target = zip_member_target(member.filename, self.extract_to)
+        if member.is_dir():
+            os.makedirs(target, exist_ok=True)
+            return
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        complete = False
+        try:
+            with zf.open(member) as source, open(target, 'wb') as destination:
+                while self.running:
+                    chunk = source.read(EXTRACT_CHUNK_SIZE)
+                    if not chunk:
+                        complete = True
+                        break
+                    destination.write(chunk)
+                    self._account(len(chunk))
+            if complete:
+                self._account(0, 1)
+        finally:
+            # Durdurma, iptal ya da hata yüzünden yarım kalan dosya tamamlanmış gibi bırakılmaz
+            if not complete and os.path.isfile(target):
+                os.remove(target)
+
+    def _tar_uncompressed_total(self):
+        """Açılmış veri boyutunu ek çözme yapmadan bulur; bulunamazsa None"""
+        if self.archive_path.endswith(".tar"):
+            # Sıkıştırılmamış tar'da yalnızca başlıklar okunur
+            try:
+                with tarfile.open(self.archive_path, 'r:') as tf:
+                    return sum(member.size for member in tf.getmembers() if member.isreg())
+            except tarfile.TarError:
+                return None
+        index = TarSeekIndex.load(self.archive_path)
+        return index.total_uncompressed() if index is not None else None
+
+    def _extract_tar_member(self, tf, member, count_data):
+        """Tar üyesini çıkartır; normal dosyalar parça parça kopyalanır"""
+        if not member.isreg() or member.sparse is not None:
+            tf.extract(member, self.extract_to)
+            if member.isreg():
+                self._account(member.size if count_data else 0, 1)
+            return
+        target = zip_member_target(member.name, self.extract_to)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        complete = False
+        try:
+            with tf.extractfile(member) as source, open(target, 'wb') as destination:
+                while self.running:
+                    chunk = source.read(EXTRACT_CHUNK_SIZE)
+                    if not chunk:
+                        complete = True
+                        break
+                    destination.write(chunk)
+                    if count_data:
+                        self._account(len(chunk))
+            if complete:
+                tf.chown(member, target, False)
+                tf.chmod(member, target)
+                tf.utime(member, target)
+                self._account(0, 1)
+        finally:
+            # Durdurma, iptal ya da hata yüzünden yarım kalan dosya tamamlanmış gibi bırakılmaz
+            if not complete and os.path.isfile(target):
+                os.remove(target)
+
+    def extract(self):
+        self.job = current_job()
+
+        if self.archive_path.endswith(".zip"):
+            with zipfile.ZipFile(self.archive_path, 'r') as zf:
+                members = zf.infolist()
+            total_bytes = sum(member.file_size for member in members)
+            job_set_total(total_bytes)
+            self.meter = ThroughputMeter(total_bytes)
+            workers = min(self.workers or get_cpu_cores(), len(members))
+            if workers > 1:
+                self.extract_zip_parallel(members, workers)
+            else:
                 with zipfile.ZipFile(self.archive_path, 'r') as zf:
-                    total_files = len(zf.infolist())
-                    for i, member in enumerate(zf.infolist()):
-                        if not self._is_running:
+                    for member in members:
+                        if not self.running:
                             break
-                        zf.extract(member, self.extract_to)
-                        self.progress.emit(int((i + 1) / total_files * 100))
-                self.finished.emit(True, None)
-                
-            elif self.archive_path.endswith((".tar.gz", ".tar.bz2", ".tar.xz", ".tar")):
-                with tarfile.open(self.archive_path, 'r:*') as tf:
-                    members = tf.getmembers()
-                    total_files = len(members)
-                    for i, member in enumerate(members):
-                        if not self._is_running:
+                        self._extract_zip_member(zf, member)
+
+        elif self.archive_path.endswith((".tar", ".tar.gz", ".tar.bz2", ".tar.xz")):
+            # Tek geçiş: akış kipinde çıkartılır. Açılmış boyut ek çözme yapmadan
+            # biliniyorsa ilerleme yazılan üye verisinden, bilinmiyorsa dosyadan
+            # okunan sıkıştırılmış bayttan hesaplanır
+            total_bytes = self._tar_uncompressed_total()
+            count_data = total_bytes is not None
+            if not count_data:
+                total_bytes = os.path.getsize(self.archive_path)
+            job_set_total(total_bytes)
+            self.meter = ThroughputMeter(total_bytes)
+            with open(self.archive_path, 'rb') as raw:
+                codec = TarSeekIndex.detect_codec(raw)
+                raw.seek(0)
+                source = raw if count_data else CountingReader(raw, self._account)
+                stream = open_tar_decompressor(source, codec)
+                with stream, tarfile.open(fileobj=stream, mode='r|') as tf:
+                    for member in tf:
+                        if not self.running:
                             break
-                        tf.extract(member, self.extract_to)
-                        self.progress.emit(int((i + 1) / total_files * 100))
-                self.finished.emit(True, None)
-                
-            elif self.archive_path.endswith(".7z"):
-                if not check_command_exists("7z"):
-                    self.finished.emit(False, "7z programı bulunamadı")
-                    return
-                
-                command = ["7z", "x", self.archive_path, f"-o{self.extract_to}", "-y"]
-                process = subprocess.Popen(
-                    command,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True,
-                    bufsize=1
-                )
-                
-                while True:
-                    if not self._is_running:
-                        process.terminate()
-                        break
-                    
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-                    if output and "%" in output:
-                        try:
-                            percent = int(output.split("%")[0].strip())
-                            self.progress.emit(percent)
-                        except:
-                            pass
-                
-                if not self._is_running:
-                    self.finished.emit(False, "İşlem iptal edildi")
-                    return
-                elif process.returncode != 0:
-                    error = process.stderr.read()
-                    self.finished.emit(False, error or "Bilinmeyen hata")
-                else:
-                    self.finished.emit(True, None)
+                        self._extract_tar_member(tf, member, count_data)
+            if self.running:
+                # tar bitiş bloğundan sonraki dolgu okunmaz; kalanı tamamlanmış say
+                self._account(max(0, total_bytes - self.meter.done_bytes))
+
+        elif self.archive_path.endswith(".7z"):
+            if not check_command_exists("7z"):
+                raise FileNotFoundError(tr('external_tool_not_found', tool_name='7z'))
+            command = ["7z", "x", self.archive_path, f"-o{self.extract_to}", "-y", "-bsp1", "-bb1"]
+            self._extract_external(command, os.path.getsize(self.archive_path))
+
+        elif self.archive_path.lower().endswith(".rar"):
+            # Çok parçalı setler ilk parçadan tek seferde açılır; araç diğer parçaları kendisi bulur
+            first_volume, volumes = rar_volume_set(self.archive_path)
+            total_bytes = sum(os.path.getsize(volume) for volume in volumes)
+            if check_command_exists("unrar"):
+                command = ["unrar", "x", "-o+", "-y", first_volume, os.path.join(self.extract_to, "")]
+            elif check_command_exists("7z"):
+                command = ["7z", "x", first_volume, f"-o{self.extract_to}", "-y", "-bsp1", "-bb1"]
+            else:
+                raise FileNotFoundError(tr('external_tool_not_found', tool_name='unrar'))
+            self._extract_external(command, total_bytes)
+        else:
+            raise ValueError(tr('unknown_format', format=os.path.splitext(self.archive_path)[1]))
+
+    def extract_zip_parallel(self, members, workers):
+        """ZIP üyelerini iş parçacığı havuzunda çıkartır; zlib açma sırasında GIL'i bırakır"""
+        # Klasörler önceden ve sırayla oluşturulur, böylece iş parçacıkları
+        # aynı üst klasörü aynı anda oluşturmaya çalışmaz
+        files = []
+        for member in members:
+            target = zip_member_target(member.filename, self.extract_to)
+            if member.is_dir():
+                os.makedirs(target, exist_ok=True)
             else:
-                self.finished.emit(False, f"Tanınmayan format: {os.path.splitext(self.archive_path)[1]}")
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                files.append(member)
+        # Büyük dosyalar önce başlatılır ki işler çekirdeklere dengeli dağılsın
+        files.sort(key=lambda member: member.file_size, reverse=True)
+
+        lock = Lock()
+        handles = []
+        thread_state = local()
+
+        def extract_member(member):
+            if not self.running:
+                return
+            zf = getattr(thread_state, 'zf', None)
+            if zf is None:
+                # Her iş parçacığı kendi dosya tanıtıcısını kullanır
+                zf = thread_state.zf = zipfile.ZipFile(self.archive_path, 'r')
+                with lock:
+                    handles.append(zf)
+            self._extract_zip_member(zf, member)
+
+        try:
+            with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = [executor.submit(extract_member, member) for member in files]
+                try:
+                    for future in pending:
+                        future.result()
+                except Exception:
+                    # İlk hatada kalan üyeler atlanır ve hata yukarı iletilir
+                    self.running = False
+                    raise
+        finally:
+            for zf in handles:
+                zf.close()
+
+    def _extract_external(self, command, total_bytes):
+        """7z/unrar ile çıkartır; ilerleme sıkıştırılmış boyut üzerinden hesaplanır"""
+        job_set_total(total_bytes)
+        self.meter = ThroughputMeter(total_bytes)
+        self.runner = ExternalToolRunner(command, total_bytes=total_bytes,
+                                         extract_to=self.extract_to,
+                                         on_progress=self._external_progress)
+        if not self.running:
+            raise JobCancelled()
+        returncode, output, error = self.runner.run()
+        if returncode != 0:
+            raise OSError(error.strip() or output.strip() or "Bilinmeyen hata")
+
+    def _external_progress(self, percent, byte_speed, file_speed):
+        # Araç yalnızca yüzde bildirir; anlık ve ortalama hız ölçerden hesaplanır.
+        # İş kuyruğuna ilerlemeyi araç çalıştırıcısı işlediği için _account kullanılmaz
+        done_bytes = percent * self.meter.total_bytes // 100
+        report = self.meter.add(max(0, done_bytes - self.meter.done_bytes))
+        if report is not None and self.on_progress is not None:
+            self.on_progress(*report)
+
+    def stop(self):
+        self.running = False
+        if self.runner is not None:
+            self.runner.cancel()
+
+class ExtractWorker(QObject):
+    """ArchiveExtractor'ı iş kuyruğunda çalıştırır; sonucu sinyallerle bildirir"""
+    finished = pyqtSignal(bool, str)
+    progress = pyqtSignal(int)
+    throughput = pyqtSignal(float, float)  # anlık ve ortalama MB/s
+
+    def __init__(self, archive_path, extract_to):
+        super().__init__()
+        self.archive_path = archive_path
+        self.extract_to = extract_to
+        self.extractor = ArchiveExtractor(archive_path, extract_to, on_progress=self._report)
+
+    def _report(self, percent, instant, average):
+        self.progress.emit(percent)
+        self.throughput.emit(instant / (1024 * 1024), average / (1024 * 1024))
+
+    def run(self):
+        if not self.extractor.running:
+            return
+        try:
+            self.extractor.extract()
+        except JobCancelled:
+            self.finished.emit(False, "İşlem iptal edildi")
+            raise
         except Exception as e:
             self.finished.emit(False, str(e))
+        else:
+            self.finished.emit(True, None)
 
     def stop(self):
-        self._is_running = False
+        self.extractor.stop()
+
+# Toplu arşiv işlemleri
+def archive_stem(archive_path):
+    """Arşiv adından biçim uzantısını ve rar parça ekini atar"""
+    name = os.path.basename(archive_path)
+    match = RAR_VOLUME_PATTERN.match(name)
+    if match:
+        return match.group(1)
+    lower_name = name.lower()
+    for extension in ARCHIVE_FORMATS + (".tar",):
+        if lower_name.endswith(extension) and len(name) > len(extension):
+            return name[:-len(extension)]
+    return os.path.splitext(name)[0]
+
+class BatchEntry:
+    """Toplu işlemdeki tek arşiv; kendi alt işinde çalışır"""
+
+    def __init__(self, archive_path, size, func, output=None):
+        self.archive_path = archive_path
+        self.size = size
+        self.output = output
+        self.job = Job(func, os.path.basename(archive_path))
+
+    def done_bytes(self):
+        """Toplu ilerleme için arşiv boyutunun tamamlanan kısmı"""
+        if not self.job.is_active():
+            return self.size
+        return self.size * (self.job.progress() or 0) // 100
+
+def run_archive_batch(archive_paths, operation, extract_to=None, workers=None):
+    """Arşivleri sınırlı bir havuzda işler; operation 'extract' ya da 'test'.
+
+    Havuz boyutu compression/cpu_cores ayarından gelir. Her arşiv ayrı bir alt
+    işte çalışır, hataları toplanır ve topluyu durdurmaz; çıkartmada her arşiv
+    extract_to altında kendi klasörüne açılır. Çağıran iş duraklatılınca veya
+    iptal edilince alt işler de etkilenir. BatchEntry listesini döndürür.
+    """
+    entries = []
+    seen = set()
+    used_names = set()
+    for archive_path in archive_paths:
+        volumes = [archive_path]
+        if archive_path.lower().endswith(".rar"):
+            # Aynı setin parçaları tek arşiv olarak işlenir
+            archive_path, volumes = rar_volume_set(archive_path)
+        if archive_path in seen:
+            continue
+        seen.add(archive_path)
+        size = sum(os.path.getsize(volume) for volume in volumes)
+
+        if operation == 'extract':
+            stem = name = archive_stem(archive_path)
+            suffix = 2
+            # Hedefte zaten bulunan klasöre karışmamak için o da çakışma sayılır
+            while name in used_names or os.path.exists(os.path.join(extract_to, name)):
+                name = f"{stem}-{suffix}"
+                suffix += 1
+            used_names.add(name)
+            # Çekirdek bütçesini toplu havuz kullanır; arşiv içi çıkartma tek iş parçacıklıdır
+            extractor = ArchiveExtractor(archive_path, os.path.join(extract_to, name), workers=1)
+
+            def extract(extractor=extractor):
+                os.makedirs(extractor.extract_to, exist_ok=True)
+                extractor.extract()
+            entry = BatchEntry(archive_path, size, extract, extractor.extract_to)
+            entry.job.cancel_callbacks.append(extractor.stop)
+        else:
+            entry = BatchEntry(archive_path, size, lambda archive_path=archive_path: test_archive(archive_path))
+        entries.append(entry)
+
+    parent = current_job()
+    if parent is not None:
+        parent.total_bytes = sum(entry.size for entry in entries)
+        parent.cancel_callbacks.append(lambda: [entry.job.cancel() for entry in entries])
+        parent.pause_callbacks.append(lambda: [entry.job.pause() for entry in entries])
+        parent.resume_callbacks.append(lambda: [entry.job.resume() for entry in entries])
+
+    with futures.ThreadPoolExecutor(max_workers=workers or get_cpu_cores()) as executor:
+        pending = {executor.submit(entry.job.run) for entry in entries}
+        while pending:
+            _, pending = futures.wait(pending, timeout=THROUGHPUT_INTERVAL)
+            if parent is None:
+                continue
+            parent.done_bytes = sum(entry.done_bytes() for entry in entries)
+            parent.done_files = sum(1 for entry in entries if not entry.job.is_active())
+            try:
+                # Duraklatmada burada beklenir; iptal alt işlere geri çağrıyla iletilir
+                parent.checkpoint()
+            except JobCancelled:
+                pass
+    return entries
+
+def archive_batch_summary(entries, elapsed):
+    """Toplu işlem için (özet satırı, arşiv başına ayrıntı) döndürür"""
+    counts = {Job.DONE: 0, Job.FAILED: 0, Job.CANCELLED: 0}
+    lines = []
+    for entry in entries:
+        job = entry.job
+        counts[job.state] = counts.get(job.state, 0) + 1
+        name = os.path.basename(entry.archive_path)
+        if job.state == Job.DONE:
+            line = (f"{tr('success')}: {name} - {JobQueueModel.format_speed(job.average_speed())}, "
+                    f"{JobQueueModel.format_duration(job.elapsed())}")
+            if entry.output:
+                line += f" -> {entry.output}"
+        elif job.state == Job.CANCELLED:
+            line = f"{tr('job_state_cancelled')}: {name}"
+        else:
+            line = f"{tr('error')}: {name} - {job.error}"
+        lines.append(line)
+    summary = tr('batch_summary', succeeded=counts[Job.DONE], failed=counts[Job.FAILED],
+                 cancelled=counts[Job.CANCELLED], total=len(entries),
+                 elapsed=JobQueueModel.format_duration(elapsed))
+    return summary, "\n".join(lines)
+
+ARCHIVE_SIZE_WORKERS = min(4, os.cpu_count() or 1)
+JOB_DEFAULT_MAX_CONCURRENT = 2
+
+class JobCancelled(Exception):
+    """Kullanıcı işi iptal ettiğinde iş fonksiyonunun içinden fırlatılır"""
+
+# Çalışan işin iş parçacığına bağlı durumu
+_job_context = local()
+
+def current_job():
+    return getattr(_job_context, 'job', None)
+
+def job_checkpoint(done_bytes=0, done_files=0):
+    """Uzun döngülerden çağrılır: ilerlemeyi ekler, duraklatmada bekler, iptalde çıkar"""
+    job = getattr(_job_context, 'job', None)
+    if job is not None:
+        job.checkpoint(done_bytes, done_files)
+
+def job_set_total(total_bytes):
+    job = getattr(_job_context, 'job', None)
+    if job is not None:
+        job.total_bytes = total_bytes
+
+class JobSignals(QObject):
+    """Arka plan işinin sonucunu ana iş parçacığına taşır"""
+    finished = pyqtSignal(object, object)  # sonuç, hata
+
+class Job(QRunnable):
+    """İş havuzunda çalışan tek bir arka plan işi"""
+    QUEUED, RUNNING, PAUSED, DONE, FAILED, CANCELLED = range(6)
+    _ids = iter(range(1, sys.maxsize))
+
+    def __init__(self, func, title="", priority=0):
+        super().__init__()
+        # Nesne JobManager tarafından tutulur, Qt silmemeli
+        self.setAutoDelete(False)
+        self.job_id = next(Job._ids)
+        self.func = func
+        self.title = title
+        self.priority = priority
+        self.state = Job.QUEUED
+        self.error = None
+        self.done_bytes = 0
+        self.total_bytes = 0
+        self.started_at = None
+        self.finished_at = None
+        self.paused_seconds = 0.0
+        self.paused_at = None
+        self.done_files = 0
+        self.cancel_callbacks = []
+        self.pause_callbacks = []
+        self.resume_callbacks = []
+        self.signals = JobSignals()
+        self._resume_event = Event()
+        self._resume_event.set()
+        self._cancelled = False
+        self._speed_sample = (0.0, 0)
+        self.speed = 0.0
+
+    def run(self):
+        _job_context.job = self
+        self.started_at = time.monotonic()
+        self.state = Job.RUNNING
+        try:
+            self.checkpoint()
+            result = self.func()
+            if self._cancelled:
+                raise JobCancelled()
+        except JobCancelled as e:
+            self._finish(Job.CANCELLED, None, e)
+        except Exception as e:
+            self._finish(Job.FAILED, None, e)
+        else:
+            self._finish(Job.DONE, result, None)
+        finally:
+            _job_context.job = None
+
+    def _finish(self, state, result, error):
+        self.state = state
+        self.error = error
+        self.finished_at = time.monotonic()
+        self.signals.finished.emit(result, error)
+
+    def checkpoint(self, done_bytes=0, done_files=0):
+        self.done_bytes += done_bytes
+        self.done_files += done_files
+        if not self._resume_event.is_set():
+            self.state = Job.PAUSED
+            self._resume_event.wait()
+            if not self._cancelled:
+                self.state = Job.RUNNING
+        if self._cancelled:
+            raise JobCancelled()
+
+    def pause(self):
+        if self.state in (Job.QUEUED, Job.RUNNING) and self._resume_event.is_set():
+            self.paused_at = time.monotonic()
+            self._resume_event.clear()
+            if self.state == Job.QUEUED:
+                self.state = Job.PAUSED
+            for callback in self.pause_callbacks:
+                callback()
+
+    def resume(self):
+        if not self._resume_event.is_set():
+            if self.paused_at is not None and self.started_at is not None:
+                self.paused_seconds += time.monotonic() - max(self.paused_at, self.started_at)
+            self.paused_at = None
+            if self.started_at is None:
+                self.state = Job.QUEUED
+            for callback in self.resume_callbacks:
+                callback()
+            self._resume_event.set()
+
+    def cancelled(self):
+        return self._cancelled
+
+    def cancel(self):
+        self._cancelled = True
+        for callback in self.cancel_callbacks:
+            callback()
+        self._resume_event.set()
+
+    def is_active(self):
+        return self.state in (Job.QUEUED, Job.RUNNING, Job.PAUSED)
+
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at or self.paused_at or time.monotonic()
+        return max(0.0, end - self.started_at - self.paused_seconds)
+
+    def average_speed(self):
+        elapsed = self.elapsed()
+        return self.done_bytes / elapsed if elapsed > 0 else 0.0
+
+    def files_per_second(self):
+        elapsed = self.elapsed()
+        return self.done_files / elapsed if elapsed > 0 else 0.0
+
+    def sample_speed(self):
+        """Son örnekten bu yana geçen süredeki anlık hızı (bayt/sn) günceller"""
+        now = time.monotonic()
+        last_time, last_bytes = self._speed_sample
+        if self.state != Job.RUNNING:
+            self.speed = 0.0
+        elif last_time and now > last_time:
+            self.speed = (self.done_bytes - last_bytes) / (now - last_time)
+        self._speed_sample = (now, self.done_bytes)
+        return self.speed
+
+    def progress(self):
+        """0-100 arası ilerleme; toplam bilinmiyorsa None"""
+        if self.state == Job.DONE:
+            return 100
+        if self.total_bytes <= 0:
+            return None
+        return min(100, int(self.done_bytes * 100 / self.total_bytes))
+
+    def eta(self):
+        speed = self.average_speed()
+        if self.state != Job.RUNNING or self.total_bytes <= 0 or speed <= 0:
+            return None
+        return max(0.0, (self.total_bytes - self.done_bytes) / speed)
+
+class JobManager(QObject):
+    """Uzun işlemleri QThreadPool üzerinde kuyruğa alır; sonuç sinyalle bildirilir.
+
+    Havuzun iş parçacığı sayısı, aynı anda çalışabilecek G/Ç yoğun iş
+    sınırıdır (jobs/max_concurrent). Bekleyen işler önceliğe göre başlar;
+    duraklatılan bekleyen işler havuzdan çıkarılır ve devam ettirilince
+    yeniden kuyruğa girer.
+    """
+    job_started = pyqtSignal(object)
+    job_finished = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.pool = QThreadPool()
+        try:
+            max_jobs = int(get_config_value('jobs', 'max_concurrent', str(JOB_DEFAULT_MAX_CONCURRENT)))
+        except ValueError:
+            max_jobs = JOB_DEFAULT_MAX_CONCURRENT
+        self.pool.setMaxThreadCount(max(1, max_jobs))
+        self.jobs = []
+
+    def max_concurrent(self):
+        return self.pool.maxThreadCount()
+
+    def set_max_concurrent(self, count):
+        count = max(1, int(count))
+        self.pool.setMaxThreadCount(count)
+        set_config_value('jobs', 'max_concurrent', str(count))
+
+    def submit(self, func, on_finished=None, title="", priority=0):
+        """func arka planda çalışır; on_finished(sonuç, hata) ana iş parçacığında çağrılır"""
+        job = Job(func, title, priority)
+        self.jobs.append(job)
+        if on_finished is not None:
+            job.signals.finished.connect(on_finished)
+        job.signals.finished.connect(lambda result, error, job=job: self._job_done(job))
+        self.pool.start(job, priority)
+        self.job_started.emit(job)
+        return job
+
+    def _job_done(self, job):
+        if job in self.jobs:
+            self.jobs.remove(job)
+        self.job_finished.emit(job)
+
+    def set_priority(self, job, priority):
+        job.priority = priority
+        # Henüz başlamamış iş yeni öncelikle kuyruğa yeniden girer
+        if job.state == Job.QUEUED and self.pool.tryTake(job):
+            self.pool.start(job, priority)
+
+    def pause(self, job):
+        if job.state == Job.QUEUED:
+            self.pool.tryTake(job)
+        job.pause()
+
+    def resume(self, job):
+        was_waiting = job.started_at is None and job.state == Job.PAUSED
+        job.resume()
+        if was_waiting:
+            self.pool.start(job, job.priority)
+
+    def cancel(self, job):
+        if not job.is_active():
+            return
+        if job.started_at is None:
+            # Başlamamış iş havuzdan alınır ve hemen iptal edilmiş sayılır
+            self.pool.tryTake(job)
+            job._cancelled = True
+            job._finish(Job.CANCELLED, None, JobCancelled())
+        else:
+            job.cancel()
+
+    def wait(self):
+        """Çıkışta yarım kalmış arşiv bırakmamak için çalışan işlerin bitmesini bekler"""
+        for job in list(self.jobs):
+            if job.started_at is None:
+                self.cancel(job)
+            elif job.state == Job.PAUSED:
+                job.resume()
+        self.pool.waitForDone()
+
+class ArchiveSizeLoader(QObject):
+    """Klasör listesindeki arşivlerin orijinal boyutlarını arka planda hesaplar"""
+    size_ready = pyqtSignal(int, str, object)
+
+    def __init__(self, size_function, parent=None):
+        super().__init__(parent)
+        self.size_function = size_function
+        self.executor = futures.ThreadPoolExecutor(max_workers=ARCHIVE_SIZE_WORKERS,
+                                           thread_name_prefix="lintar-size")
+        self.futures = []
+
+    def start(self, generation, archive_paths):
+        for archive_path in archive_paths:
+            future = self.executor.submit(self._compute, generation, archive_path)
+            self.futures.append(future)
+
+    def _compute(self, generation, archive_path):
+        original_size = self.size_function(archive_path)
+        self.size_ready.emit(generation, archive_path, original_size)
+
+    def cancel(self):
+        """Henüz başlamamış işleri iptal eder; çalışanların sonucu nesil numarasıyla elenir"""
+        for future in self.futures:
+            future.cancel()
+        self.futures = []
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+# Dosya türü -> (tema ikonu, yedek ikon)
+FILE_ICON_THEMES = {
+    'folder': ("folder", "folder-open"),
+    'archive': ("package-x-generic", "application-x-archive"),
+    'image': ("image-x-generic", "image"),
+    'video': ("video-x-generic", "video"),
+    'audio': ("audio-x-generic", "audio"),
+    'text': ("text-x-generic", "text-plain"),
+    'script': ("text-x-script", "text-x-generic"),
+    'pdf': ("application-pdf", "x-office-document"),
+    'document': ("x-office-document", "application-msword"),
+    'spreadsheet': ("x-office-spreadsheet", "application-vnd.ms-excel"),
+    'presentation': ("x-office-presentation", "application-vnd.ms-powerpoint"),
+    'executable': ("application-x-executable", "application-x-executable"),
+    'default': ("text-x-generic", "unknown"),
+}
+
+# Uzantı -> dosya türü
+FILE_ICON_KINDS = {}
+for _kind, _extensions in (
+        ('archive', ['.zip', '.tar', '.gz', '.bz2', '.xz', '.7z', '.rar']),
+        ('image', ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.ico']),
+        ('video', ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm']),
+        ('audio', ['.mp3', '.wav', '.ogg', '.flac', '.aac', '.m4a']),
+        ('text', ['.txt', '.log', '.md', '.rst']),
+        ('script', ['.py', '.java', '.c', '.cpp', '.h', '.js', '.html', '.css', '.php', '.sh']),
+        ('pdf', ['.pdf']),
+        ('document', ['.doc', '.docx', '.odt']),
+        ('spreadsheet', ['.xls', '.xlsx', '.ods']),
+        ('presentation', ['.ppt', '.pptx', '.odp']),
+        ('executable', ['.exe', '.msi', '.deb', '.rpm', '.appimage'])):
+    for _ext in _extensions:
+        FILE_ICON_KINDS[_ext] = _kind
+del _kind, _extensions, _ext
+
+def scan_directory(path):
+    """Klasörü os.scandir ile okur; (klasör satırları, (dosya satırı, stat) çiftleri) döndürür"""
+    dirs = []
+    files = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir():
+                    stat_result = entry.stat()
+                    dirs.append(ListingRow(entry.name, True, date=stat_result.st_mtime))
+                elif entry.is_file():
+                    stat_result = entry.stat()
+                    is_archive = entry.name.lower().endswith(('.zip', '.tar.gz', '.tar.bz2', '.tar.xz', '.tar', '.rar', '.7z'))
+                    # Orijinal boyut None: arka planda hesaplanacak
+                    files.append((ListingRow(entry.name, False, None if is_archive else stat_result.st_size,
+                                             stat_result.st_size, stat_result.st_mtime, is_archive),
+                                  stat_result))
+            except OSError:
+                continue
+    dirs.sort(key=lambda row: row.name)
+    files.sort(key=lambda item: item[0].name)
+    return dirs, files
+
+class ListingRow:
+    """Dosya listesindeki tek bir satır; hücre metinleri istenince üretilir"""
+    __slots__ = ('name', 'is_dir', 'size', 'compressed_size', 'date', 'is_archive')
+
+    def __init__(self, name, is_dir, size=0, compressed_size=0, date='', is_archive=False):
+        self.name = name
+        self.is_dir = is_dir
+        self.size = size                       # Orijinal boyut; None ise hesaplanıyor
+        self.compressed_size = compressed_size
+        self.date = date                       # Zaman damgası (float) veya hazır metin
+        self.is_archive = is_archive
+
+class ArchiveIndex:
+    """Arşiv içeriğinin klasör ağacı.
+
+    Arşiv bir kez okunduktan sonra her klasörün çocukları ve toplam boyutları
+    bellekte tutulur; arşiv içinde gezinmek yalnızca bir sözlük aramasıdır.
+    """
+
+    def __init__(self, entries):
+        self.children = {'': {}}  # klasör yolu -> {ad: ListingRow}
+        self.dir_rows = {}        # klasör yolu -> klasörün kendi satırı
+        self.members = {}         # yol -> arşivdeki özgün üye adı
+        for entry in entries:
+            self.add_entry(entry)
+
+    def _ensure_dir(self, path, date=''):
+        if path in self.children:
+            return self.dir_rows.get(path)
+        parent, _, name = path.rpartition('/')
+        self._ensure_dir(parent, date)
+        row = ListingRow(name, True, 0, 0, date)
+        self.children[parent][name] = row
+        self.children[path] = {}
+        self.dir_rows[path] = row
+        return row
+
+    def add_entry(self, entry):
+        path = entry.name.strip('/')
+        if not path:
+            return
+        self.members[path] = entry.name
+        if entry.is_dir:
+            row = self._ensure_dir(path, entry.date)
+            if row is not None:
+                row.date = entry.date
+            return
+        parent, _, name = path.rpartition('/')
+        self._ensure_dir(parent, entry.date)
+        self.children[parent][name] = ListingRow(name, False, entry.size, entry.compressed_size, entry.date)
+        # Boyutları üst klasörlere ekle
+        while parent:
+            dir_row = self.dir_rows[parent]
+            dir_row.size += entry.size
+            dir_row.compressed_size += entry.compressed_size
+            parent = parent.rpartition('/')[0]
+
+    def has_dir(self, path):
+        return path in self.children
+
+    def list_dir(self, path):
+        return list(self.children.get(path, {}).values())
+
+    def resolve(self, base, names):
+        """base klasöründe görünen adları tam üye adlarına çevirir; klasörler
+        tüm içerikleriyle genişletilir, her üye bir kez döner"""
+        resolved = []
+        seen = set()
+
+        def add(path):
+            member = self.members.get(path)
+            if member is not None and member not in seen:
+                seen.add(member)
+                resolved.append(member)
+
+        for name in names:
+            path = f"{base}/{name}" if base else name
+            add(path)
+            if path not in self.children:
+                continue
+            pending = [path]
+            while pending:
+                folder = pending.pop()
+                for child_name, row in self.children[folder].items():
+                    child = f"{folder}/{child_name}"
+                    add(child)
+                    if row.is_dir:
+                        pending.append(child)
+        return resolved
+
+def read_archive_listing(archive_path):
+    """Arşivdeki tüm öğeleri tam yollarıyla okur"""
+    all_items = []
+    lower_path = archive_path.lower()
+
+    if lower_path.endswith('.zip'):
+        try:
+            with ZipCentralDirectory(archive_path) as central_directory:
+                return central_directory.listing_rows()
+        except zipfile.BadZipFile:
+            pass
+        # Hızlı okuyucunun çözemediği arşivler için zipfile'a dön
+        with zipfile.ZipFile(archive_path, 'r') as zf:
+            for info in zf.infolist():
+                name = info.filename.rstrip('/')
+                if name:
+                    all_items.append(ListingRow(
+                        name,
+                        info.is_dir(),
+                        info.file_size,
+                        info.compress_size,
+                        datetime.datetime(*info.date_time).strftime('%Y-%m-%d %H:%M:%S')
+                    ))
+
+    elif lower_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')):
+        if lower_path.endswith(('.tar.gz', '.tar.bz2', '.tar.xz')):
+            try:
+                return TarSeekIndex.open(archive_path).listing_rows()
+            except Exception:
+                pass
+        with tarfile.open(archive_path, 'r:*') as tf:
+            for member in tf.getmembers():
+                name = member.name.rstrip('/')
+                if name:
+                    all_items.append(ListingRow(
+                        name,
+                        member.isdir(),
+                        member.size,
+                        member.size,
+                        member.mtime
+                    ))
+
+    elif lower_path.endswith('.7z'):
+        if check_command_exists('7z'):
+            result = subprocess.run(['7z', 'l', '-slt', archive_path], 
+                                  capture_output=True, text=True, timeout=30)
+            if result.returncode == 0:
+                parse_7z_listing(result.stdout, all_items)
+
+    elif lower_path.endswith('.rar'):
+        if check_command_exists('7z'):
+            result = subprocess.run(['7z', 'l', '-slt', archive_path], 
+                                  capture_output=True, text=True, timeout=30)
+            if result.returncode == 0:
+                parse_7z_listing(result.stdout, all_items)
+        elif check_command_exists('unrar'):
+            result = subprocess.run(['unrar', 'l', archive_path], 
+                                  capture_output=True, text=True, timeout=30)
+            if result.returncode == 0:
+                parse_unrar_listing(result.stdout, all_items)
+        elif check_command_exists('rar'):
+            result = subprocess.run(['rar', 'l', archive_path], 
+                                  capture_output=True, text=True, timeout=30)
+            if result.returncode == 0:
+                parse_unrar_listing(result.stdout, all_items)
+
+    return all_items
+
+def parse_7z_listing(output, contents):
+    """7z liste çıktısını parse eder"""
+    current_file = {}
+    # "----------" satırından önceki blok arşivin kendisini anlatır
+    in_entries = '----------' not in output
+    for line in output.split('\n'):
+        line = line.strip()
+        if not in_entries:
+            in_entries = line.startswith('----------')
+            continue
+        if line.startswith('Path = '):
+            if current_file and 'name' in current_file:
+                contents.append(_listing_row_from_7z(current_file))
+            current_file = {'name': line.split('=', 1)[1].strip().rstrip('/')}
+        elif line.startswith('Size = '):
+            try:
+                current_file['size'] = int(line.split('=', 1)[1].strip())
+            except:
+                current_file['size'] = 0
+        elif line.startswith('Packed Size = '):
+            try:
+                current_file['compressed_size'] = int(line.split('=', 1)[1].strip())
+            except:
+                current_file['compressed_size'] = 0
+        elif line.startswith('Modified = '):
+            current_file['date'] = line.split('=', 1)[1].strip()
+        elif line.startswith('Attributes = ') or line.startswith('Attr = '):
+            attrs = line.split('=', 1)[1].strip()
+            current_file['is_dir'] = 'D' in attrs
+
+    if current_file and 'name' in current_file:
+        contents.append(_listing_row_from_7z(current_file))
+
+def _listing_row_from_7z(fields):
+    return ListingRow(fields['name'], fields.get('is_dir', False), fields.get('size', 0),
+                      fields.get('compressed_size', 0), fields.get('date', ''))
+
+def parse_unrar_listing(output, contents):
+    """unrar/rar liste çıktısını parse eder"""
+    lines = output.split('\n')
+    in_file_list = False
+
+    for line in lines:
+        if '----------' in line or '--------' in line:
+            in_file_list = not in_file_list
+            continue
+
+        if not in_file_list or not line.strip():
+            continue
+
+        # unrar -v formatı: Attributes Size Packed Ratio Date Time Name
+        # Örnek: -rw-r--r-- 11410 11410 100% 01-01-25 12:00 dosya.txt
+        parts = line.split()
+        if len(parts) < 7:
+            continue
+
+        try:
+            # İlk kısım attributes (örn: -rw-r--r-- veya drwxr-xr-x)
+            attrs = parts[0]
+
+            # Boyut bilgileri (sayısal değerler)
+            size = 0
+            compressed_size = 0
+            date = ''
+            time = ''
+            name_start_idx = 1
+
+            # Sayısal değerleri bul
+            for i in range(1, len(parts)):
+                if parts[i].isdigit():
+                    if size == 0:
+                        size = int(parts[i])
+                    elif compressed_size == 0:
+                        compressed_size = int(parts[i])
+                elif '%' in parts[i]:
+                    # Ratio atla
+                    continue
+                elif '-' in parts[i] or '.' in parts[i]:
+                    # Tarih bulundu
+                    date_parts = parts[i].replace('.', '-').split('-')
+                    if len(date_parts) == 3 and all(p.isdigit() for p in date_parts):
+                        date = parts[i]
+                        if i + 1 < len(parts) and ':' in parts[i + 1]:
+                            time = parts[i + 1]
+                            name_start_idx = i + 2
+                        break
+
+            # Dosya adı tarih/saatten sonra
+            if name_start_idx < len(parts):
+                filename = ' '.join(parts[name_start_idx:])
+
+                # Klasör kontrolü
+                is_dir = attrs.startswith('d') or filename.endswith('/')
+                filename = filename.rstrip('/')
+
+                if filename:
+                    contents.append(ListingRow(filename, is_dir, size, compressed_size, f"{date} {time}"))
+        except:
+            pass
+
+class FileListModel(QAbstractTableModel):
+    """Klasör ve arşiv listeleri için sanal tablo modeli"""
+    COLUMN_COUNT = 6
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        self.rows = []
+        self.archive_mode = False
+        self.headers = [
+            lang_manager.get_text("table_header_name"),
+            lang_manager.get_text("table_header_original_size"),
+            lang_manager.get_text("table_header_compressed_size"),
+            lang_manager.get_text("table_header_type"),
+            lang_manager.get_text("table_header_modified_date"),
+            lang_manager.get_text("table_header_compression_ratio")
+        ]
+
+    def set_rows(self, rows, archive_mode=False):
+        self.beginResetModel()
+        self.rows = rows
+        self.archive_mode = archive_mode
+        self.endResetModel()
+
+    def row_at(self, row):
+        return self.rows[row]
+
+    def find_row(self, name):
+        for row, entry in enumerate(self.rows):
+            if entry.name == name:
+                return row
+        return -1
+
+    def refresh_row(self, row):
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.COLUMN_COUNT - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return self.cell_text(entry, column)
+        if role == Qt.DecorationRole and column == 0:
+            return self.window.get_file_icon(entry.name, entry.is_dir)
+        return None
+
+    def cell_text(self, entry, column):
+        if column == 0:
+            return entry.name
+        if column == 3:
+            if entry.is_dir:
+                return lang_manager.get_text("table_header_type_folder")
+            return tr('file') if self.archive_mode else self.window.get_file_type(entry.name, is_dir=False)
+        if column == 4:
+            if isinstance(entry.date, str):
+                return entry.date
+            return self.window.format_timestamp(entry.date)
+
+        if self.archive_mode:
+            if column == 1:
+                return self.window.format_size(entry.size)
+            if column == 2:
+                return self.window.format_size(entry.compressed_size)
+            if entry.size > 0 and entry.compressed_size > 0:
+                return self.window.calculate_compression_ratio(entry.size, entry.compressed_size)
+            return 'N/A'
+
+        # Dosya sistemi görünümü
+        if entry.is_dir:
+            return "N/A" if column == 5 else ""
+        if column == 2:
+            return self.window.format_size(entry.compressed_size)
+        if not entry.is_archive:
+            return self.window.format_size(entry.compressed_size) if column == 1 else "-"
+        if entry.size is None:
+            # Orijinal boyut arka planda hesaplanıyor
+            return "..."
+        if entry.size > 0:
+            if column == 1:
+                return self.window.format_size(entry.size)
+            return self.window.calculate_compression_ratio(entry.size, entry.compressed_size)
+        # Orijinal boyut bulunamadı, sıkıştırılmış boyutu göster
+        return self.window.format_size(entry.compressed_size) if column == 1 else "N/A"
+
+class JobQueueModel(QAbstractTableModel):
+    """İş kuyruğu paneli için tablo modeli; bitmiş işler temizlenene kadar kalır"""
+    COLUMN_COUNT = 6
+    STATE_KEYS = {
+        Job.QUEUED: "job_state_queued",
+        Job.RUNNING: "job_state_running",
+        Job.PAUSED: "job_state_paused",
+        Job.DONE: "job_state_done",
+        Job.FAILED: "job_state_failed",
+        Job.CANCELLED: "job_state_cancelled",
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = []
+        self.headers = [
+            lang_manager.get_text("job_column_name"),
+            lang_manager.get_text("job_column_status"),
+            lang_manager.get_text("job_column_priority"),
+            lang_manager.get_text("job_column_progress"),
+            lang_manager.get_text("job_column_speed"),
+            lang_manager.get_text("job_column_eta"),
+        ]
+
+    def add_job(self, job):
+        self.beginInsertRows(QModelIndex(), len(self.jobs), len(self.jobs))
+        self.jobs.append(job)
+        self.endInsertRows()
+
+    def clear_finished(self):
+        self.beginResetModel()
+        self.jobs = [job for job in self.jobs if job.is_active()]
+        self.endResetModel()
+
+    def refresh(self):
+        for job in self.jobs:
+            job.sample_speed()
+        if self.jobs:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.jobs) - 1, self.COLUMN_COUNT - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.jobs)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    @staticmethod
+    def format_speed(bytes_per_second):
+        return f"{bytes_per_second / (1024 * 1024):.1f} MB/s"
+
+    @staticmethod
+    def format_duration(seconds):
+        seconds = int(seconds)
+        return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        job = self.jobs[index.row()]
+        column = index.column()
+        if role == Qt.ToolTipRole:
+            if job.state == Job.FAILED and job.error is not None:
+                return str(job.error)
+            if column == 4 and job.started_at is not None:
+                speed = self.format_speed(job.average_speed())
+                if job.done_files:
+                    speed += f", {job.files_per_second():.1f} {tr('job_files_per_second')}"
+                return tr('job_average_speed', speed=speed)
+            return job.title
+        if role != Qt.DisplayRole:
+            return None
+        if column == 0:
+            return job.title
+        if column == 1:
+            return tr(self.STATE_KEYS[job.state])
+        if column == 2:
+            return str(job.priority)
+        if column == 3:
+            progress = job.progress()
+            return "-" if progress is None else f"{progress}%"
+        if column == 4:
+            if job.state == Job.RUNNING:
+                return self.format_speed(job.speed)
+            if job.started_at is not None and job.done_bytes:
+                return self.format_speed(job.average_speed())
+            return "-"
+        eta = job.eta()
+        return "-" if eta is None else self.format_duration(eta)
+
+class JobQueuePanel(QDockWidget):
+    """Arka plan işlerini listeleyen, duraklatma/iptal/öncelik denetimli kuyruk paneli"""
+
+    def __init__(self, manager, parent=None):
+        super().__init__(tr('job_queue'), parent)
+        self.setObjectName("JobQueuePanel")
+        self.manager = manager
+        self.model = JobQueueModel(self)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, JobQueueModel.COLUMN_COUNT):
+            self.table.horizontalHeader().setSectionResizeMode(column, QHeaderView.ResizeToContents)
+
+        self.pause_button = QPushButton(tr('job_pause'))
+        self.pause_button.clicked.connect(self.pause_selected)
+        self.resume_button = QPushButton(tr('job_resume'))
+        self.resume_button.clicked.connect(self.resume_selected)
+        self.cancel_button = QPushButton(tr('job_cancel'))
+        self.cancel_button.clicked.connect(self.cancel_selected)
+        self.priority_up_button = QPushButton(tr('job_priority_up'))
+        self.priority_up_button.clicked.connect(lambda: self.change_priority(1))
+        self.priority_down_button = QPushButton(tr('job_priority_down'))
+        self.priority_down_button.clicked.connect(lambda: self.change_priority(-1))
+        self.clear_button = QPushButton(tr('job_clear_finished'))
+        self.clear_button.clicked.connect(self.model.clear_finished)
+
+        self.concurrency_spinbox = QSpinBox()
+        self.concurrency_spinbox.setRange(1, max(1, os.cpu_count() or 1) * 2)
+        self.concurrency_spinbox.setValue(manager.max_concurrent())
+        self.concurrency_spinbox.valueChanged.connect(manager.set_max_concurrent)
+
+        button_layout = QHBoxLayout()
+        for button in (self.pause_button, self.resume_button, self.cancel_button,
+                       self.priority_up_button, self.priority_down_button, self.clear_button):
+            button_layout.addWidget(button)
+        button_layout.addStretch()
+        button_layout.addWidget(QLabel(tr('job_max_concurrent')))
+        button_layout.addWidget(self.concurrency_spinbox)
+
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.addWidget(self.table)
+        layout.addLayout(button_layout)
+        self.setWidget(container)
+
+        # Hız ve kalan süre yarım saniyede bir güncellenir
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(500)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+        manager.job_started.connect(self.on_job_started)
+        manager.job_finished.connect(lambda job: self.refresh())
+
+    def on_job_started(self, job):
+        self.model.add_job(job)
+        self.show()
+        self.refresh_timer.start()
+
+    def refresh(self):
+        self.model.refresh()
+        if not self.manager.jobs:
+            self.refresh_timer.stop()
+
+    def selected_jobs(self):
+        rows = sorted({index.row() for index in self.table.selectionModel().selectedRows()})
+        return [self.model.jobs[row] for row in rows]
+
+    def pause_selected(self):
+        for job in self.selected_jobs():
+            self.manager.pause(job)
+        self.refresh()
+
+    def resume_selected(self):
+        for job in self.selected_jobs():
+            self.manager.resume(job)
+        self.refresh_timer.start()
+        self.refresh()
+
+    def cancel_selected(self):
+        for job in self.selected_jobs():
+            self.manager.cancel(job)
+        self.refresh()
+
+    def change_priority(self, delta):
+        for job in self.selected_jobs():
+            self.manager.set_priority(job, job.priority + delta)
+        self.refresh()
 
 class LanguageManager:
     def __init__(self):
@@ -180,10 +3899,12 @@ class LanguageManager:
             self.load_languages()
 
 lang_manager = LanguageManager()
+archive_size_cache = ArchiveSizeCache()
+job_manager = JobManager()
 
 # Kısayol fonksiyon
-def tr(key):
-    return lang_manager.get_text(key)
+def tr(key, **kwargs):
+    return lang_manager.get_text(key, **kwargs)
 
 # Theme management
 def apply_theme(app, theme_name):
@@ -193,7 +3914,7 @@ def apply_theme(app, theme_name):
                 background-color: #2b2b2b;
                 color: #ffffff;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #1e1e1e;
                 color: #ffffff;
                 gridline-color: #3d3d3d;
@@ -272,7 +3993,7 @@ def apply_theme(app, theme_name):
                 background-color: #f5f5f5;
                 color: #000000;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #ffffff;
                 color: #000000;
                 gridline-color: #e0e0e0;
@@ -537,8 +4258,7 @@ class SettingsDialog(QDialog):
                                     lang_manager.get_text("settings_reset_confirm"),
                                     QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            if os.path.exists(CONFIG_FILE):
-                os.remove(CONFIG_FILE)
+            config_store.reset()
             QMessageBox.information(self, lang_manager.get_text("success"), lang_manager.get_text("settings_reset_success"))
             self.close()
     
@@ -949,158 +4669,12 @@ class CompressionDialog(QDialog):
         if directory:
             self.destination_path_edit.setText(directory)
 
-    def _get_zip_compression_level(self, level_text):
-        if level_text == lang_manager.get_text("compression_level_store"):
-            return zipfile.ZIP_STORED, zlib.Z_NO_COMPRESSION
-        elif level_text == lang_manager.get_text("compression_level_fast"):
-            return zipfile.ZIP_DEFLATED, zlib.Z_BEST_SPEED
-        elif level_text == lang_manager.get_text("compression_level_normal"):
-            return zipfile.ZIP_DEFLATED, zlib.Z_DEFAULT_COMPRESSION
-        elif level_text == lang_manager.get_text("compression_level_good"):
-            return zipfile.ZIP_DEFLATED, 6
-        elif level_text == lang_manager.get_text("compression_level_best"):
-            return zipfile.ZIP_DEFLATED, zlib.Z_BEST_COMPRESSION
-        return zipfile.ZIP_DEFLATED, zlib.Z_DEFAULT_COMPRESSION
-
-    def _create_python_zip_archive(self, archive_path, sources, password=None, compression_level_text="Normal"):
-        zip_compression_method, zlib_compression_level = self._get_zip_compression_level(compression_level_text)
-        try:
-            with zipfile.ZipFile(archive_path, 'w',
-                                 compression=zip_compression_method,
-                                 compresslevel=zlib_compression_level) as zf:
-                if password:
-                    zf.setpassword(password.encode('utf-8'))
-
-                for source in sources:
-                    if os.path.isfile(source):
-                        zf.write(source, arcname=os.path.basename(source))
-                    elif os.path.isdir(source):
-                        for root, _, files in os.walk(source):
-                            for file in files:
-                                file_path = os.path.join(root, file)
-                                arcname = os.path.relpath(file_path, os.path.dirname(source))
-                                zf.write(file_path, arcname=arcname)
-                    else:
-                        print(f"Warning: {source} is invalid, skipping.")
-            return True, None
-        except Exception as e:
-            return False, str(e)
-
-    def _create_tar_archive(self, archive_path, sources, compression_mode="gz"):
-        mode = f"w:{compression_mode}" if compression_mode else "w"
-        try:
-            with tarfile.open(archive_path, mode) as tar:
-                for source in sources:
-                    tar.add(source, arcname=os.path.basename(source))
-            return True, None
-        except Exception as e:
-            return False, str(e)
-
-    def _run_external_command(self, command_parts, cwd, password=None):
-        try:
-            process = subprocess.run(
-                command_parts,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return True, None
-        except subprocess.CalledProcessError as e:
-            error_output = e.stderr if e.stderr else e.stdout
-            return False, f"Command error: {error_output}"
-        except FileNotFoundError:
-            return False, lang_manager.get_text("external_tool_not_found", tool_name=command_parts[0])
-        except Exception as e:
-            return False, str(e)
-
-    def _create_7z_archive(self, archive_path, sources, password=None, level_text="Normal", solid=False, split_volumes=None):
-        command_name = "7z"
-        if not check_command_exists(command_name):
-            install_cmds = get_install_commands(command_name)
-            QMessageBox.warning(self, lang_manager.get_text("external_tool_required_title", tool_name=command_name),
-                                lang_manager.get_text("external_tool_required_text", format_name=".7z", tool_name=command_name) +
-                                "\n\n" + lang_manager.get_text("external_tool_required_info", install_commands=install_cmds))
-            return False, "7z program not found"
-
-        args = ["a", archive_path]
-        
-        if level_text == lang_manager.get_text("compression_level_store"):
-            args.extend(["-mx0"])
-        elif level_text == lang_manager.get_text("compression_level_fast"):
-            args.extend(["-mx1"])
-        elif level_text == lang_manager.get_text("compression_level_normal"):
-            args.extend(["-mx5"])
-        elif level_text == lang_manager.get_text("compression_level_good"):
-            args.extend(["-mx7"])
-        elif level_text == lang_manager.get_text("compression_level_best"):
-            args.extend(["-mx9"])
-
-        if password:
-            args.append(f"-p{password}")
-            args.append("-mhe=on")
-
-        if solid:
-            args.append("-ms=on")
-        
-        if split_volumes:
-            args.append(f"-v{split_volumes}")
-
-        for source in sources:
-            args.append(source)
-        
-        command_cwd = os.path.dirname(archive_path) or os.getcwd()
-        return self._run_external_command([command_name] + args, command_cwd)
-
-    def _create_rar_archive(self, archive_path, sources, password=None, level_text="Normal", solid=False, split_volumes=None):
-        command_name = "rar"
-        if not check_command_exists(command_name):
-            install_cmds = get_install_commands(command_name)
-            QMessageBox.warning(self, lang_manager.get_text("external_tool_required_title", tool_name=command_name),
-                                lang_manager.get_text("external_tool_required_text", format_name=".rar", tool_name=command_name) +
-                                "\n\n" + lang_manager.get_text("external_tool_required_info", install_commands=install_cmds))
-            return False, "rar program not found"
-
-        args = ["a", "-ep1"]
-        
-        rar_levels = {
-            lang_manager.get_text("compression_level_store"): "-m0",
-            lang_manager.get_text("compression_level_fast"): "-m1",
-            lang_manager.get_text("compression_level_normal"): "-m3",
-            lang_manager.get_text("compression_level_good"): "-m4",
-            lang_manager.get_text("compression_level_best"): "-m5"
-        }
-        args.append(rar_levels.get(level_text, "-m3"))
-
-        if password:
-            args.append(f"-p{password}")
-            args.append("-hp")
-
-        if solid:
-            args.append("-s")
-        
-        if split_volumes:
-            args.append(f"-v{split_volumes}")
-
-        args.append(archive_path)
-
-        common_parent_dir = None
-        if sources:
-            common_parent_dir = os.path.commonpath(sources)
-            if os.path.isfile(common_parent_dir):
-                common_parent_dir = os.path.dirname(common_parent_dir)
-
-            rar_sources = []
-            for source in sources:
-                rel_path = os.path.relpath(source, common_parent_dir)
-                rar_sources.append(rel_path)
-            
-            args.extend(rar_sources)
-        else:
-            return False, lang_manager.get_text("no_sources_selected")
-
-        command_cwd = common_parent_dir if common_parent_dir else os.getcwd()
-        return self._run_external_command([command_name] + args, command_cwd)
+    def _compression_level(self, level_text):
+        """Seçili düzey metnini COMPRESSION_LEVELS anahtarına çevirir"""
+        for level in COMPRESSION_LEVELS:
+            if level_text == lang_manager.get_text(f"compression_level_{level}"):
+                return level
+        return 'normal'
 
     def start_compression(self):
         archive_name = self.archive_name_edit.text()
@@ -1168,72 +4742,62 @@ class CompressionDialog(QDialog):
         error_message = ""
         
         # Bilinmeyen format kontrolü
-        if selected_format not in [".zip", ".tar.gz", ".tar.bz2", ".tar.xz", ".7z", ".rar"]:
+        if selected_format not in ARCHIVE_FORMATS:
             QMessageBox.warning(self, lang_manager.get_text("compression_error_title"),
                                 lang_manager.get_text("unknown_format", format=selected_format))
             return
 
-        # Progress dialog göster
-        progress = QProgressDialog(tr('compressing', file_name=archive_name + selected_format), tr('cancel'), 0, 0, self)
-        progress.setWindowTitle(tr('compress'))
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.show()
-        
-        # İşlemi thread'de çalıştır
-        from PyQt5.QtCore import QThread, QTimer
-        
+        # Gereken harici araç iş kuyruğa alınmadan denetlenir
+        command_name = archive_creation_tool(selected_format)
+        if command_name and not check_command_exists(command_name):
+            install_cmds = get_install_commands(command_name)
+            QMessageBox.warning(self, lang_manager.get_text("external_tool_required_title", tool_name=command_name),
+                                lang_manager.get_text("external_tool_required_text", format_name=selected_format, tool_name=command_name) +
+                                "\n\n" + lang_manager.get_text("external_tool_required_info", install_commands=install_cmds))
+            return
+
+        level = self._compression_level(selected_level)
+
+        # İşlem arka planda çalışır, sonuç sinyalle gelir
         def run_compression():
             nonlocal success, error_message
             log_command(tr('compress_started') + f": {archive_name + selected_format}", f"Format: {selected_format}, {tr('compression_level')}: {selected_level}")
-            if selected_format == ".zip":
-                if check_command_exists("7z"):
-                    success, error_message = self._create_7z_archive(full_archive_path, self.selected_sources,
-                                                                      password if enable_encryption else None,
-                                                                      selected_level,
-                                                                      solid_compression, split_volumes)
-                else:
-                    success, error_message = self._create_python_zip_archive(full_archive_path, self.selected_sources,
-                                                                             password if enable_encryption else None,
-                                                                             selected_level)
-                
-            elif selected_format == ".tar.gz":
-                success, error_message = self._create_tar_archive(full_archive_path, self.selected_sources, "gz")
-            elif selected_format == ".tar.bz2":
-                success, error_message = self._create_tar_archive(full_archive_path, self.selected_sources, "bz2")
-            elif selected_format == ".tar.xz":
-                success, error_message = self._create_tar_archive(full_archive_path, self.selected_sources, "xz")
-            elif selected_format == ".7z":
-                success, error_message = self._create_7z_archive(full_archive_path, self.selected_sources,
-                                                                  password if enable_encryption else None,
-                                                                  selected_level, solid_compression, split_volumes)
-            elif selected_format == ".rar":
-                success, error_message = self._create_rar_archive(full_archive_path, self.selected_sources,
-                                                                  password if enable_encryption else None,
-                                                                  selected_level, solid_compression, split_volumes)
-        
-        # Thread'i başlat
-        thread = Thread(target=run_compression)
-        thread.start()
-        
-        # Thread'in bitmesini bekle
-        while thread.is_alive():
-            QApplication.processEvents()
-            thread.join(0.1)
-        
-        progress.close()
-        
-        if success:
-            log_command(tr('compress_success') + f": {archive_name + selected_format}", tr('success'))
-            QMessageBox.information(self, lang_manager.get_text("compression_success_title"),
-                                    lang_manager.get_text("compression_success_text", archive_name=archive_name + selected_format))
-            self.accept()
-        else:
-            log_command(tr('compress_error') + f": {archive_name + selected_format}", f"{tr('error')}: {error_message}")
-            QMessageBox.critical(self, lang_manager.get_text("compression_error_title"),
-                                 lang_manager.get_text("compression_error_text", archive_name=archive_name + selected_format, error_message=error_message))
+            try:
+                create_archive(full_archive_path, self.selected_sources,
+                               password if enable_encryption else None,
+                               level, solid_compression, split_volumes)
+                success = True
+            except JobCancelled:
+                raise
+            except Exception as e:
+                error_message = str(e)
+        
+        # Pencere hemen kapanır; sonuç ana pencereye bildirilir
+        window = self.parent()
+
+        def on_finished(result, error):
+            nonlocal error_message
+            if isinstance(error, JobCancelled):
+                # Yarım kalan dosyaları create_archive temizler; mevcut arşive dokunulmaz
+                return
+            if error is not None:
+                error_message = str(error)
+            if success:
+                log_command(tr('compress_success') + f": {archive_name + selected_format}", tr('success'))
+                window.show_job_message(lang_manager.get_text("compression_success_text", archive_name=archive_name + selected_format))
+                if not window.current_archive and os.path.abspath(window.address_bar.text()) == os.path.abspath(archive_directory):
+                    window.set_current_path(archive_directory, add_to_history=False)
+            else:
+                log_command(tr('compress_error') + f": {archive_name + selected_format}", f"{tr('error')}: {error_message}")
+                QMessageBox.critical(window, lang_manager.get_text("compression_error_title"),
+                                     lang_manager.get_text("compression_error_text", archive_name=archive_name + selected_format, error_message=error_message))
+        
+        job_manager.submit(run_compression, on_finished, title=tr('compressing', file_name=archive_name + selected_format))
+        self.accept()
 
 class LinTARDummyApp(QMainWindow):
+    directory_scanned = pyqtSignal(int, str, object, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("LinTAR - Archive Manager for Linux Systems (v1.0.1 Beta)")
@@ -1248,14 +4812,20 @@ class LinTARDummyApp(QMainWindow):
 
         self.history = []
         self.history_index = -1
-        self.extract_worker = None
-        self.extract_thread = None
-        self.progress_dialog = None
         self.current_archive = None  # Şu anda açık arşiv
         self.archive_contents = []   # Arşiv içeriği
+        self.archive_index = None    # Açık arşivin klasör dizini
+        self.listing_generation = 0  # Klasör listesi her yenilendiğinde artar
+        self.pending_size_rows = {}  # Orijinal boyutu beklenen arşiv yolu -> satır
+        self.size_loader = ArchiveSizeLoader(self.get_archive_original_size, self)
+        self.size_loader.size_ready.connect(self.on_archive_size_ready)
 
+        self.icon_cache = {}
         self.init_ui()
-        self.set_current_path(os.path.expanduser("~"), add_to_history=True)
+        startup_profile.mark('window ui')
+        # Ana klasör pencere göründükten sonra arka planda listelenir
+        self.directory_scanned.connect(self.on_directory_scanned)
+        self.set_current_path(os.path.expanduser("~"), add_to_history=True, background=True)
         
         # Tema uygula
         saved_theme = get_config_value('general', 'theme', 'system_default')
@@ -1296,6 +4866,17 @@ class LinTARDummyApp(QMainWindow):
         
         file_menu.addSeparator()
         
+        add_files_action = QAction(lang_manager.get_text("add_files_to_archive"), self)
+        add_files_action.setShortcut("Ctrl+Shift+A")
+        add_files_action.triggered.connect(lambda: self.add_to_archive(folder=False))
+        file_menu.addAction(add_files_action)
+        
+        add_folder_action = QAction(lang_manager.get_text("add_folder_to_archive"), self)
+        add_folder_action.triggered.connect(lambda: self.add_to_archive(folder=True))
+        file_menu.addAction(add_folder_action)
+        
+        file_menu.addSeparator()
+        
         exit_action = QAction(lang_manager.get_text("exit_app"), self)
         exit_action.setShortcut("Ctrl+Q")
         exit_action.triggered.connect(self.close)
@@ -1358,6 +4939,12 @@ class LinTARDummyApp(QMainWindow):
         self.statusbar_action.triggered.connect(self.toggle_statusbar)
         view_menu.addAction(self.statusbar_action)
 
+        # İş kuyruğu paneli; yeni iş eklendiğinde kendiliğinden açılır
+        self.job_panel = JobQueuePanel(job_manager, self)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.job_panel)
+        self.job_panel.hide()
+        view_menu.addAction(self.job_panel.toggleViewAction())
+
         # Help Menu
         help_menu = menubar.addMenu(lang_manager.get_text("help_menu"))
         
@@ -1455,22 +5042,17 @@ class LinTARDummyApp(QMainWindow):
         nav_layout.addWidget(self.address_bar)
 
         # File List Table
-        self.file_list_table = QTableWidget()
+        self.file_model = FileListModel(self)
+        self.file_list_table = QTableView()
+        self.file_list_table.setModel(self.file_model)
         self.file_list_table.setGridStyle(Qt.SolidLine)
+        self.file_list_table.setWordWrap(False)
         self.file_list_table.verticalHeader().setVisible(False)
+        self.file_list_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.file_list_table.verticalHeader().setDefaultSectionSize(28)
-        self.file_list_table.setColumnCount(6)
-        self.file_list_table.setHorizontalHeaderLabels([
-            lang_manager.get_text("table_header_name"),
-            lang_manager.get_text("table_header_original_size"),
-            lang_manager.get_text("table_header_compressed_size"),
-            lang_manager.get_text("table_header_type"),
-            lang_manager.get_text("table_header_modified_date"),
-            lang_manager.get_text("table_header_compression_ratio")
-        ])
-        self.file_list_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.file_list_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.file_list_table.setSelectionMode(QTableWidget.ExtendedSelection)
+        self.file_list_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.file_list_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.file_list_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.file_list_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.file_list_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.file_list_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
@@ -1553,10 +5135,7 @@ class LinTARDummyApp(QMainWindow):
     
     def select_items(self):
         """Dosya/klasör seçme dialogu"""
-        items = []
-        for row in range(self.file_list_table.rowCount()):
-            item_name = self.file_list_table.item(row, 0).text()
-            items.append(item_name)
+        items = [entry.name for entry in self.file_model.rows]
         
         if not items:
             QMessageBox.information(self, "Seç", "Seçilecek öğe bulunamadı.")
@@ -1580,20 +5159,43 @@ class LinTARDummyApp(QMainWindow):
         
         if dialog.exec_() == QDialog.Accepted:
             self.file_list_table.clearSelection()
+            selection_mode = self.file_list_table.selectionMode()
+            self.file_list_table.setSelectionMode(QAbstractItemView.MultiSelection)
             for item in list_widget.selectedItems():
-                item_name = item.text()
-                for row in range(self.file_list_table.rowCount()):
-                    if self.file_list_table.item(row, 0).text() == item_name:
-                        self.file_list_table.selectRow(row)
+                row = self.file_model.find_row(item.text())
+                if row >= 0:
+                    self.file_list_table.selectRow(row)
+            self.file_list_table.setSelectionMode(selection_mode)
     
     def select_all_items(self):
         """Tüm öğeleri seç"""
         self.file_list_table.selectAll()
+
+    def selected_rows(self):
+        """Seçili satır numaralarını sıralı olarak döndürür"""
+        return sorted(index.row() for index in self.file_list_table.selectionModel().selectedRows())
+
+    def selected_names(self):
+        return [self.file_model.row_at(row).name for row in self.selected_rows()]
+    
+    def selected_archive_members(self):
+        """Arşivde seçili satırları tam üye adlarına çevirir; klasörler içerikleriyle gelir"""
+        names = self.selected_names()
+        if self.archive_index is None:
+            return names
+        return self.archive_index.resolve(self.current_archive_path, names)
+    
+    def archive_member_path(self, name):
+        """Geçerli arşiv klasöründeki bir adın arşivdeki özgün üye adı"""
+        path = f"{self.current_archive_path}/{name}" if self.current_archive_path else name
+        if self.archive_index is None:
+            return path
+        return self.archive_index.members.get(path, path)
     
     def rename_item(self):
         """Seçili dosya/klasörü yeniden adlandır"""
-        selected_items = self.file_list_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.selected_rows()
+        if not selected_rows:
             QMessageBox.warning(self, "Yeniden Adlandır", "Lütfen yeniden adlandırılacak öğeyi seçin.")
             return
         
@@ -1601,8 +5203,7 @@ class LinTARDummyApp(QMainWindow):
             QMessageBox.warning(self, "Yeniden Adlandır", "Arşiv içindeki öğeler yeniden adlandırılamaz.")
             return
         
-        row = selected_items[0].row()
-        old_name = self.file_list_table.item(row, 0).text()
+        old_name = self.file_model.row_at(selected_rows[0]).name
         current_dir = self.address_bar.text()
         old_path = os.path.join(current_dir, old_name)
         
@@ -1646,55 +5247,66 @@ class LinTARDummyApp(QMainWindow):
             QMessageBox.information(self, tr('save_title'), tr('save_not_in_archive'))
             return
         
-        selected_items = self.file_list_table.selectedItems()
-        if not selected_items:
+        filenames = self.selected_archive_members()
+        if not filenames:
             QMessageBox.warning(self, tr('save_title'), tr('save_prompt'))
             return
         
         # Varsayılan çıkartma yolunu kullan
         extract_to = get_config_value('general', 'extract_path', os.path.expanduser('~'))
         
-        selected_rows = set(item.row() for item in selected_items)
-        filenames = [self.file_list_table.item(row, 0).text() for row in selected_rows]
-        
-        progress = QProgressDialog(tr('extracting_file', file_name=f"{len(filenames)} {tr('file')}"), tr('cancel'), 0, 0, self)
-        progress.setWindowTitle(tr('save_title'))
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.show()
+        archive_path = self.current_archive
         
         def extract_files():
-            try:
-                lower_path = self.current_archive.lower()
-                
-                if lower_path.endswith('.zip'):
-                    with zipfile.ZipFile(self.current_archive, 'r') as zf:
-                        for filename in filenames:
-                            zf.extract(filename, extract_to)
-                
-                elif lower_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')):
-                    with tarfile.open(self.current_archive, 'r:*') as tf:
-                        for filename in filenames:
-                            member = tf.getmember(filename)
-                            tf.extract(member, extract_to)
-                
-                elif lower_path.endswith(('.7z', '.rar')):
-                    if check_command_exists('7z'):
-                        cmd = ['7z', 'e', self.current_archive, f'-o{extract_to}'] + filenames
-                        subprocess.run(cmd, capture_output=True, text=True)
-                
-            except Exception as e:
-                QMessageBox.critical(self, tr('error'), tr('save_error', error=str(e)))
+            extract_archive_members(archive_path, filenames, extract_to)
+        
+        def on_finished(result, error):
+            if isinstance(error, JobCancelled):
+                return
+            if error is not None:
+                QMessageBox.critical(self, tr('error'), tr('save_error', error=str(error)))
+            else:
+                self.show_job_message(tr('save_success', count=len(filenames), path=extract_to))
+        
+        job_manager.submit(extract_files, on_finished,
+                           title=tr('extracting_file', file_name=os.path.basename(archive_path)))
+    
+    def add_to_archive(self, folder=False):
+        """Açık arşive dosya veya klasör ekler; değişmemiş dosyalar yeniden yazılmaz"""
+        if not self.current_archive:
+            QMessageBox.information(self, tr('update_title'), tr('save_not_in_archive'))
+            return
         
-        thread = Thread(target=extract_files)
-        thread.start()
+        start_dir = os.path.dirname(self.current_archive)
+        if folder:
+            selected_folder = QFileDialog.getExistingDirectory(self, tr('add_folder_to_archive'), start_dir)
+            sources = [selected_folder] if selected_folder else []
+        else:
+            sources, _ = QFileDialog.getOpenFileNames(self, tr('add_files_to_archive'), start_dir)
+        if not sources:
+            return
         
-        while thread.is_alive():
-            QApplication.processEvents()
-            thread.join(0.1)
+        archive_path = self.current_archive
+        archive_name = os.path.basename(archive_path)
+        log_command(f"{tr('update_title')}: {archive_name}", "\n".join(sources))
+        
+        def on_finished(result, error):
+            if isinstance(error, JobCancelled):
+                return
+            if error is not None:
+                QMessageBox.critical(self, tr('error'), tr('update_error', archive_name=archive_name, error=str(error)))
+                return
+            if result == 0:
+                self.show_job_message(tr('update_up_to_date', archive_name=archive_name))
+            elif result is None:
+                self.show_job_message(tr('update_success', archive_name=archive_name))
+            else:
+                self.show_job_message(tr('update_success_count', archive_name=archive_name, count=result))
+            if result != 0 and self.current_archive == archive_path:
+                self.enter_archive(archive_path)
         
-        progress.close()
-        QMessageBox.information(self, tr('success'), tr('save_success', count=len(filenames), path=extract_to))
+        job_manager.submit(lambda: update_archive(archive_path, sources), on_finished,
+                           title=f"{tr('update_title')}: {archive_name}")
     
     def save_as_files(self):
         """Seçili dosyaları farklı konuma kaydet"""
@@ -1702,8 +5314,8 @@ class LinTARDummyApp(QMainWindow):
             QMessageBox.information(self, tr('save_as_title'), tr('save_as_not_in_archive'))
             return
         
-        selected_items = self.file_list_table.selectedItems()
-        if not selected_items:
+        filenames = self.selected_archive_members()
+        if not filenames:
             QMessageBox.warning(self, tr('save_as_title'), tr('save_as_prompt'))
             return
         
@@ -1711,47 +5323,21 @@ class LinTARDummyApp(QMainWindow):
         if not extract_to:
             return
         
-        selected_rows = set(item.row() for item in selected_items)
-        filenames = [self.file_list_table.item(row, 0).text() for row in selected_rows]
-        
-        progress = QProgressDialog(tr('extracting_file', file_name=f"{len(filenames)} {tr('file')}"), tr('cancel'), 0, 0, self)
-        progress.setWindowTitle(tr('save_as_title'))
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.show()
+        archive_path = self.current_archive
         
         def extract_files():
-            try:
-                lower_path = self.current_archive.lower()
-                
-                if lower_path.endswith('.zip'):
-                    with zipfile.ZipFile(self.current_archive, 'r') as zf:
-                        for filename in filenames:
-                            zf.extract(filename, extract_to)
-                
-                elif lower_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')):
-                    with tarfile.open(self.current_archive, 'r:*') as tf:
-                        for filename in filenames:
-                            member = tf.getmember(filename)
-                            tf.extract(member, extract_to)
-                
-                elif lower_path.endswith(('.7z', '.rar')):
-                    if check_command_exists('7z'):
-                        cmd = ['7z', 'e', self.current_archive, f'-o{extract_to}'] + filenames
-                        subprocess.run(cmd, capture_output=True, text=True)
-                
-            except Exception as e:
-                QMessageBox.critical(self, tr('error'), tr('save_error', error=str(e)))
+            extract_archive_members(archive_path, filenames, extract_to)
         
-        thread = Thread(target=extract_files)
-        thread.start()
-        
-        while thread.is_alive():
-            QApplication.processEvents()
-            thread.join(0.1)
+        def on_finished(result, error):
+            if isinstance(error, JobCancelled):
+                return
+            if error is not None:
+                QMessageBox.critical(self, tr('error'), tr('save_error', error=str(error)))
+            else:
+                self.show_job_message(tr('save_success', count=len(filenames), path=extract_to))
         
-        progress.close()
-        QMessageBox.information(self, tr('success'), tr('save_success', count=len(filenames), path=extract_to))
+        job_manager.submit(extract_files, on_finished,
+                           title=tr('extracting_file', file_name=os.path.basename(archive_path)))
     
     def show_help_topics(self):
         """Yardım konularını göster"""
@@ -2032,12 +5618,36 @@ class LinTARDummyApp(QMainWindow):
                               lang_manager.get_text("message_info_text", source_info=source_info))
 
     def get_archive_original_size(self, archive_path):
+        """Arşiv dosyasının orijinal boyutunu önbellekten veya arşivi okuyarak döndürür"""
+        try:
+            stat_result = os.stat(archive_path)
+        except OSError:
+            return 0
+
+        cached_size = archive_size_cache.get(archive_path, stat_result)
+        if cached_size is not None:
+            return cached_size
+
+        original_size = self.compute_archive_original_size(archive_path)
+
+        # 7z yokken 7Z/RAR için bulunan 0 kalıcı değil, önbelleğe yazma
+        if original_size > 0 or not archive_path.lower().endswith(('.7z', '.rar')) or check_command_exists('7z'):
+            archive_size_cache.put(archive_path, stat_result, original_size)
+        return original_size
+
+    def compute_archive_original_size(self, archive_path):
         """Arşiv dosyasının orijinal (sıkıştırılmamış) boyutunu hesaplar - Windows 7-Zip gibi"""
         try:
             lower_path = archive_path.lower()
             
-            # ZIP dosyaları için - Python zipfile modülü kullan
+            # ZIP dosyaları için - merkezi dizini doğrudan oku
             if lower_path.endswith('.zip'):
+                try:
+                    with ZipCentralDirectory(archive_path) as central_directory:
+                        return central_directory.total_uncompressed()
+                except zipfile.BadZipFile:
+                    pass
+                # Hızlı okuyucunun çözemediği arşivler için zipfile'a dön
                 try:
                     with zipfile.ZipFile(archive_path, 'r') as zf:
                         total_uncompressed = 0
@@ -2053,6 +5663,12 @@ class LinTARDummyApp(QMainWindow):
             
             # TAR dosyaları için - Python tarfile modülü kullan
             elif lower_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')):
+                # Sıkıştırılmış tar için kalıcı dizin, sonraki açılışları da hızlandırır
+                if lower_path.endswith(('.tar.gz', '.tar.bz2', '.tar.xz')):
+                    try:
+                        return TarSeekIndex.open(archive_path).total_uncompressed()
+                    except Exception:
+                        pass
                 try:
                     with tarfile.open(archive_path, 'r:*') as tf:
                         total_uncompressed = 0
@@ -2172,48 +5788,27 @@ class LinTARDummyApp(QMainWindow):
             return "N/A"
 
     def get_file_icon(self, filename, is_dir=False):
-        """Dosya türüne göre sistem ikonu döndürür"""
+        """Dosya türüne göre sistem ikonu döndürür.
+
+        Tema araması (tür, uzantı) başına bir kez yapılır; model ikonları yalnızca
+        görünen satırlar için istediğinden büyük klasörlerde de maliyet sabit kalır.
+        """
         if is_dir:
-            return QIcon.fromTheme("folder", QIcon.fromTheme("folder-open"))
-        
-        ext = os.path.splitext(filename)[1].lower()
-        
-        # Arşiv dosyaları
-        if ext in ['.zip', '.tar', '.gz', '.bz2', '.xz', '.7z', '.rar']:
-            return QIcon.fromTheme("package-x-generic", QIcon.fromTheme("application-x-archive"))
-        # Resim dosyaları
-        elif ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.ico']:
-            return QIcon.fromTheme("image-x-generic", QIcon.fromTheme("image"))
-        # Video dosyaları
-        elif ext in ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm']:
-            return QIcon.fromTheme("video-x-generic", QIcon.fromTheme("video"))
-        # Ses dosyaları
-        elif ext in ['.mp3', '.wav', '.ogg', '.flac', '.aac', '.m4a']:
-            return QIcon.fromTheme("audio-x-generic", QIcon.fromTheme("audio"))
-        # Metin dosyaları
-        elif ext in ['.txt', '.log', '.md', '.rst']:
-            return QIcon.fromTheme("text-x-generic", QIcon.fromTheme("text-plain"))
-        # Kod dosyaları
-        elif ext in ['.py', '.java', '.c', '.cpp', '.h', '.js', '.html', '.css', '.php', '.sh']:
-            return QIcon.fromTheme("text-x-script", QIcon.fromTheme("text-x-generic"))
-        # PDF dosyaları
-        elif ext == '.pdf':
-            return QIcon.fromTheme("application-pdf", QIcon.fromTheme("x-office-document"))
-        # Office dosyaları
-        elif ext in ['.doc', '.docx', '.odt']:
-            return QIcon.fromTheme("x-office-document", QIcon.fromTheme("application-msword"))
-        elif ext in ['.xls', '.xlsx', '.ods']:
-            return QIcon.fromTheme("x-office-spreadsheet", QIcon.fromTheme("application-vnd.ms-excel"))
-        elif ext in ['.ppt', '.pptx', '.odp']:
-            return QIcon.fromTheme("x-office-presentation", QIcon.fromTheme("application-vnd.ms-powerpoint"))
-        # Çalıştırılabilir dosyalar
-        elif ext in ['.exe', '.msi', '.deb', '.rpm', '.appimage']:
-            return QIcon.fromTheme("application-x-executable", QIcon.fromTheme("application-x-executable"))
-        # Varsayılan
+            key = ('dir', '')
         else:
-            return QIcon.fromTheme("text-x-generic", QIcon.fromTheme("unknown"))
-
-    def set_current_path(self, path, add_to_history=True):
+            key = ('file', os.path.splitext(filename)[1].lower())
+        icon = self.icon_cache.get(key)
+        if icon is None:
+            kind = 'folder' if is_dir else FILE_ICON_KINDS.get(key[1], 'default')
+            icon = self.icon_cache.get(('kind', kind))
+            if icon is None:
+                name, fallback = FILE_ICON_THEMES[kind]
+                icon = QIcon.fromTheme(name, QIcon.fromTheme(fallback))
+                self.icon_cache[('kind', kind)] = icon
+            self.icon_cache[key] = icon
+        return icon
+
+    def set_current_path(self, path, add_to_history=True, background=False):
         absolute_path = os.path.abspath(os.path.expanduser(path))
 
         if not os.path.exists(absolute_path) or not os.path.isdir(absolute_path):
@@ -2221,8 +5816,10 @@ class LinTARDummyApp(QMainWindow):
                               lang_manager.get_text("message_path_not_found", path=absolute_path))
             return
 
+        # Önceki klasör için bekleyen boyut hesaplarını iptal et
+        self.cancel_pending_sizes()
+
         self.address_bar.setText(absolute_path)
-        self.file_list_table.setRowCount(0)
 
         if add_to_history:
             if self.history_index < len(self.history) - 1:
@@ -2232,68 +5829,83 @@ class LinTARDummyApp(QMainWindow):
 
         self.update_navigation_buttons()
 
+        if background:
+            # Klasör arka planda okunur; sonuç geldiğinde liste hâlâ güncelse gösterilir
+            generation = self.listing_generation
+
+            def scan():
+                try:
+                    self.directory_scanned.emit(generation, absolute_path, scan_directory(absolute_path), None)
+                except Exception as e:
+                    self.directory_scanned.emit(generation, absolute_path, None, e)
+            Thread(target=scan, daemon=True).start()
+            return
+
         try:
-            items = os.listdir(absolute_path)
-            dirs = sorted([item for item in items if os.path.isdir(os.path.join(absolute_path, item))])
-            files = sorted([item for item in items if os.path.isfile(os.path.join(absolute_path, item))])
-
-            sorted_items = dirs + files
-            self.file_list_table.setRowCount(len(sorted_items))
-
-            row = 0
-            for item_name in sorted_items:
-                item_path = os.path.join(absolute_path, item_name)
-
-                name_item = QTableWidgetItem(item_name)
-                name_item.setIcon(self.get_file_icon(item_name, os.path.isdir(item_path)))
-                self.file_list_table.setItem(row, 0, name_item)
-
-                if os.path.isdir(item_path):
-                    self.file_list_table.setItem(row, 1, QTableWidgetItem(""))
-                    self.file_list_table.setItem(row, 2, QTableWidgetItem(""))
-                    self.file_list_table.setItem(row, 3, QTableWidgetItem(lang_manager.get_text("table_header_type_folder")))
-                    self.file_list_table.setItem(row, 4, QTableWidgetItem(self.get_modified_date(item_path)))
-                    self.file_list_table.setItem(row, 5, QTableWidgetItem("N/A"))
-                else:
-                    # Dosya boyutu (sıkıştırılmış)
-                    compressed_size = os.path.getsize(item_path)
-                    
-                    # Arşiv mi kontrol et
-                    lower_name = item_name.lower()
-                    is_archive = lower_name.endswith(('.zip', '.tar.gz', '.tar.bz2', '.tar.xz', '.tar', '.rar', '.7z'))
-                    
-                    if is_archive:
-                        # Arşiv dosyası için orijinal boyutu hesapla
-                        original_size = self.get_archive_original_size(item_path)
-                        
-                        if original_size > 0:
-                            # Orijinal boyut bulundu
-                            original_size_text = self.format_size(original_size)
-                            compression_ratio = self.calculate_compression_ratio(original_size, compressed_size)
-                        else:
-                            # Orijinal boyut bulunamadı, sıkıştırılmış boyutu göster
-                            original_size_text = self.format_size(compressed_size)
-                            compression_ratio = "N/A"
-                    else:
-                        # Normal dosya
-                        original_size_text = self.format_size(compressed_size)
-                        compression_ratio = "-"
-                    
-                    # Tabloyu doldur
-                    self.file_list_table.setItem(row, 1, QTableWidgetItem(original_size_text))
-                    self.file_list_table.setItem(row, 2, QTableWidgetItem(self.format_size(compressed_size)))
-                    self.file_list_table.setItem(row, 3, QTableWidgetItem(self.get_file_type(item_name)))
-                    self.file_list_table.setItem(row, 4, QTableWidgetItem(self.get_modified_date(item_path)))
-                    self.file_list_table.setItem(row, 5, QTableWidgetItem(compression_ratio))
-                
-                row += 1
+            dirs, files = scan_directory(absolute_path)
+        except Exception as e:
+            self.show_directory_error(absolute_path, e)
+            return
+        self.show_directory_listing(absolute_path, dirs, files)
+
+    @pyqtSlot(int, str, object, object)
+    def on_directory_scanned(self, generation, absolute_path, result, error):
+        if generation == self.listing_generation and not self.current_archive:
+            if error is not None:
+                self.show_directory_error(absolute_path, error)
+            else:
+                self.show_directory_listing(absolute_path, *result)
+        startup_profile.mark('first listing')
+        startup_profile.report()
 
-        except PermissionError:
+    def show_directory_error(self, absolute_path, error):
+        self.file_model.set_rows([])
+        if isinstance(error, PermissionError):
             QMessageBox.warning(self, lang_manager.get_text("message_info_title"), 
                               f"No permission to access directory: '{absolute_path}'")
-        except Exception as e:
+        else:
             QMessageBox.critical(self, lang_manager.get_text("message_info_title"), 
-                              f"Error reading directory: {e}")
+                              f"Error reading directory: {error}")
+
+    def show_directory_listing(self, absolute_path, dirs, files):
+        try:
+            rows = list(dirs)
+            pending_archives = []
+            for file_row, stat_result in files:
+                if file_row.is_archive:
+                    item_path = os.path.join(absolute_path, file_row.name)
+                    cached_size = archive_size_cache.get(item_path, stat_result)
+                    if cached_size is not None:
+                        file_row.size = cached_size
+                    else:
+                        self.pending_size_rows[item_path] = len(rows)
+                        pending_archives.append(item_path)
+                rows.append(file_row)
+
+            self.file_model.set_rows(rows)
+
+            # İkinci geçiş: arşiv boyutlarını arka planda doldur
+            if pending_archives:
+                self.size_loader.start(self.listing_generation, pending_archives)
+
+        except Exception as e:
+            self.show_directory_error(absolute_path, e)
+
+    def cancel_pending_sizes(self):
+        """Eski listeye ait arka plan boyut hesaplarını geçersiz kılar"""
+        self.listing_generation += 1
+        self.size_loader.cancel()
+        self.pending_size_rows = {}
+
+    @pyqtSlot(int, str, object)
+    def on_archive_size_ready(self, generation, archive_path, original_size):
+        if generation != self.listing_generation or archive_path not in self.pending_size_rows:
+            return
+        row = self.pending_size_rows.pop(archive_path)
+        self.file_model.row_at(row).size = original_size
+        self.file_model.refresh_row(row)
+        if not self.pending_size_rows:
+            archive_size_cache.save()
 
     def format_size(self, size_bytes):
         if size_bytes < 1024:
@@ -2308,15 +5920,19 @@ class LinTARDummyApp(QMainWindow):
     def get_modified_date(self, path):
         try:
             timestamp = os.path.getmtime(path)
-            return datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+            return self.format_timestamp(timestamp)
         except Exception as e:
             return ""
 
-    def get_file_type(self, filename):
-        current_dir = self.address_bar.text()
-        full_path = os.path.join(current_dir, filename)
+    def format_timestamp(self, timestamp):
+        return datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+    def get_file_type(self, filename, is_dir=None):
+        if is_dir is None:
+            current_dir = self.address_bar.text()
+            is_dir = os.path.isdir(os.path.join(current_dir, filename))
 
-        if os.path.isdir(full_path):
+        if is_dir:
             return lang_manager.get_text("table_header_type_folder")
 
         name, ext = os.path.splitext(filename)
@@ -2333,16 +5949,16 @@ class LinTARDummyApp(QMainWindow):
         terminal_dialog.exec_()
 
     def on_item_double_clicked(self, index):
-        item_name = self.file_list_table.item(index.row(), 0).text()
-        item_type = self.file_list_table.item(index.row(), 3).text()
+        entry = self.file_model.row_at(index.row())
+        item_name = entry.name
         current_dir = self.address_bar.text()
         
         if self.current_archive:
             # Arşiv içindeyiz
-            if item_type == 'Klasör':
+            if entry.is_dir:
                 self.navigate_into_archive_folder(item_name)
             else:
-                self.extract_file_from_archive(item_name)
+                self.extract_file_from_archive(self.archive_member_path(item_name))
         else:
             new_path = os.path.join(current_dir, item_name)
             if os.path.isdir(new_path):
@@ -2366,10 +5982,10 @@ class LinTARDummyApp(QMainWindow):
         settings_dialog.exec_()
 
     def open_compression_dialog(self):
-        selected_items = self.file_list_table.selectedItems()
+        selected_names = self.selected_names()
         
         # Hiçbir dosya seçili değilse uyarı ver
-        if not selected_items:
+        if not selected_names:
             QMessageBox.warning(self, tr('compress'), tr('select_item'))
             return
         
@@ -2377,12 +5993,7 @@ class LinTARDummyApp(QMainWindow):
         current_dir = self.address_bar.text()
         default_archive_name = "new_archive"  # Varsayılan isim
         
-        selected_rows = set()
-        for item in selected_items:
-            selected_rows.add(item.row())
-
-        for row in selected_rows:
-            item_name = self.file_list_table.item(row, 0).text()
+        for item_name in selected_names:
             selected_paths_for_dialog.append(os.path.join(current_dir, item_name))
         
         # Varsayılan arşiv ismini seçili dosyalara göre belirle
@@ -2455,6 +6066,7 @@ class LinTARDummyApp(QMainWindow):
                 self.current_archive = None
                 self.current_archive_path = ''
                 self.archive_contents = []
+                self.archive_index = None
                 self.set_current_path(archive_dir, add_to_history=True)
         else:
             current_path = self.address_bar.text()
@@ -2463,12 +6075,15 @@ class LinTARDummyApp(QMainWindow):
                 self.set_current_path(parent_path, add_to_history=True)
 
     def extract_selected_archive(self):
-        selected_items = self.file_list_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.selected_rows()
+        if not selected_rows:
             QMessageBox.warning(self, tr('extract'), tr('select_archive'))
             return
+        if len(selected_rows) > 1:
+            self.start_archive_batch('extract')
+            return
 
-        selected_file = self.file_list_table.item(selected_items[0].row(), 0).text()
+        selected_file = self.file_model.row_at(selected_rows[0]).name
         current_dir = self.address_bar.text()
         archive_path = os.path.join(current_dir, selected_file)
 
@@ -2483,76 +6098,79 @@ class LinTARDummyApp(QMainWindow):
         if not extract_to:
             return
 
-        # Create progress dialog
-        self.progress_dialog = QProgressDialog(
-            tr('extracting_file', file_name=selected_file),
-            tr('cancel'), 
-            0, 0, self)
-        self.progress_dialog.setWindowTitle(tr('extract'))
-        self.progress_dialog.setWindowModality(Qt.WindowModal)
-        self.progress_dialog.setMinimumDuration(0)
-        self.progress_dialog.canceled.connect(self.cancel_extraction)
-
         log_command(tr('extract_started') + f": {selected_file}", f"{tr('path')}: {extract_to}")
-        
-        # Create worker thread
-        self.extract_worker = ExtractWorker(archive_path, extract_to)
-        self.extract_thread = Thread(target=self.extract_worker.run)
-        
-        # Connect signals
-        self.extract_worker.progress.connect(self.update_progress)
-        self.extract_worker.finished.connect(self.extraction_finished)
-        
-        # Start thread
-        self.extract_thread.start()
-        self.progress_dialog.show()
-
-    @pyqtSlot(int)
-    def update_progress(self, value):
-        if self.progress_dialog:
-            self.progress_dialog.setValue(value)
-
-    @pyqtSlot(bool, str)
-    def extraction_finished(self, success, error_message):
-        if self.progress_dialog:
-            self.progress_dialog.close()
-        
-        if success:
-            archive_name = tr('archive') if not self.extract_worker else os.path.basename(self.extract_worker.archive_path)
-            destination_path = tr('folder') if not self.extract_worker else self.extract_worker.extract_to
-            log_command(tr('extract_success') + f": {archive_name}", tr('success'))
-            QMessageBox.information(self, lang_manager.get_text("extraction_success_title"),
-                                     lang_manager.get_text("extraction_success_text",
-                                                           archive_name=archive_name,
-                                                           destination_path=destination_path))
-        else:
-            archive_name = tr('archive') if not self.extract_worker else os.path.basename(self.extract_worker.archive_path)
-            log_command(tr('extract_error') + f": {archive_name}", f"{tr('error')}: {error_message}")
-            QMessageBox.critical(self, lang_manager.get_text("extraction_error_title"),
-                                 lang_manager.get_text("extraction_error_text",
-                                                       archive_name=archive_name,
-                                                       error_message=error_message))
-        
-        self.cleanup_extraction()
 
-    def cancel_extraction(self):
-        if self.extract_worker:
-            self.extract_worker.stop()
-        if self.extract_thread and self.extract_thread.is_alive():
-            self.extract_thread.join(timeout=1)
-        
-        self.cleanup_extraction()
+        # Her çıkartma kuyrukta ayrı bir iştir; aynı anda birden fazla çalışabilir
+        worker = ExtractWorker(archive_path, extract_to)
 
-    def cleanup_extraction(self):
-        if self.progress_dialog:
-            self.progress_dialog.close()
-            self.progress_dialog = None
-        
-        if self.extract_thread and self.extract_thread.is_alive():
-            self.extract_thread.join(timeout=1)
-        
-        self.extract_thread = None
-        self.extract_worker = None
+        def on_worker_finished(success, error_message):
+            if job.cancelled():
+                log_command(tr('extract_error') + f": {selected_file}", tr('job_state_cancelled'))
+                return
+            if success:
+                log_command(tr('extract_success') + f": {selected_file}", tr('success'))
+                self.show_job_message(lang_manager.get_text("extraction_success_text",
+                                                            archive_name=selected_file,
+                                                            destination_path=extract_to))
+            else:
+                log_command(tr('extract_error') + f": {selected_file}", f"{tr('error')}: {error_message}")
+                QMessageBox.critical(self, lang_manager.get_text("extraction_error_title"),
+                                     lang_manager.get_text("extraction_error_text",
+                                                           archive_name=selected_file,
+                                                           error_message=error_message))
+
+        worker.finished.connect(on_worker_finished)
+        worker.throughput.connect(lambda instant, average: self.statusBar().showMessage(
+            f"{selected_file}: {instant:.1f} MB/s ({tr('job_average_speed', speed=f'{average:.1f} MB/s')})", 2000))
+        job = job_manager.submit(worker.run, title=tr('extracting_file', file_name=selected_file))
+        job.cancel_callbacks.append(worker.stop)
+
+    def start_archive_batch(self, operation):
+        """Seçili tüm arşivleri tek bir kuyruk işinde toplu çıkartır ya da test eder"""
+        current_dir = self.address_bar.text()
+        archive_paths = []
+        for row in self.selected_rows():
+            entry = self.file_model.row_at(row)
+            archive_path = os.path.join(current_dir, entry.name)
+            if not entry.is_dir and os.path.isfile(archive_path):
+                archive_paths.append(archive_path)
+        if not archive_paths:
+            QMessageBox.warning(self, tr('extract' if operation == 'extract' else 'test'), tr('select_archive'))
+            return
+
+        extract_to = None
+        if operation == 'extract':
+            extract_to = QFileDialog.getExistingDirectory(self,
+                                                          lang_manager.get_text("select_extract_destination"),
+                                                          current_dir)
+            if not extract_to:
+                return
+
+        title = tr('batch_extracting' if operation == 'extract' else 'batch_testing', count=len(archive_paths))
+        log_command(title, f"{tr('path')}: {extract_to}" if extract_to else "")
+
+        def on_finished(entries, error):
+            if isinstance(error, JobCancelled):
+                log_command(title, tr('job_state_cancelled'))
+                return
+            if error is not None:
+                log_command(title, f"{tr('error')}: {error}")
+                QMessageBox.critical(self, tr('error'), str(error))
+                return
+            summary, details = archive_batch_summary(entries, job.elapsed())
+            log_command(title, summary)
+            failed = any(entry.job.state != Job.DONE for entry in entries)
+            box = QMessageBox(QMessageBox.Warning if failed else QMessageBox.Information,
+                              tr('batch_title'), summary, QMessageBox.Ok, self)
+            box.setDetailedText(details)
+            box.exec_()
+
+        job = job_manager.submit(lambda: run_archive_batch(archive_paths, operation, extract_to),
+                                 on_finished, title=title)
+
+    def show_job_message(self, text):
+        """Biten işin sonucunu iletişim kutusu açmadan durum çubuğunda gösterir"""
+        self.statusBar().showMessage(text, 10000)
 
     def on_address_bar_return_pressed(self):
         new_path = self.address_bar.text()
@@ -2560,12 +6178,15 @@ class LinTARDummyApp(QMainWindow):
     
     def test_selected_archive(self):
         """Seçili arşivi test eder"""
-        selected_items = self.file_list_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.selected_rows()
+        if not selected_rows:
             QMessageBox.warning(self, tr('test'), tr('select_archive'))
             return
+        if len(selected_rows) > 1:
+            self.start_archive_batch('test')
+            return
         
-        selected_file = self.file_list_table.item(selected_items[0].row(), 0).text()
+        selected_file = self.file_model.row_at(selected_rows[0]).name
         current_dir = self.address_bar.text()
         archive_path = os.path.join(current_dir, selected_file)
         
@@ -2573,81 +6194,37 @@ class LinTARDummyApp(QMainWindow):
             QMessageBox.warning(self, tr('test'), tr('invalid_archive_file'))
             return
         
-        # Progress dialog göster
-        progress = QProgressDialog(tr('extracting_file', file_name=selected_file), tr('cancel'), 0, 0, self)
-        progress.setWindowTitle(tr('test_archive'))
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.show()
-        
         success = False
         error_message = ""
         
         def run_test():
             nonlocal success, error_message
             try:
-                lower_path = archive_path.lower()
-                
-                if lower_path.endswith('.zip'):
-                    with zipfile.ZipFile(archive_path, 'r') as zf:
-                        bad_file = zf.testzip()
-                        success = bad_file is None
-                
-                elif lower_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')):
-                    with tarfile.open(archive_path, 'r:*') as tf:
-                        tf.getmembers()
-                        success = True
-                
-                elif lower_path.endswith('.7z'):
-                    if check_command_exists('7z'):
-                        result = subprocess.run(['7z', 't', archive_path], 
-                                              capture_output=True, text=True)
-                        success = result.returncode == 0
-                        if not success:
-                            error_message = result.stderr or "Bilinmeyen hata"
-                    else:
-                        error_message = tr('external_tool_not_found', tool_name='7z')
-                
-                elif lower_path.endswith('.rar'):
-                    if check_command_exists('rar'):
-                        result = subprocess.run(['rar', 't', archive_path], 
-                                              capture_output=True, text=True)
-                        success = result.returncode == 0
-                        if not success:
-                            error_message = result.stderr or tr('error')
-                    else:
-                        error_message = tr('external_tool_not_found', tool_name='rar')
-                
-                else:
-                    error_message = tr('unknown_format', format=os.path.splitext(archive_path)[1])
-                    
+                test_archive(archive_path)
+                success = True
+            except JobCancelled:
+                raise
             except Exception as e:
                 error_message = str(e)
         
-        # Thread'i başlat
-        thread = Thread(target=run_test)
-        thread.start()
-        
-        # Thread'in bitmesini bekle
-        while thread.is_alive():
-            QApplication.processEvents()
-            thread.join(0.1)
-        
-        progress.close()
+        def on_finished(result, error):
+            if isinstance(error, JobCancelled):
+                return
+            if success:
+                self.show_job_message(f"{selected_file}: {tr('test_success')}")
+            else:
+                QMessageBox.warning(self, tr('test_archive'), tr('test_error') + f"\n\n{error_message}")
         
-        if success:
-            QMessageBox.information(self, tr('test_archive'), tr('test_success'))
-        else:
-            QMessageBox.warning(self, tr('test_archive'), tr('test_error') + f"\n\n{error_message}")
+        job_manager.submit(run_test, on_finished, title=f"{tr('test_archive')}: {selected_file}")
     
     def repair_selected_archive(self):
         """Seçili arşivi onarır"""
-        selected_items = self.file_list_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.selected_rows()
+        if not selected_rows:
             QMessageBox.warning(self, tr('repair'), tr('select_archive'))
             return
         
-        selected_file = self.file_list_table.item(selected_items[0].row(), 0).text()
+        selected_file = self.file_model.row_at(selected_rows[0]).name
         current_dir = self.address_bar.text()
         archive_path = os.path.join(current_dir, selected_file)
         
@@ -2662,13 +6239,6 @@ class LinTARDummyApp(QMainWindow):
             QMessageBox.information(self, tr('repair'), tr('repair_not_supported'))
             return
         
-        # Progress dialog göster
-        progress = QProgressDialog(tr('extracting_file', file_name=selected_file), tr('cancel'), 0, 0, self)
-        progress.setWindowTitle(tr('repair_archive'))
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.show()
-        
         success = False
         error_message = ""
         
@@ -2701,22 +6271,16 @@ class LinTARDummyApp(QMainWindow):
             except Exception as e:
                 error_message = str(e)
         
-        # Thread'i başlat
-        thread = Thread(target=run_repair)
-        thread.start()
-        
-        # Thread'in bitmesini bekle
-        while thread.is_alive():
-            QApplication.processEvents()
-            thread.join(0.1)
-        
-        progress.close()
+        def on_finished(result, error):
+            if isinstance(error, JobCancelled):
+                return
+            if success:
+                self.show_job_message(f"{selected_file}: {tr('repair_success')}")
+                self.set_current_path(current_dir, add_to_history=False)
+            else:
+                QMessageBox.warning(self, tr('repair_archive'), tr('repair_error') + f"\n\n{error_message}")
         
-        if success:
-            QMessageBox.information(self, tr('repair_archive'), tr('repair_success'))
-            self.set_current_path(current_dir, add_to_history=False)
-        else:
-            QMessageBox.warning(self, tr('repair_archive'), tr('repair_error') + f"\n\n{error_message}")
+        job_manager.submit(run_repair, on_finished, title=f"{tr('repair_archive')}: {selected_file}")
     
     def search_in_archive(self):
         """Görüntülenen dizinde arama yapar"""
@@ -2731,13 +6295,15 @@ class LinTARDummyApp(QMainWindow):
         search_lower = search_term.lower()
         
         # Tablodaki her satırı kontrol et
-        for row in range(self.file_list_table.rowCount()):
-            item_name = self.file_list_table.item(row, 0).text()
-            
-            if search_lower in item_name.lower():
+        from PyQt5.QtCore import QItemSelection, QItemSelectionModel
+        selection = QItemSelection()
+        last_column = self.file_model.columnCount() - 1
+        for row, entry in enumerate(self.file_model.rows):
+            if search_lower in entry.name.lower():
                 # Bulunan satırı seç
-                self.file_list_table.selectRow(row)
+                selection.select(self.file_model.index(row, 0), self.file_model.index(row, last_column))
                 found_count += 1
+        self.file_list_table.selectionModel().select(selection, QItemSelectionModel.Select)
         
         if found_count > 0:
             QMessageBox.information(self, tr('search_title'), tr('search_results', count=found_count, term=search_term))
@@ -2746,18 +6312,11 @@ class LinTARDummyApp(QMainWindow):
     
     def delete_selected_files(self):
         """Seçili dosyaları siler (dosya sisteminden veya arşivden)"""
-        selected_items = self.file_list_table.selectedItems()
-        if not selected_items:
+        file_names = self.selected_names()
+        if not file_names:
             QMessageBox.warning(self, tr('delete_title'), tr('select_item'))
             return
         
-        selected_rows = set(item.row() for item in selected_items)
-        file_names = []
-        
-        for row in selected_rows:
-            file_name = self.file_list_table.item(row, 0).text()
-            file_names.append(file_name)
-        
         reply = QMessageBox.question(self, tr('delete_confirm'), 
                                    tr('delete_prompt', count=len(file_names)) + "\n\n" + 
                                    "\n".join(file_names[:5]) + 
@@ -2770,8 +6329,8 @@ class LinTARDummyApp(QMainWindow):
         log_command(tr('delete') + f": {len(file_names)}", f"{tr('file')}: {', '.join(file_names[:3])}..." if len(file_names) > 3 else f"{tr('file')}: {', '.join(file_names)}")
         
         if self.current_archive:
-            # Arşiv içindeyiz - arşivden sil
-            self.delete_from_archive(file_names)
+            # Arşiv içindeyiz - klasörler içerikleriyle birlikte arşivden silinir
+            self.delete_from_archive(self.selected_archive_members())
         else:
             # Normal dosya sistemindeyiz
             current_dir = self.address_bar.text()
@@ -2799,72 +6358,32 @@ class LinTARDummyApp(QMainWindow):
         if not self.current_archive:
             return
         
-        progress = QProgressDialog(tr('extracting_file', file_name=f"{len(file_names)} {tr('file')}"), tr('cancel'), 0, 0, self)
-        progress.setWindowTitle(tr('delete_title'))
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.show()
-        
+        archive_path = self.current_archive
         success = False
         error_message = ""
         
         def run_delete():
             nonlocal success, error_message
             try:
-                lower_path = self.current_archive.lower()
-                
-                if lower_path.endswith('.zip'):
-                    # ZIP için: yeni arşiv oluştur, silinmeyecekleri kopyala
-                    temp_archive = self.current_archive + '.tmp'
-                    with zipfile.ZipFile(self.current_archive, 'r') as zf_old:
-                        with zipfile.ZipFile(temp_archive, 'w', zipfile.ZIP_DEFLATED) as zf_new:
-                            for item in zf_old.infolist():
-                                if item.filename not in file_names:
-                                    zf_new.writestr(item, zf_old.read(item.filename))
-                    os.replace(temp_archive, self.current_archive)
-                    success = True
-                
-                elif lower_path.endswith('.7z'):
-                    if check_command_exists('7z'):
-                        cmd = ['7z', 'd', self.current_archive] + file_names
-                        result = subprocess.run(cmd, capture_output=True, text=True)
-                        success = result.returncode == 0
-                        if not success:
-                            error_message = result.stderr or "Bilinmeyen hata"
-                    else:
-                        error_message = tr('external_tool_not_found', tool_name='7z')
-                
-                elif lower_path.endswith('.rar'):
-                    if check_command_exists('rar'):
-                        cmd = ['rar', 'd', self.current_archive] + file_names
-                        result = subprocess.run(cmd, capture_output=True, text=True)
-                        success = result.returncode == 0
-                        if not success:
-                            error_message = result.stderr or tr('error')
-                    else:
-                        error_message = tr('external_tool_not_found', tool_name='rar')
-                
-                else:
-                    error_message = tr('unknown_format', format=os.path.splitext(self.current_archive)[1])
-                    
+                delete_archive_members(archive_path, file_names)
+                success = True
+            except JobCancelled:
+                raise
             except Exception as e:
                 error_message = str(e)
         
-        thread = Thread(target=run_delete)
-        thread.start()
-        
-        while thread.is_alive():
-            QApplication.processEvents()
-            thread.join(0.1)
-        
-        progress.close()
+        def on_finished(result, error):
+            if isinstance(error, JobCancelled):
+                return
+            if success:
+                self.show_job_message(f"{len(file_names)} {tr('items_deleted')}.")
+                # Arşivi yeniden aç (kullanıcı hâlâ aynı arşivdeyse)
+                if self.current_archive == archive_path:
+                    self.enter_archive(archive_path)
+            else:
+                QMessageBox.critical(self, tr('error'), f"{tr('delete')} {tr('error')}:\n{error_message}")
         
-        if success:
-            QMessageBox.information(self, tr('success'), f"{len(file_names)} {tr('items_deleted')}.")
-            # Arşivi yeniden aç
-            self.enter_archive(self.current_archive)
-        else:
-            QMessageBox.critical(self, tr('error'), f"{tr('delete')} {tr('error')}:\n{error_message}")
+        job_manager.submit(run_delete, on_finished, title=f"{tr('delete_title')}: {os.path.basename(archive_path)}")
     
     def navigate_into_archive_folder(self, folder_name):
         """Arşiv içinde klasöre girer"""
@@ -2877,332 +6396,44 @@ class LinTARDummyApp(QMainWindow):
         else:
             self.current_archive_path = folder_name
         
-        # Tüm öğeleri yeniden yükle ve filtrele
+        # Klasörün çocuklarını dizinden göster
         self.reload_archive_contents()
     
     def reload_archive_contents(self):
-        """Arşiv içeriğini mevcut yola göre yeniden yükler"""
-        try:
-            all_items = []
-            lower_path = self.current_archive.lower()
-            
-            if lower_path.endswith('.zip'):
-                with zipfile.ZipFile(self.current_archive, 'r') as zf:
-                    for info in zf.infolist():
-                        name = info.filename.rstrip('/')
-                        if name:
-                            all_items.append({
-                                'name': name,
-                                'size': info.file_size,
-                                'compressed_size': info.compress_size,
-                                'date': datetime.datetime(*info.date_time).strftime('%Y-%m-%d %H:%M:%S'),
-                                'type': 'Klasör' if info.filename.endswith('/') or info.is_dir() else 'Dosya'
-                            })
-            
-            elif lower_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')):
-                with tarfile.open(self.current_archive, 'r:*') as tf:
-                    for member in tf.getmembers():
-                        name = member.name.rstrip('/')
-                        if name:
-                            all_items.append({
-                                'name': name,
-                                'size': member.size,
-                                'compressed_size': member.size,
-                                'date': datetime.datetime.fromtimestamp(member.mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                                'type': 'Klasör' if member.isdir() else 'Dosya'
-                            })
-            
-            elif lower_path.endswith('.7z'):
-                if check_command_exists('7z'):
-                    result = subprocess.run(['7z', 'l', '-slt', self.current_archive], 
-                                          capture_output=True, text=True, timeout=30)
-                    if result.returncode == 0:
-                        self.parse_7z_listing(result.stdout, all_items)
-            
-            elif lower_path.endswith('.rar'):
-                if check_command_exists('7z'):
-                    result = subprocess.run(['7z', 'l', '-slt', self.current_archive], 
-                                          capture_output=True, text=True, timeout=30)
-                    if result.returncode == 0:
-                        self.parse_7z_listing(result.stdout, all_items)
-                elif check_command_exists('unrar'):
-                    result = subprocess.run(['unrar', 'l', self.current_archive], 
-                                          capture_output=True, text=True, timeout=30)
-                    if result.returncode == 0:
-                        self.parse_unrar_listing(result.stdout, all_items)
-                elif check_command_exists('rar'):
-                    result = subprocess.run(['rar', 'l', self.current_archive], 
-                                          capture_output=True, text=True, timeout=30)
-                    if result.returncode == 0:
-                        self.parse_unrar_listing(result.stdout, all_items)
-            
-            # Mevcut yoldaki öğeleri filtrele
-            prefix = self.current_archive_path + '/' if self.current_archive_path else ''
-            current_level_items = {}
-            
-            for item in all_items:
-                name = item['name']
-                
-                if prefix:
-                    if name.startswith(prefix):
-                        relative_name = name[len(prefix):]
-                        if '/' in relative_name:
-                            folder_name = relative_name.split('/')[0]
-                            if folder_name not in current_level_items:
-                                current_level_items[folder_name] = {
-                                    'name': folder_name,
-                                    'size': 0,
-                                    'compressed_size': 0,
-                                    'date': item.get('date', ''),
-                                    'type': 'Klasör'
-                                }
-                        elif relative_name:
-                            item['name'] = relative_name
-                            current_level_items[relative_name] = item
-                else:
-                    if '/' in name:
-                        root_name = name.split('/')[0]
-                        if root_name not in current_level_items:
-                            current_level_items[root_name] = {
-                                'name': root_name,
-                                'size': 0,
-                                'compressed_size': 0,
-                                'date': item.get('date', ''),
-                                'type': 'Klasör'
-                            }
-                    else:
-                        current_level_items[name] = item
-            
-            self.archive_contents = list(current_level_items.values())
-            path_display = f"[ARŞİV] {os.path.basename(self.current_archive)}"
-            if self.current_archive_path:
-                path_display += f" / {self.current_archive_path}"
-            self.address_bar.setText(path_display)
-            self.display_archive_contents()
-            self.update_navigation_buttons()
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Hata", f"Arşiv içeriği yüklenemedi: {str(e)}")
+        """Mevcut arşiv yolundaki öğeleri bellekteki dizinden gösterir (disk erişimi yok)"""
+        if self.archive_index is None or not self.archive_index.has_dir(self.current_archive_path):
+            self.current_archive_path = ''
+        self.archive_contents = self.archive_index.list_dir(self.current_archive_path) if self.archive_index else []
+        path_display = f"[ARŞİV] {os.path.basename(self.current_archive)}"
+        if self.current_archive_path:
+            path_display += f" / {self.current_archive_path}"
+        self.address_bar.setText(path_display)
+        self.display_archive_contents()
+        self.update_navigation_buttons()
     
     def enter_archive(self, archive_path):
-        """Arşiv içine girer"""
+        """Arşiv içine girer; içerik bir kez okunup klasör dizini kurulur"""
         try:
-            all_items = []
-            lower_path = archive_path.lower()
-            
-            if lower_path.endswith('.zip'):
-                with zipfile.ZipFile(archive_path, 'r') as zf:
-                    for info in zf.infolist():
-                        name = info.filename.rstrip('/')
-                        if name:
-                            all_items.append({
-                                'name': name,
-                                'size': info.file_size,
-                                'compressed_size': info.compress_size,
-                                'date': datetime.datetime(*info.date_time).strftime('%Y-%m-%d %H:%M:%S'),
-                                'type': 'Klasör' if info.filename.endswith('/') or info.is_dir() else 'Dosya'
-                            })
-            
-            elif lower_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')):
-                with tarfile.open(archive_path, 'r:*') as tf:
-                    for member in tf.getmembers():
-                        name = member.name.rstrip('/')
-                        if name:
-                            all_items.append({
-                                'name': name,
-                                'size': member.size,
-                                'compressed_size': member.size,
-                                'date': datetime.datetime.fromtimestamp(member.mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                                'type': 'Klasör' if member.isdir() else 'Dosya'
-                            })
-            
-            elif lower_path.endswith('.7z'):
-                if check_command_exists('7z'):
-                    result = subprocess.run(['7z', 'l', '-slt', archive_path], 
-                                          capture_output=True, text=True, timeout=30)
-                    if result.returncode == 0:
-                        self.parse_7z_listing(result.stdout, all_items)
-            
-            elif lower_path.endswith('.rar'):
-                if check_command_exists('7z'):
-                    result = subprocess.run(['7z', 'l', '-slt', archive_path], 
-                                          capture_output=True, text=True, timeout=30)
-                    if result.returncode == 0:
-                        self.parse_7z_listing(result.stdout, all_items)
-                elif check_command_exists('unrar'):
-                    result = subprocess.run(['unrar', 'l', archive_path], 
-                                          capture_output=True, text=True, timeout=30)
-                    if result.returncode == 0:
-                        self.parse_unrar_listing(result.stdout, all_items)
-                elif check_command_exists('rar'):
-                    result = subprocess.run(['rar', 'l', archive_path], 
-                                          capture_output=True, text=True, timeout=30)
-                    if result.returncode == 0:
-                        self.parse_unrar_listing(result.stdout, all_items)
+            # Çökme nedeniyle yarım kalmış bir yerinde düzenleme varsa önce geri alınır
+            rollback_edit_journal(archive_path)
+            all_items = read_archive_listing(archive_path)
             
             if not all_items:
                 QMessageBox.warning(self, tr('warning'), tr('archive_empty'))
                 return
             
-            # Kök seviyedeki öğeleri topla
-            root_items = {}
-            for item in all_items:
-                name = item['name']
-                if '/' in name:
-                    root_name = name.split('/')[0]
-                    if root_name not in root_items:
-                        root_items[root_name] = {
-                            'name': root_name,
-                            'size': 0,
-                            'compressed_size': 0,
-                            'date': item.get('date', ''),
-                            'type': 'Klasör'
-                        }
-                else:
-                    root_items[name] = item
-            
+            self.cancel_pending_sizes()
             self.current_archive = archive_path
             self.current_archive_path = ''
-            self.archive_contents = list(root_items.values())
-            self.address_bar.setText(f"[ARŞİV] {os.path.basename(archive_path)}")
-            self.display_archive_contents()
-            self.update_navigation_buttons()
+            self.archive_index = ArchiveIndex(all_items)
+            self.reload_archive_contents()
             
         except Exception as e:
             QMessageBox.critical(self, tr('error'), tr('archive_error', error=str(e)))
     
-    def parse_7z_listing(self, output, contents):
-        """7z liste çıktısını parse eder"""
-        current_file = {}
-        for line in output.split('\n'):
-            line = line.strip()
-            if line.startswith('Path = '):
-                if current_file and 'name' in current_file:
-                    if 'type' not in current_file:
-                        current_file['type'] = 'Dosya'
-                    if 'size' not in current_file:
-                        current_file['size'] = 0
-                    if 'compressed_size' not in current_file:
-                        current_file['compressed_size'] = 0
-                    if 'date' not in current_file:
-                        current_file['date'] = ''
-                    contents.append(current_file)
-                current_file = {'name': line.split('=', 1)[1].strip().rstrip('/')}
-            elif line.startswith('Size = '):
-                try:
-                    current_file['size'] = int(line.split('=', 1)[1].strip())
-                except:
-                    current_file['size'] = 0
-            elif line.startswith('Packed Size = '):
-                try:
-                    current_file['compressed_size'] = int(line.split('=', 1)[1].strip())
-                except:
-                    current_file['compressed_size'] = 0
-            elif line.startswith('Modified = '):
-                current_file['date'] = line.split('=', 1)[1].strip()
-            elif line.startswith('Attributes = ') or line.startswith('Attr = '):
-                attrs = line.split('=', 1)[1].strip()
-                current_file['type'] = 'Klasör' if 'D' in attrs else 'Dosya'
-        
-        if current_file and 'name' in current_file:
-            if 'type' not in current_file:
-                current_file['type'] = 'Dosya'
-            if 'size' not in current_file:
-                current_file['size'] = 0
-            if 'compressed_size' not in current_file:
-                current_file['compressed_size'] = 0
-            if 'date' not in current_file:
-                current_file['date'] = ''
-            contents.append(current_file)
-    
-    def parse_unrar_listing(self, output, contents):
-        """unrar/rar liste çıktısını parse eder"""
-        lines = output.split('\n')
-        in_file_list = False
-        
-        for line in lines:
-            if '----------' in line or '--------' in line:
-                in_file_list = not in_file_list
-                continue
-            
-            if not in_file_list or not line.strip():
-                continue
-            
-            # unrar -v formatı: Attributes Size Packed Ratio Date Time Name
-            # Örnek: -rw-r--r-- 11410 11410 100% 01-01-25 12:00 dosya.txt
-            parts = line.split()
-            if len(parts) < 7:
-                continue
-            
-            try:
-                # İlk kısım attributes (örn: -rw-r--r-- veya drwxr-xr-x)
-                attrs = parts[0]
-                
-                # Boyut bilgileri (sayısal değerler)
-                size = 0
-                compressed_size = 0
-                date = ''
-                time = ''
-                name_start_idx = 1
-                
-                # Sayısal değerleri bul
-                for i in range(1, len(parts)):
-                    if parts[i].isdigit():
-                        if size == 0:
-                            size = int(parts[i])
-                        elif compressed_size == 0:
-                            compressed_size = int(parts[i])
-                    elif '%' in parts[i]:
-                        # Ratio atla
-                        continue
-                    elif '-' in parts[i] or '.' in parts[i]:
-                        # Tarih bulundu
-                        date_parts = parts[i].replace('.', '-').split('-')
-                        if len(date_parts) == 3 and all(p.isdigit() for p in date_parts):
-                            date = parts[i]
-                            if i + 1 < len(parts) and ':' in parts[i + 1]:
-                                time = parts[i + 1]
-                                name_start_idx = i + 2
-                            break
-                
-                # Dosya adı tarih/saatten sonra
-                if name_start_idx < len(parts):
-                    filename = ' '.join(parts[name_start_idx:])
-                    
-                    # Klasör kontrolü
-                    is_dir = attrs.startswith('d') or filename.endswith('/')
-                    filename = filename.rstrip('/')
-                    
-                    if filename:
-                        contents.append({
-                            'name': filename,
-                            'size': size,
-                            'compressed_size': compressed_size,
-                            'date': f"{date} {time}",
-                            'type': 'Klasör' if is_dir else 'Dosya'
-                        })
-            except:
-                pass
-    
     def display_archive_contents(self):
         """Arşiv içeriğini görüntüler"""
-        self.file_list_table.setRowCount(len(self.archive_contents))
-        
-        for row, item in enumerate(self.archive_contents):
-            name_item = QTableWidgetItem(item['name'])
-            is_folder = item.get('type') == 'Klasör'
-            name_item.setIcon(self.get_file_icon(item['name'], is_folder))
-            self.file_list_table.setItem(row, 0, name_item)
-            self.file_list_table.setItem(row, 1, QTableWidgetItem(self.format_size(item.get('size', 0))))
-            self.file_list_table.setItem(row, 2, QTableWidgetItem(self.format_size(item.get('compressed_size', 0))))
-            self.file_list_table.setItem(row, 3, QTableWidgetItem(item.get('type', 'Dosya')))
-            self.file_list_table.setItem(row, 4, QTableWidgetItem(item.get('date', '')))
-            
-            if item.get('size', 0) > 0 and item.get('compressed_size', 0) > 0:
-                ratio = self.calculate_compression_ratio(item['size'], item['compressed_size'])
-                self.file_list_table.setItem(row, 5, QTableWidgetItem(ratio))
-            else:
-                self.file_list_table.setItem(row, 5, QTableWidgetItem('N/A'))
+        self.file_model.set_rows(self.archive_contents, archive_mode=True)
     
     def extract_file_from_archive(self, filename):
         """Arşivden dosya çıkartıp varsayılan programla açar (resim, video, pdf, ofis vb.)"""
@@ -3221,17 +6452,15 @@ class LinTARDummyApp(QMainWindow):
                     extracted_path = os.path.join(temp_dir, filename)
             
             elif lower_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')):
-                with tarfile.open(self.current_archive, 'r:*') as tf:
-                    member = tf.getmember(filename)
-                    tf.extract(member, temp_dir)
-                    extracted_path = os.path.join(temp_dir, filename)
+                extract_tar_members(self.current_archive, [filename], temp_dir)
+                extracted_path = os.path.join(temp_dir, filename)
             
             elif lower_path.endswith(('.7z', '.rar')):
                 if check_command_exists('7z'):
-                    result = subprocess.run(['7z', 'e', self.current_archive, f'-o{temp_dir}', filename], 
+                    result = subprocess.run(['7z', 'x', self.current_archive, f'-o{temp_dir}', '-y', '-spd', filename], 
                                  capture_output=True, text=True)
                     if result.returncode == 0:
-                        extracted_path = os.path.join(temp_dir, os.path.basename(filename))
+                        extracted_path = os.path.join(temp_dir, filename)
             
             if extracted_path and os.path.exists(extracted_path):
                 if sys.platform.startswith('linux'):
@@ -3248,8 +6477,7 @@ class LinTARDummyApp(QMainWindow):
     
     def show_context_menu(self, position):
         """Sağ tık menüsünü gösterir"""
-        selected_items = self.file_list_table.selectedItems()
-        if not selected_items:
+        if not self.selected_rows():
             return
         
         menu = QMenu(self)
@@ -3272,72 +6500,39 @@ class LinTARDummyApp(QMainWindow):
     
     def extract_selected_from_archive(self):
         """Seçili dosyaları arşivden çıkartır"""
-        selected_items = self.file_list_table.selectedItems()
-        if not selected_items or not self.current_archive:
+        filenames = self.selected_archive_members()
+        if not filenames or not self.current_archive:
             return
         
-        selected_rows = set(item.row() for item in selected_items)
-        filenames = []
-        
-        for row in selected_rows:
-            filename = self.file_list_table.item(row, 0).text()
-            filenames.append(filename)
-        
         extract_to = QFileDialog.getExistingDirectory(self, "Dosyaları Çıkart", os.path.expanduser("~"))
         if not extract_to:
             return
         
-        # Progress dialog göster
-        progress = QProgressDialog(f"Çıkartılıyor: {len(filenames)} dosya", "İptal", 0, 0, self)
-        progress.setWindowTitle("Çıkartma")
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.show()
+        archive_path = self.current_archive
         
         def extract_files():
-            try:
-                lower_path = self.current_archive.lower()
-                
-                if lower_path.endswith('.zip'):
-                    with zipfile.ZipFile(self.current_archive, 'r') as zf:
-                        for filename in filenames:
-                            zf.extract(filename, extract_to)
-                
-                elif lower_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')):
-                    with tarfile.open(self.current_archive, 'r:*') as tf:
-                        for filename in filenames:
-                            member = tf.getmember(filename)
-                            tf.extract(member, extract_to)
-                
-                elif lower_path.endswith(('.7z', '.rar')):
-                    if check_command_exists('7z'):
-                        cmd = ['7z', 'e', self.current_archive, f'-o{extract_to}'] + filenames
-                        subprocess.run(cmd, capture_output=True, text=True)
-                
-            except Exception as e:
-                QMessageBox.critical(self, "Hata", f"Dosyalar çıkartılamadı: {str(e)}")
-        
-        # Thread'i başlat
-        thread = Thread(target=extract_files)
-        thread.start()
+            extract_archive_members(archive_path, filenames, extract_to)
         
-        # Thread'in bitmesini bekle
-        while thread.is_alive():
-            QApplication.processEvents()
-            thread.join(0.1)
+        def on_finished(result, error):
+            if isinstance(error, JobCancelled):
+                return
+            if error is not None:
+                QMessageBox.critical(self, "Hata", f"Dosyalar çıkartılamadı: {str(error)}")
+            else:
+                self.show_job_message(f"{len(filenames)} dosya çıkartıldı.")
         
-        progress.close()
-        QMessageBox.information(self, "Başarılı", f"{len(filenames)} dosya çıkartıldı.")
+        job_manager.submit(extract_files, on_finished,
+                           title=tr('extracting_file', file_name=os.path.basename(archive_path)))
     
     def show_file_info(self):
         """Seçili dosyanın bilgilerini gösterir"""
-        selected_items = self.file_list_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.selected_rows()
+        if not selected_rows:
             QMessageBox.warning(self, tr('info'), tr('select_item'))
             return
         
-        row = selected_items[0].row()
-        selected_file = self.file_list_table.item(row, 0).text()
+        row = selected_rows[0]
+        selected_file = self.file_model.row_at(row).name
         
         # Arşiv içindeyiz
         if self.current_archive:
@@ -3346,30 +6541,31 @@ class LinTARDummyApp(QMainWindow):
                 item = self.archive_contents[row]
                 
                 info_html = "<html><body style='font-family: Arial, sans-serif;'>"
-                info_html += f"<h2 style='color: #2c3e50; margin-bottom: 15px;'>{'📁' if item.get('type') == 'Klasör' else '📄'} {selected_file}</h2>"
+                info_html += f"<h2 style='color: #2c3e50; margin-bottom: 15px;'>{'📁' if item.is_dir else '📄'} {selected_file}</h2>"
                 info_html += "<table style='width: 100%; border-collapse: collapse;'>"
                 
                 info_html += f"<tr><td style='padding: 8px; background: #ecf0f1; font-weight: bold; width: 40%;'>{tr('type')}:</td>"
-                info_html += f"<td style='padding: 8px;'>{'📁 ' + tr('folder') if item.get('type') == 'Klasör' or item.get('type') == 'Folder' else '📄 ' + tr('file')}</td></tr>"
+                info_html += f"<td style='padding: 8px;'>{'📁 ' + tr('folder') if item.is_dir else '📄 ' + tr('file')}</td></tr>"
                 
                 info_html += f"<tr><td style='padding: 8px; background: #ecf0f1; font-weight: bold;'>{tr('archive')}:</td>"
                 info_html += f"<td style='padding: 8px;'><small>{os.path.basename(self.current_archive)}</small></td></tr>"
                 
-                if item.get('type') not in ['Klasör', 'Folder']:
+                if not item.is_dir:
                     info_html += f"<tr><td style='padding: 8px; background: #ecf0f1; font-weight: bold;'>{tr('original_size')}:</td>"
-                    info_html += f"<td style='padding: 8px; color: #27ae60; font-weight: bold;'>{self.format_size(item.get('size', 0))}</td></tr>"
+                    info_html += f"<td style='padding: 8px; color: #27ae60; font-weight: bold;'>{self.format_size(item.size)}</td></tr>"
                     
                     info_html += f"<tr><td style='padding: 8px; background: #ecf0f1; font-weight: bold;'>{tr('table_header_compressed_size')}:</td>"
-                    info_html += f"<td style='padding: 8px; color: #3498db; font-weight: bold;'>{self.format_size(item.get('compressed_size', 0))}</td></tr>"
+                    info_html += f"<td style='padding: 8px; color: #3498db; font-weight: bold;'>{self.format_size(item.compressed_size)}</td></tr>"
                     
-                    if item.get('size', 0) > 0:
-                        ratio = self.calculate_compression_ratio(item.get('size', 0), item.get('compressed_size', 0))
+                    if item.size > 0:
+                        ratio = self.calculate_compression_ratio(item.size, item.compressed_size)
                         info_html += f"<tr><td style='padding: 8px; background: #ecf0f1; font-weight: bold;'>{tr('compression_ratio')}:</td>"
                         info_html += f"<td style='padding: 8px; color: #e74c3c; font-weight: bold;'>{ratio}</td></tr>"
                 
-                if item.get('date'):
+                if item.date:
+                    date_text = item.date if isinstance(item.date, str) else self.format_timestamp(item.date)
                     info_html += f"<tr><td style='padding: 8px; background: #ecf0f1; font-weight: bold;'>{tr('modified')}:</td>"
-                    info_html += f"<td style='padding: 8px;'>{item.get('date')}</td></tr>"
+                    info_html += f"<td style='padding: 8px;'>{date_text}</td></tr>"
                 
                 info_html += "</table></body></html>"
                 
@@ -3446,8 +6642,156 @@ class LinTARDummyApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, tr('error'), tr('cannot_open') + f": {str(e)}")
 
+# Komut satırı (arayüzsüz) kipi
+CLI_PROGRESS_INTERVAL = THROUGHPUT_INTERVAL
+_cli_output_lock = Lock()
+
+def cli_emit(event, **fields):
+    """Tek satırlık JSON olayı yazar; iş parçacıkları arasında satırlar karışmaz"""
+    line = json.dumps({'event': event, **fields}, ensure_ascii=False)
+    with _cli_output_lock:
+        sys.stdout.write(line + '\n')
+        sys.stdout.flush()
+
+def cli_job_status(job):
+    eta = job.eta()
+    return {
+        'percent': job.progress(),
+        'done_bytes': job.done_bytes,
+        'total_bytes': job.total_bytes,
+        'done_files': job.done_files,
+        'bytes_per_second': round(job.sample_speed()),
+        'average_bytes_per_second': round(job.average_speed()),
+        'files_per_second': round(job.files_per_second(), 1),
+        'elapsed': round(job.elapsed(), 3),
+        'eta': round(eta, 1) if eta is not None else None,
+    }
+
+def cli_run_job(command, archive_path, func, cancel_callback=None):
+    """func'ı arayüzdeki gibi bir iş olarak çalıştırır; ilerlemeyi JSON satırlarıyla bildirir.
+
+    Ctrl+C işi iptal eder. Çıkış kodu: 0 başarı, 1 hata, 130 iptal.
+    """
+    job = Job(func, title=command)
+    if cancel_callback is not None:
+        job.cancel_callbacks.append(cancel_callback)
+    worker = Thread(target=job.run, daemon=True)
+    worker.start()
+    try:
+        while True:
+            worker.join(CLI_PROGRESS_INTERVAL)
+            if not worker.is_alive():
+                break
+            cli_emit('progress', command=command, archive=archive_path, **cli_job_status(job))
+    except KeyboardInterrupt:
+        job.cancel()
+        worker.join()
+    if job.state == Job.DONE:
+        cli_emit('done', command=command, archive=archive_path, **cli_job_status(job))
+        return 0
+    # Ctrl+C harici araçları da durdurur; iptal edilen işin ardından gelen hata iptal sayılır
+    if job.cancelled():
+        cli_emit('cancelled', command=command, archive=archive_path, **cli_job_status(job))
+        return 130
+    cli_emit('error', command=command, archive=archive_path, message=str(job.error), **cli_job_status(job))
+    return 1
+
+def cli_listing_entry(row):
+    date = row.date
+    if isinstance(date, (int, float)):
+        date = datetime.datetime.fromtimestamp(date).strftime('%Y-%m-%d %H:%M:%S')
+    return {'name': row.name, 'is_dir': row.is_dir, 'size': row.size,
+            'compressed_size': row.compressed_size, 'date': date}
+
+def cli_main(argv):
+    """`l.py --cli <komut>`: arayüz açmadan list/extract/create/test/delete çalıştırır"""
+    parser = argparse.ArgumentParser(prog='l.py --cli',
+                                     description='LinTAR archive operations without a display. '
+                                                 'Progress is written to stdout as JSON lines.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = commands.add_parser('list', help='list archive members')
+    list_parser.add_argument('archive')
+
+    extract_parser = commands.add_parser('extract', help='extract the archive or selected members')
+    extract_parser.add_argument('archive')
+    extract_parser.add_argument('members', nargs='*', help='member paths; all members if omitted')
+    extract_parser.add_argument('-o', '--output', default='.', help='destination folder')
+
+    create_parser = commands.add_parser('create', help='create an archive; format follows the extension')
+    create_parser.add_argument('archive')
+    create_parser.add_argument('sources', nargs='+')
+    create_parser.add_argument('--level', choices=COMPRESSION_LEVELS, default='normal')
+    create_parser.add_argument('--password')
+    create_parser.add_argument('--solid', action='store_true')
+    create_parser.add_argument('--volumes', help='split size for 7z/rar, e.g. 100m')
+
+    test_parser = commands.add_parser('test', help='verify archive integrity')
+    test_parser.add_argument('archive')
+
+    delete_parser = commands.add_parser('delete', help='delete members from an archive')
+    delete_parser.add_argument('archive')
+    delete_parser.add_argument('members', nargs='+')
+
+    args = parser.parse_args(argv)
+    archive_path = os.path.abspath(args.archive)
+
+    if args.command == 'create':
+        sources = [os.path.abspath(source) for source in args.sources]
+        for source in sources:
+            if not os.path.exists(source):
+                cli_emit('error', command=args.command, archive=archive_path,
+                         message=tr('source_file_not_found', source_path=source))
+                return 1
+        os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+        existed = os.path.exists(archive_path)
+        status = cli_run_job(args.command, archive_path,
+                             lambda: create_archive(archive_path, sources, args.password, args.level,
+                                                    args.solid, args.volumes))
+        # Yarım kalan yeni arşiv bırakılmaz
+        if status == 130 and not existed and os.path.isfile(archive_path):
+            os.remove(archive_path)
+        return status
+
+    if not os.path.isfile(archive_path):
+        cli_emit('error', command=args.command, archive=archive_path, message=tr('invalid_archive_file'))
+        return 1
+    # Çökme nedeniyle yarım kalmış bir yerinde düzenleme varsa önce geri alınır
+    rollback_edit_journal(archive_path)
+
+    if args.command == 'list':
+        def run_list():
+            for row in read_archive_listing(archive_path):
+                cli_emit('entry', archive=archive_path, **cli_listing_entry(row))
+        return cli_run_job(args.command, archive_path, run_list)
+
+    if args.command == 'extract':
+        extract_to = os.path.abspath(args.output)
+        os.makedirs(extract_to, exist_ok=True)
+        if args.members:
+            return cli_run_job(args.command, archive_path,
+                               lambda: extract_archive_members(archive_path, args.members, extract_to))
+        extractor = ArchiveExtractor(archive_path, extract_to)
+        return cli_run_job(args.command, archive_path, extractor.extract, extractor.stop)
+
+    if args.command == 'test':
+        return cli_run_job(args.command, archive_path, lambda: test_archive(archive_path))
+
+    return cli_run_job(args.command, archive_path, lambda: delete_archive_members(archive_path, args.members))
+
 if __name__ == "__main__":
+    if sys.argv[1:2] == ['--cli']:
+        sys.exit(cli_main(sys.argv[2:]))
+    startup_profile.mark('module setup')
     app = QApplication(sys.argv)
+    startup_profile.mark('qapplication')
+    config_store.watch()
+    app.aboutToQuit.connect(config_store.flush)
+    app.aboutToQuit.connect(archive_size_cache.save)
     window = LinTARDummyApp()
+    app.aboutToQuit.connect(window.size_loader.shutdown)
+    app.aboutToQuit.connect(job_manager.wait)
+    startup_profile.mark('main window')
     window.show()
+    startup_profile.mark('window shown')
     sys.exit(app.exec_())
@@ -0,0 +1,39 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='session')
+def lintar(tmp_path_factory):
+    """l.py'yi modül olarak yükler; ayarlar ve tar dizinleri geçici HOME altına yazılır"""
+    home = tmp_path_factory.mktemp('home')
+    saved = {key: os.environ.get(key) for key in ('HOME', 'QT_QPA_PLATFORM')}
+    os.environ['HOME'] = str(home)
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    spec = importlib.util.spec_from_file_location('lintar', os.path.join(ROOT, 'l.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['lintar'] = module
+    spec.loader.exec_module(module)
+    yield module
+    sys.modules.pop('lintar', None)
+    for key, value in saved.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    """Alt klasörlü, boş ve çok parçalı (1 MB üstü) dosyalar içeren kaynak klasör"""
+    root = tmp_path / 'src'
+    (root / 'sub' / 'deep').mkdir(parents=True)
+    (root / 'empty.txt').write_bytes(b'')
+    (root / 'text.txt').write_text('LinTAR\n' * 1000)
+    (root / 'sub' / 'random.bin').write_bytes(os.urandom(300 * 1024))
+    (root / 'sub' / 'deep' / 'large.bin').write_bytes(os.urandom(1024) * 2500)
+    return root
@@ -0,0 +1,276 @@
+"""Arşiv motorlarının arayüzden bağımsız gidiş-dönüş testleri"""
+import gzip
+import os
+import shutil
+import subprocess
+import tarfile
+import zipfile
+import zlib
+
+import pytest
+
+TAR_FORMATS = ['.tar.gz', '.tar.bz2', '.tar.xz']
+
+
+def tree_files(root):
+    """Klasördeki dosyaları {göreli_yol: içerik} olarak döndürür"""
+    files = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, 'rb') as f:
+                files[os.path.relpath(path, root).replace(os.sep, '/')] = f.read()
+    return files
+
+
+def numbered_files(root, count=10, size=20 * 1024):
+    """Yerinde düzenleme testleri için eşit boyutlu, sıralı dosyalar"""
+    root.mkdir()
+    paths = []
+    for index in range(count):
+        path = root / f'file{index:02d}.bin'
+        path.write_bytes(os.urandom(size))
+        paths.append(path)
+    return paths
+
+
+def flip_byte(path, position):
+    with open(path, 'r+b') as f:
+        f.seek(position)
+        value = f.read(1)[0]
+        f.seek(position)
+        f.write(bytes([value ^ 0xFF]))
+
+
+# Oluştur → listele → sına → çıkart → karşılaştır
+@pytest.mark.parametrize('extension', ['.zip'] + TAR_FORMATS)
+def test_create_list_test_extract_round_trip(lintar, source_tree, tmp_path, extension):
+    archive = str(tmp_path / ('out' + extension))
+    lintar.create_archive(archive, [str(source_tree)])
+    assert not os.path.exists(archive + '.tmp')
+
+    expected = tree_files(source_tree)
+    listed = {row.name for row in lintar.read_archive_listing(archive) if not row.is_dir}
+    assert listed == {'src/' + name for name in expected}
+
+    lintar.test_archive(archive)
+
+    destination = tmp_path / 'extracted'
+    destination.mkdir()
+    lintar.ArchiveExtractor(archive, str(destination), workers=2).extract()
+    assert tree_files(destination / 'src') == expected
+
+
+@pytest.mark.parametrize('extension', ['.zip', '.tar.gz'])
+def test_test_archive_detects_corruption(lintar, source_tree, tmp_path, extension):
+    archive = str(tmp_path / ('out' + extension))
+    lintar.create_archive(archive, [str(source_tree)])
+    flip_byte(archive, os.path.getsize(archive) // 2)
+    with pytest.raises(Exception):
+        lintar.test_archive(archive)
+
+
+def test_extractor_stop_leaves_no_partial_files(lintar, source_tree, tmp_path):
+    archive = str(tmp_path / 'out.tar')
+    with tarfile.open(archive, 'w') as tf:
+        tf.add(str(source_tree), arcname='src')
+    destination = tmp_path / 'extracted'
+    destination.mkdir()
+    extractor = None
+
+    def stop_midway(percent, instant, average):
+        if 0 < percent < 100:
+            extractor.stop()
+
+    extractor = lintar.ArchiveExtractor(archive, str(destination), on_progress=stop_midway)
+    original = lintar.ThroughputMeter.__init__.__defaults__
+    lintar.ThroughputMeter.__init__.__defaults__ = (0, 0)
+    try:
+        extractor.extract()
+    finally:
+        lintar.ThroughputMeter.__init__.__defaults__ = original
+    expected = tree_files(source_tree)
+    for name, data in tree_files(destination / 'src').items():
+        assert data == expected[name]
+    assert len(tree_files(destination / 'src')) < len(expected)
+
+
+# Silme
+@pytest.mark.parametrize('position', ['first', 'last'])
+def test_zip_delete_keeps_archive_valid(lintar, source_tree, tmp_path, position):
+    archive = str(tmp_path / 'out.zip')
+    lintar.create_zip_archive(archive, [str(source_tree)])
+    with zipfile.ZipFile(archive) as zf:
+        names = [name for name in zf.namelist() if not name.endswith('/')]
+    victim = names[0] if position == 'first' else names[-1]
+
+    assert lintar.zip_delete_members(archive, [victim]) == 1
+    assert not os.path.exists(archive + '.tmp')
+    assert not os.path.exists(archive + lintar.EDIT_JOURNAL_SUFFIX)
+    expected = tree_files(source_tree)
+    with zipfile.ZipFile(archive) as zf:
+        assert zf.testzip() is None
+        assert sorted(zf.namelist()) == sorted(name for name in names if name != victim)
+        for name in zf.namelist():
+            assert zf.read(name) == expected[name[len('src/'):]]
+
+
+@pytest.mark.parametrize('extension', ['.tar'] + TAR_FORMATS)
+def test_tar_delete_keeps_archive_valid(lintar, source_tree, tmp_path, extension):
+    archive = str(tmp_path / ('out' + extension))
+    mode = 'w:' + extension.rsplit('.', 1)[1] if extension != '.tar' else 'w'
+    with tarfile.open(archive, mode) as tf:
+        tf.add(str(source_tree), arcname='src')
+
+    assert lintar.tar_delete_members(archive, ['src/sub/random.bin', 'src/text.txt']) == 2
+    if extension == '.tar.gz':
+        if shutil.which('gzip'):
+            subprocess.run(['gzip', '-t', archive], check=True)
+        else:
+            with gzip.open(archive) as f:
+                while f.read(1024 * 1024):
+                    pass
+    lintar.test_archive(archive)
+
+    expected = tree_files(source_tree)
+    with tarfile.open(archive, 'r:*') as tf:
+        files = {member.name: tf.extractfile(member).read() for member in tf if member.isreg()}
+    assert files == {'src/' + name: data for name, data in expected.items()
+                     if name not in ('sub/random.bin', 'text.txt')}
+
+
+# Yerinde düzenleme günlüğü
+def test_in_place_edit_restores_on_error(lintar, tmp_path):
+    path = tmp_path / 'archive.bin'
+    original = os.urandom(64 * 1024)
+    path.write_bytes(original)
+    with pytest.raises(RuntimeError):
+        with lintar.InPlaceEdit(str(path)) as edit:
+            fd = edit.begin(1000, len(original))
+            os.pwrite(fd, b'X' * 5000, 1000)
+            os.ftruncate(fd, 3000)
+            raise RuntimeError('interrupted')
+    assert path.read_bytes() == original
+    assert not os.path.exists(str(path) + lintar.EDIT_JOURNAL_SUFFIX)
+
+
+def test_journal_recovers_interrupted_edit(lintar, tmp_path):
+    path = tmp_path / 'archive.bin'
+    original = os.urandom(64 * 1024)
+    path.write_bytes(original)
+    edit = lintar.InPlaceEdit(str(path))
+    edit.__enter__()
+    fd = edit.begin(1000, len(original))
+    os.pwrite(fd, b'X' * 5000, 1000)
+    os.ftruncate(fd, 3000)
+    # Süreç çökmüş gibi: __exit__ çalışmaz, günlük diskte kalır
+    edit.file.close()
+    edit._release()
+    assert os.path.exists(str(path) + lintar.EDIT_JOURNAL_SUFFIX)
+
+    assert lintar.rollback_edit_journal(str(path)) is True
+    assert path.read_bytes() == original
+    assert not os.path.exists(str(path) + lintar.EDIT_JOURNAL_SUFFIX)
+    assert lintar.rollback_edit_journal(str(path)) is False
+
+
+def _build_numbered_archive(tmp_path, extension):
+    paths = numbered_files(tmp_path / 'numbered')
+    archive = str(tmp_path / ('numbered' + extension))
+    if extension == '.zip':
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_STORED) as zf:
+            for path in paths:
+                zf.write(path, path.name)
+    else:
+        with tarfile.open(archive, 'w') as tf:
+            for path in paths:
+                tf.add(str(path), arcname=path.name)
+    # Sondan üçüncü öğe silinir: yerinde düzenleme yolu seçilir ve iki öğe kaydırılır
+    return archive, paths[-3].name
+
+
+@pytest.mark.parametrize('extension', ['.zip', '.tar'])
+def test_cancelled_in_place_delete_leaves_archive_intact(lintar, tmp_path, monkeypatch, extension):
+    archive, victim = _build_numbered_archive(tmp_path, extension)
+    with open(archive, 'rb') as f:
+        original = f.read()
+    delete = lintar.zip_delete_members if extension == '.zip' else lintar.tar_delete_members
+
+    # Kesintisiz silmede kaç ara nokta olduğu sayılır
+    calls = []
+    real_checkpoint = lintar.job_checkpoint
+    monkeypatch.setattr(lintar, 'job_checkpoint', lambda *args: calls.append(args))
+    scratch = str(tmp_path / ('scratch' + extension))
+    shutil.copyfile(archive, scratch)
+    assert delete(scratch, [victim]) == 1
+    assert len(calls) >= 2
+    monkeypatch.setattr(lintar, 'job_checkpoint', real_checkpoint)
+
+    for stop_at in range(1, len(calls) + 1):
+        counter = iter(range(1, len(calls) + 1))
+
+        def interrupt(*args):
+            if next(counter) == stop_at:
+                raise lintar.JobCancelled()
+
+        monkeypatch.setattr(lintar, 'job_checkpoint', interrupt)
+        with pytest.raises(lintar.JobCancelled):
+            delete(archive, [victim])
+        monkeypatch.setattr(lintar, 'job_checkpoint', real_checkpoint)
+        with open(archive, 'rb') as f:
+            assert f.read() == original, f'archive changed after interruption {stop_at}'
+        assert not os.path.exists(archive + lintar.EDIT_JOURNAL_SUFFIX)
+
+
+# Paralel ZIP yazıcısı
+def test_parallel_zip_writer_matches_zipfile(lintar, source_tree, tmp_path):
+    files = lintar.collect_source_files([str(source_tree)])
+    archive = str(tmp_path / 'parallel.zip')
+    lintar.ParallelZipWriter(archive, workers=3).write(files)
+
+    with zipfile.ZipFile(archive) as zf:
+        assert zf.testzip() is None
+        assert sorted(zf.namelist()) == sorted(arcname.replace(os.sep, '/') for _, arcname in files)
+        for file_path, arcname in files:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            info = zf.getinfo(arcname.replace(os.sep, '/'))
+            assert info.file_size == len(data)
+            assert info.CRC == zlib.crc32(data)
+            assert zf.read(info) == data
+
+
+@pytest.mark.parametrize('first_length, second_length',
+                         [(0, 0), (0, 17), (17, 0), (1, 1), (1000, 3), (5000, 1024 * 1024 + 7)])
+def test_crc32_combine_matches_zlib(lintar, first_length, second_length):
+    first = os.urandom(first_length)
+    second = os.urandom(second_length)
+    combined = lintar.crc32_combine(zlib.crc32(first), zlib.crc32(second), second_length)
+    assert combined == zlib.crc32(first + second)
+
+
+# Sıkıştırılmış tar dizini
+@pytest.mark.parametrize('codec', ['gz', 'bz2', 'xz'])
+@pytest.mark.parametrize('parallel', [False, True])
+def test_tar_seek_index_extracts_members(lintar, source_tree, tmp_path, codec, parallel):
+    archive = str(tmp_path / f'out.tar.{codec}')
+    if parallel:
+        # Çok üyeli / çok bloklu çıktı: dizin her üye sınırını bulmalı
+        level = lintar.TAR_COMPRESSION_LEVELS[codec]
+        output = lintar.ParallelBlockCompressor(archive, codec, 3, level)
+        with tarfile.open(fileobj=output, mode='w|') as tf:
+            tf.add(str(source_tree), arcname='src')
+        output.close()
+    else:
+        with tarfile.open(archive, f'w:{codec}') as tf:
+            tf.add(str(source_tree), arcname='src')
+
+    expected = tree_files(source_tree)
+    index = lintar.TarSeekIndex.open(archive)
+    assert index.total_uncompressed() == sum(len(data) for data in expected.values())
+    assert lintar.TarSeekIndex.load(archive) is not None
+
+    destination = tmp_path / 'extracted'
+    for name in ('sub/deep/large.bin', 'text.txt', 'empty.txt'):
+        index.extract_member('src/' + name, str(destination))
+        assert (destination / 'src' / name).read_bytes() == expected[name]